@@ -0,0 +1,105 @@
+"""
+Benchmark for catalog response serialization.
+
+Compares the previous response path for catalog list endpoints
+(response_model=List[dict] validation + jsonable_encoder + json.dumps on
+every request) with the snapshot path (orjson once per catalog version, raw
+bytes per request).
+
+Part 1 measures the per-request encode cost and runs anywhere. Part 2
+measures requests/sec through FastAPI over ASGI when fastapi and httpx are
+installed.
+
+Run from backend/:  python -m benchmarks.bench_catalog_serialization
+"""
+import asyncio
+import copy
+import json
+import time
+from datetime import datetime, timezone
+
+import orjson
+
+from data.partners import PARTNER_OFFERS
+
+ROUNDS = 200
+REQUESTS = 2000
+
+
+def catalog_payload():
+    """The static offers shaped like Mongo documents (datetimes included)."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    items = copy.deepcopy(PARTNER_OFFERS)
+    for order, item in enumerate(items, start=1):
+        item.update({"is_active": True, "display_order": order, "created_at": now, "updated_at": now})
+    return items
+
+
+def bench(label, fn, rounds=ROUNDS):
+    fn()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<42} {elapsed / rounds * 1000:8.3f} ms/request   {rounds / elapsed:10.0f} encodes/s")
+    return elapsed / rounds
+
+
+def part_one(items):
+    print(f"Part 1: encode {len(items)} partner documents per request\n")
+
+    def stdlib():
+        return json.dumps([{k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in d.items()} for d in items]).encode()
+
+    legacy = bench("stdlib json (per request)", stdlib)
+    fresh = bench("orjson (per request)", lambda: orjson.dumps(items, option=orjson.OPT_NON_STR_KEYS))
+    body = orjson.dumps(items, option=orjson.OPT_NON_STR_KEYS)
+    snapshot = bench("snapshot bytes (once per version)", lambda: body, rounds=ROUNDS * 100)
+    print(f"\norjson speedup: {legacy / fresh:5.1f}x, snapshot speedup: {legacy / snapshot:8.0f}x, body {len(body) / 1024:.0f} KiB\n")
+
+
+async def part_two(items):
+    try:
+        import httpx
+        from fastapi import FastAPI, Request
+        from typing import List
+        from services.http_cache import JsonSnapshot, snapshot_response
+    except ImportError as e:
+        print(f"Part 2 skipped ({e})")
+        return
+
+    app = FastAPI()
+    snapshot = JsonSnapshot(items)
+
+    @app.get("/legacy", response_model=List[dict])
+    async def legacy():
+        return items
+
+    @app.get("/snapshot", response_model=List[dict])
+    async def snapshot_route(request: Request):
+        return snapshot_response(request, snapshot)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"Part 2: {REQUESTS} sequential requests through FastAPI (ASGI, no network)\n")
+        results = {}
+        for path in ("/legacy", "/snapshot"):
+            await client.get(path)
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                response = await client.get(path)
+                response.raise_for_status()
+            elapsed = time.perf_counter() - start
+            results[path] = REQUESTS / elapsed
+            print(f"{path:<12} {results[path]:10.0f} req/s")
+        print(f"\nrequests/sec improvement: {results['/snapshot'] / results['/legacy']:5.1f}x")
+
+
+def main():
+    items = catalog_payload()
+    part_one(items)
+    asyncio.run(part_two(items))
+
+
+if __name__ == "__main__":
+    main()
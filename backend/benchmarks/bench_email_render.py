@@ -0,0 +1,131 @@
+"""
+Benchmark for transactional email rendering.
+
+Compares the previous inline f-string for the booking confirmation email
+with the Jinja2 template: first render in a fresh process (template compiled
+from source), first render with a warm bytecode cache (what a new worker
+process pays), and steady-state renders with the compiled template and the
+header/footer fragments cached.
+
+Run from backend/:  python -m benchmarks.bench_email_render
+"""
+import tempfile
+import time
+
+from services.email_templates import EmailTemplates
+
+ROUNDS = 5000
+COLD_ROUNDS = 50
+
+BOOKING = {
+    "venue_type": "restaurant",
+    "venue_name": "Zaranda",
+    "date": "2026-06-12",
+    "time": "20:30",
+    "guests": 4,
+    "guest_name": "Anna Svensson",
+    "guest_email": "anna@example.com",
+    "guest_phone": "+46 70 123 45 67",
+}
+
+
+def legacy_booking_confirmation(booking: dict) -> str:
+    """The f-string the booking confirmation email used to be built with."""
+    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
+    is_hotel = booking.get("venue_type") == "hotel"
+    checkout_text = booking.get("date_checkout", "")
+    if is_hotel:
+        date_rows = f"""
+                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Check-in</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["date"]}</td></tr>
+                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Check-out</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{checkout_text or 'Not specified'}</td></tr>"""
+    else:
+        date_rows = f"""
+                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Date</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["date"]}</td></tr>
+                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Time</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking.get("time", "")}</td></tr>"""
+    venue_label = "Hotel" if is_hotel else "Venue"
+    availability_text = "Availability is subject to confirmation by the hotel." if is_hotel else "All bookings are subject to the restaurant's availability."
+    confirmation_text = f"We will confirm your {'stay' if is_hotel else 'reservation'} within <strong>72 hours</strong>. In many cases, we'll get back to you much sooner."
+    return f"""
+    <html>
+    <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
+    <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
+            <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
+                <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
+            </div>
+            <div style="background-color: #ffffff; padding: 30px 30px 10px 30px;">
+                <h1 style="color: #3D3D3D; font-size: 22px; margin: 0 0 8px 0;">Thank you, {booking["guest_name"]}!</h1>
+                <p style="color: #6B7B8C; font-size: 15px; line-height: 1.6; margin: 0;">We've received your {'inquiry' if is_hotel else 'reservation request'} and our team will get back to you shortly.</p>
+            </div>
+            <div style="background-color: #ffffff; padding: 10px 30px 30px 30px;">
+                <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 16px;">
+                    <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">Your {'Inquiry' if is_hotel else 'Reservation'} Details</p>
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px; width: 120px;">{venue_label}</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["venue_name"]}</td></tr>
+                        {date_rows}
+                        <tr><td style="padding: 10px 0; color: #8B8680; font-size: 13px;">Guests</td><td style="padding: 10px 0; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["guests"]}</td></tr>
+                    </table>
+                </div>
+                <div style="background: linear-gradient(135deg, #6B7B8C 0%, #8B9BAC 100%); border-radius: 12px; padding: 24px; margin-top: 16px; text-align: center;">
+                    <p style="color: rgba(255,255,255,0.9); font-size: 14px; line-height: 1.6; margin: 0;">
+                        <strong>Please note:</strong> {availability_text} {confirmation_text}
+                    </p>
+                </div>
+                <p style="color: #8B8680; font-size: 13px; line-height: 1.6; margin-top: 20px; text-align: center;">
+                    If you have any questions, don't hesitate to contact us at<br/>
+                    <a href="mailto:contact@golfinmallorca.com" style="color: #6B7B8C; text-decoration: none;">contact@golfinmallorca.com</a> or
+                    <a href="tel:+34620987575" style="color: #6B7B8C; text-decoration: none;">+34 620 987 575</a>
+                </p>
+            </div>
+            <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
+                <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Questions? Reply to this email or contact us at</p>
+                <a href="mailto:contact@golfinmallorca.com" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">contact@golfinmallorca.com</a>
+                <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> — Your Gateway to Luxury Golf in Mallorca</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+
+def render_template(templates: EmailTemplates) -> str:
+    return templates.render(
+        "booking_confirmation",
+        booking=BOOKING,
+        is_hotel=False,
+        date_rows=[("Date", BOOKING["date"]), ("Time", BOOKING["time"])],
+    )
+
+
+def bench(label, fn, rounds=ROUNDS):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48} {elapsed / rounds * 1e6:10.1f} us/render")
+    return elapsed / rounds
+
+
+def main():
+    print(f"Booking confirmation email, {len(legacy_booking_confirmation(BOOKING)) / 1024:.1f} KiB\n")
+    bench("legacy f-string", lambda: legacy_booking_confirmation(BOOKING))
+
+    with tempfile.TemporaryDirectory() as empty, tempfile.TemporaryDirectory() as warm:
+        counter = iter(range(10 ** 9))
+
+        def cold():
+            # Fresh cache directory every time: parse + compile from source
+            path = f"{empty}/{next(counter)}"
+            render_template(EmailTemplates(bytecode_cache_dir=path))
+
+        bench("first render, no bytecode cache (compile)", cold, COLD_ROUNDS)
+        render_template(EmailTemplates(bytecode_cache_dir=warm))
+        bench("first render, warm bytecode cache (new worker)", lambda: render_template(EmailTemplates(bytecode_cache_dir=warm)), COLD_ROUNDS)
+
+        templates = EmailTemplates(bytecode_cache_dir=warm)
+        render_template(templates)
+        bench("steady state (compiled, fragments cached)", lambda: render_template(templates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Micro-benchmark for the search typo matcher on the real partner vocabulary.
+
+Compares the original full-matrix Levenshtein loop from `_fuzzy_match` with
+the banded early-exit distance and the precompiled Myers bit-vector pattern.
+
+Run from backend/:  python -m benchmarks.bench_fuzzy
+"""
+import re
+import time
+
+from data.partners import PARTNER_OFFERS
+from data.courses import GOLF_COURSES
+from services.fuzzy import FuzzyPattern, bounded_distance
+
+QUERIES = ["alcanda", "pollenca", "santa ponsa", "bendinat", "soller", "andratx", "portals", "capdepera", "formentor", "palma"]
+ROUNDS = 5
+
+
+def legacy_within(qw: str, tw: str, max_dist: int) -> bool:
+    """The DP loop previously inlined in server._fuzzy_match."""
+    if abs(len(qw) - len(tw)) > max_dist:
+        return False
+    if len(qw) <= len(tw):
+        short, long_ = qw, tw
+    else:
+        short, long_ = tw, qw
+    distances = list(range(len(short) + 1))
+    for c2 in long_:
+        new_distances = [distances[0] + 1]
+        for i1, c1 in enumerate(short):
+            if c1 == c2:
+                new_distances.append(distances[i1])
+            else:
+                new_distances.append(1 + min(distances[i1], distances[i1 + 1], new_distances[-1]))
+        distances = new_distances
+    return distances[-1] <= max_dist
+
+
+def vocabulary():
+    words = []
+    for item in PARTNER_OFFERS + GOLF_COURSES:
+        text = f"{item.get('name', '')} {item.get('location', '')}".lower()
+        words.extend(w for w in re.findall(r"\w+", text) if len(w) >= 3)
+    return words
+
+
+def query_words():
+    return [w for q in QUERIES for w in q.split() if len(w) >= 4]
+
+
+def run(label, check):
+    words = vocabulary()
+    best = float("inf")
+    hits = 0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        hits = 0
+        for qw in query_words():
+            max_dist = 1 if len(qw) < 7 else 2
+            hits += sum(1 for tw in words if check(qw, tw, max_dist))
+        best = min(best, time.perf_counter() - start)
+    comparisons = len(words) * len(query_words())
+    print(f"{label:<28} {best * 1000:8.2f} ms   {comparisons / best / 1e6:6.2f} M cmp/s   hits={hits}")
+    return best
+
+
+def main():
+    print(f"Vocabulary: {len(vocabulary())} words (with repeats), {len(query_words())} query words, best of {ROUNDS}\n")
+    baseline = run("legacy full matrix", legacy_within)
+    banded = run("banded early-exit", lambda q, t, k: bounded_distance(q, t, k) <= k)
+
+    patterns = {}
+
+    def myers(q, t, k):
+        pattern = patterns.get(q)
+        if pattern is None:
+            pattern = patterns[q] = FuzzyPattern(q, k)
+        return pattern.distance(t) <= k
+
+    bitvector = run("myers bit-vector", myers)
+
+    def memoized(q, t, k):
+        pattern = patterns.get(q)
+        if pattern is None:
+            pattern = patterns[q] = FuzzyPattern(q, k)
+        return pattern.matches(t)
+
+    memo = run("myers + per-token memo", memoized)
+    print()
+    for label, elapsed in [("banded", banded), ("myers", bitvector), ("myers + memo", memo)]:
+        print(f"{label:<14} speedup vs legacy: {baseline / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
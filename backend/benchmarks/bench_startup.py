@@ -0,0 +1,80 @@
+"""
+Startup benchmark for the static datasets.
+
+server.py used to import data.courses, data.partners (which also held the
+blog posts) and data.reviews at module level, so every worker paid their
+import time and kept the dict trees in its heap even when MongoDB serves
+all the data. They are now reached through data.static, which imports a
+module on first use.
+
+Each scenario runs in a fresh interpreter (as a new worker would) and
+reports the import time and the RSS growth it causes; the median of RUNS
+is shown. When the server's dependencies are installed, `import server`
+is measured too.
+
+Run from backend/:  python -m benchmarks.bench_startup
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+
+PROBE = """
+import json, time
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+before = rss_kb()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "rss_kb": rss_kb() - before}}))
+"""
+
+SCENARIOS = [
+    ("eager: data.courses + data.partners + data.reviews + data.blog_posts",
+     "import data.courses, data.partners, data.reviews, data.blog_posts"),
+    ("lazy: data.static", "from data import static"),
+    ("lazy, first fallback used: static.partner_offers('hotel')",
+     "from data import static; static.partner_offers('hotel')"),
+]
+
+
+def measure(code: str):
+    samples = []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code=code)], capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+    return statistics.median(s["ms"] for s in samples), statistics.median(s["rss_kb"] for s in samples)
+
+
+def server_importable() -> bool:
+    result = subprocess.run([sys.executable, "-c", "import dotenv, motor, fastapi"], capture_output=True)
+    return result.returncode == 0
+
+
+def main():
+    # Warm the .pyc cache so every scenario measures a normal (compiled) start
+    subprocess.run([sys.executable, "-c", SCENARIOS[0][1]], check=True)
+    scenarios = list(SCENARIOS)
+    if server_importable():
+        scenarios.append(("import server", "import server"))
+    else:
+        print("(server dependencies not installed: skipping `import server`)\n")
+
+    print(f"{'scenario':<72} {'import ms':>10} {'RSS +KB':>9}")
+    for label, code in scenarios:
+        ms, rss = measure(code)
+        print(f"{label:<72} {ms:>10.1f} {rss:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
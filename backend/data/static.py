@@ -0,0 +1,47 @@
+"""Lazy access to the static datasets.
+
+The catalog collections in MongoDB are the source of truth; the literals in
+data/courses.py and data/partners.py are only a fallback for empty
+collections, and data/reviews.py is read when the review index is first
+built. Importing them eagerly put roughly 280 KB of source and its dict
+trees into every worker's heap at startup. These accessors import a module
+on first use and cache the result (including the per-type partner lists,
+which the fallback paths used to rebuild per request).
+
+The returned lists are shared: do not mutate them.
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+
+@lru_cache(maxsize=None)
+def golf_courses() -> List[dict]:
+    from data.courses import GOLF_COURSES
+    return GOLF_COURSES
+
+
+@lru_cache(maxsize=None)
+def _partner_offers_by_type() -> Dict[str, List[dict]]:
+    from data.partners import PARTNER_OFFERS
+    by_type: Dict[str, List[dict]] = {}
+    for offer in PARTNER_OFFERS:
+        by_type.setdefault(offer["type"], []).append(offer)
+    return by_type
+
+
+def partner_offers(partner_type: Optional[str] = None) -> List[dict]:
+    """All static partner offers, or those of one type ([] for an unknown type).
+
+    Not cached per argument: the type comes from a query parameter, so only
+    the per-type lists that exist in the dataset are kept.
+    """
+    if partner_type is None:
+        from data.partners import PARTNER_OFFERS
+        return PARTNER_OFFERS
+    return _partner_offers_by_type().get(partner_type, [])
+
+
+@lru_cache(maxsize=None)
+def reviews() -> List[dict]:
+    from data.reviews import REVIEWS_DATA
+    return REVIEWS_DATA
@@ -7,16 +7,19 @@ from models.golf_course import (
     GolfCourseUpdate,
     GolfCourseResponse
 )
+from services.partner_repository import CatalogEvents, PartnerRepository
 
 router = APIRouter(prefix="/golf-courses", tags=["Golf Courses"])
 
 # Database reference will be injected
 db = None
+repository = None
 
 def init_db(database):
     """Initialize the database reference"""
-    global db
+    global db, repository
     db = database
+    repository = PartnerRepository(database, "golf_courses", "Golf course", CatalogEvents())
 
 
 def golf_doc_to_response(doc: dict) -> dict:
@@ -114,9 +117,8 @@ async def delete_golf_course(course_id: str):
 @router.post("/reorder", status_code=200)
 async def reorder_golf_courses(course_ids: List[str]):
     """Reorder golf courses by updating display_order (admin only)"""
-    for index, course_id in enumerate(course_ids):
-        await db.golf_courses.update_one(
-            {"id": course_id},
-            {"$set": {"display_order": index, "updated_at": datetime.now(timezone.utc)}}
-        )
+    try:
+        await repository.reorder(course_ids, start=0)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {"message": "Courses reordered successfully"}
@@ -1,23 +1,25 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Request, Response, UploadFile, File
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response, UploadFile, File
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 import os
 import logging
 import asyncio
 import resend
 import httpx
-import requests as sync_requests
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, ValidationError, field_validator
+from typing import Callable, List, Optional, Dict, Union
 import uuid
 import string
 import random
 from datetime import datetime, timezone, timedelta
 import shutil
+import orjson
 from emergentintegrations.payments.stripe.checkout import StripeCheckout, CheckoutSessionResponse, CheckoutStatusResponse, CheckoutSessionRequest
 
 ROOT_DIR = Path(__file__).parent
@@ -30,48 +32,92 @@ resend.api_key = os.environ.get('RESEND_API_KEY')
 SENDER_EMAIL = os.environ.get('SENDER_EMAIL', 'onboarding@resend.dev')
 
 # Object Storage setup
-STORAGE_URL = "https://integrations.emergentagent.com/objstore/api/v1/storage"
 EMERGENT_KEY = os.environ.get("EMERGENT_LLM_KEY")
 APP_NAME = "mallorca-golf"
-_storage_key = None
 
 # Stripe setup
 STRIPE_API_KEY = os.environ.get("STRIPE_API_KEY")
 STRIPE_WEBHOOK_SECRET = os.environ.get("STRIPE_WEBHOOK_SECRET")
 
-def init_storage():
-    global _storage_key
-    if _storage_key:
-        return _storage_key
-    resp = sync_requests.post(f"{STORAGE_URL}/init", json={"emergent_key": EMERGENT_KEY}, timeout=30)
-    resp.raise_for_status()
-    _storage_key = resp.json()["storage_key"]
-    return _storage_key
-
-def put_object(path: str, data: bytes, content_type: str) -> dict:
-    key = init_storage()
-    resp = sync_requests.put(
-        f"{STORAGE_URL}/objects/{path}",
-        headers={"X-Storage-Key": key, "Content-Type": content_type},
-        data=data, timeout=120
-    )
-    resp.raise_for_status()
-    return resp.json()
-
-def get_object(path: str):
-    key = init_storage()
-    resp = sync_requests.get(
-        f"{STORAGE_URL}/objects/{path}",
-        headers={"X-Storage-Key": key}, timeout=60
-    )
-    resp.raise_for_status()
-    return resp.content, resp.headers.get("Content-Type", "application/octet-stream")
-
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Shared in-memory snapshot of the partner catalog collections
+from services.catalog_cache import CatalogCache
+from services.search_index import SearchIndex
+from services.http_cache import SnapshotCache, snapshot_response
+from services.i18n import normalize_lang, project_language, project_list
+from services.pagination import decode_cursor, decode_key, encode_key, paginate, parse_fields, project_fields
+from services.indexes import REQUIRED_INDEXES, ensure_indexes, index_report
+from services.sessions import SessionCache, SessionInvalid, parse_expiry, session_token_from_request
+from services.newsletter import NewsletterDispatcher
+from services.subscriber_import import SubscriberImporter, dedupe_emails, normalize_email
+from services.email_templates import EmailTemplates
+from services.outbox import EmailOutbox
+from services.storage import STORAGE_URL, ObjectNotFound, StorageClient, StorageError
+from services.image_cache import ImageCache, image_response
+from services.image_pipeline import ImagePipeline, build_srcset, choose_variant
+from services.image_mirror import ImageMirror
+from services.blog_posts import BlogPostExists, BlogPostNotFound, BlogPosts
+from services.review_stats import ReviewStats
+from services.reviews import ReviewFeed
+from services.migrations import Migration, MigrationRunner, seed_updates, seed_upserts
+from services.partner_repository import (
+    CatalogEvents, PartnerExists, PartnerNotFound, PartnerRepository, TransactionsUnsupported,
+)
+from PIL import Image, UnidentifiedImageError
+catalog_cache = CatalogCache(db)
+catalog_snapshots = SnapshotCache()
+# Single-round-trip writes for the catalog collections; every write invalidates the catalog cache
+catalog_events = CatalogEvents()
+catalog_events.subscribe(lambda change: catalog_cache.invalidate(change.collection))
+golf_course_repository = PartnerRepository(db, "golf_courses", "Golf course", catalog_events)
+partner_repositories = {
+    # New hotels without a display_order are appended (1, 2, 3...)
+    "hotel": PartnerRepository(db, "hotels", "Hotel", catalog_events, partner_type="hotel", append=True),
+    "restaurant": PartnerRepository(db, "restaurants", "Restaurant", catalog_events, partner_type="restaurant"),
+    "beach_club": PartnerRepository(db, "beach_clubs", "Beach club", catalog_events, partner_type="beach_club"),
+    "cafe_bar": PartnerRepository(db, "cafe_bars", "Café/Bar", catalog_events, partner_type="cafe_bar"),
+}
+search_index = SearchIndex(catalog_cache, {
+    "golf": "golf_courses",
+    "hotel": "hotels",
+    "restaurant": "restaurants",
+    "beach_club": "beach_clubs",
+    "cafe_bar": "cafe_bars",
+})
+# Compiled email templates with cached header/footer fragments
+email_templates = EmailTemplates()
+
+
+def send_transactional_email(params: dict, idempotency_key: str):
+    """One Resend send call; the outbox dedup key is passed as the idempotency key."""
+    return resend.Emails.send(params, {"idempotency_key": idempotency_key})
+
+
+# Durable queue for every transactional email; handlers only enqueue
+email_outbox = EmailOutbox(db, send_transactional_email)
+# Pooled async client for uploads and image fetches
+storage = StorageClient(STORAGE_URL, EMERGENT_KEY)
+# Memory + disk cache in front of storage for /api/images
+# Outside UPLOADS_DIR: everything there is publicly served under /api/uploads
+IMAGE_CACHE_DIR = Path(os.environ.get("IMAGE_CACHE_DIR", str(ROOT_DIR / "cache" / "images")))
+image_cache = ImageCache(storage, IMAGE_CACHE_DIR)
+# Resized WebP/AVIF variants generated on upload (process pool)
+image_pipeline = ImagePipeline(db, storage)
+# Local copies of externally hosted partner images, re-checked in the background
+image_mirror = ImageMirror(db, image_pipeline, f"{APP_NAME}/mirrors", on_change=catalog_cache.invalidate)
+# Resolved login sessions (token -> User), see get_current_user
+session_cache = SessionCache()
+# Review count/average/histogram, maintained with $inc on every review write
+review_stats = ReviewStats(db)
+
+# Catalog listing pages (?limit=&cursor=)
+DEFAULT_PAGE_SIZE = 6
+MAX_PAGE_SIZE = 100
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -163,6 +209,10 @@ class GolfCourse(BaseModel):
     features: List[str]
     booking_url: str
 
+class ReorderRequest(BaseModel):
+    ids: List[str]  # New order; documents not listed keep their position
+    transaction: bool = False  # Apply all or nothing (needs a replica set)
+
 class PartnerOffer(BaseModel):
     id: str
     name: str
@@ -191,6 +241,53 @@ class BlogPost(BaseModel):
     published: bool = True
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class BlogPostCreate(BaseModel):
+    # SEO fields (meta_description, seo_keywords, cta...) are stored as given
+    model_config = ConfigDict(extra="allow")
+    slug: str
+    title: dict  # Multi-language
+    excerpt: dict  # Multi-language
+    content: dict  # Multi-language
+    image: str
+    author: str
+    category: str
+    tags: List[str] = []
+    published: bool = True
+
+class BlogPostUpdate(BaseModel):
+    # Explicit allow-list: every key goes straight into a $set
+    model_config = ConfigDict(extra="forbid")
+    slug: Optional[str] = None
+    title: Optional[Dict[str, str]] = None  # Multi-language
+    excerpt: Optional[Dict[str, str]] = None  # Multi-language
+    content: Optional[Dict[str, str]] = None  # Multi-language
+    image: Optional[str] = None
+    author: Optional[str] = None
+    category: Optional[str] = None
+    tags: Optional[List[str]] = None
+    published: Optional[bool] = None
+    meta_description: Optional[Union[str, Dict[str, str]]] = None
+    seo_keywords: Optional[List[str]] = None
+    cta: Optional[Dict[str, Union[str, Dict[str, str]]]] = None
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def not_null(cls, value):
+        # Omit a field to leave it unchanged; null would erase it
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+    @field_validator("title", "excerpt", "content", "meta_description", "cta")
+    @classmethod
+    def plain_keys(cls, value):
+        # Nested keys become MongoDB field names
+        for key, inner in (value.items() if isinstance(value, dict) else ()):
+            if key.startswith("$") or "." in key:
+                raise ValueError(f"invalid key {key!r}")
+            cls.plain_keys(inner)
+        return value
+
 # Trip Planner Models
 class TripPlannerRequest(BaseModel):
     name: str
@@ -259,6 +356,11 @@ class ClientReviewCreate(BaseModel):
     language: str = "EN"
     review_text: str
 
+# One keyset page of /api/reviews (when a cursor is passed)
+class ReviewPage(BaseModel):
+    items: List[dict]
+    next_cursor: Optional[str] = None
+
 # User-submitted review model (requires auth, pending approval)
 class UserReviewSubmission(BaseModel):
     rating: int = Field(ge=1, le=5)
@@ -280,162 +382,60 @@ class UserReview(BaseModel):
     reviewed_at: Optional[datetime] = None
 
 
-# Data imports - extracted from server.py for maintainability
-from data.reviews import REVIEWS_DATA
-from data.courses import GOLF_COURSES
-from data.partners import PARTNER_OFFERS, BLOG_POSTS
+# Static datasets (fallbacks and review seed), imported on first use
+from data import static
+# Static + approved user reviews, indexed by country/platform for /api/reviews
+review_feed = ReviewFeed(db, static.reviews)
+# Blog CMS: posts in MongoDB, published ones cached as a BlogStore
+blog_posts = BlogPosts(db)
 
 
 # Email helper functions
-async def send_contact_notification_email(inquiry: ContactInquiryCreate):
-    """Send notification email to admin when new contact inquiry is received."""
-    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
-    html_content = f"""
-    <html>
-    <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-    <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-            <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-            </div>
-            <div style="background: linear-gradient(135deg, #6B7B8C 0%, #7D8D9C 100%); padding: 14px 30px; text-align: center;">
-                <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 12px; letter-spacing: 2px;">NEW CONTACT INQUIRY</p>
-            </div>
-            <div style="background-color: white; padding: 40px 30px; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 120px;">Name</td>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{inquiry.name}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Email</td>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;"><a href="mailto:{inquiry.email}" style="color: #2D2D2D !important; text-decoration: none !important;">{inquiry.email}</a></td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Phone</td>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;"><a href="tel:{inquiry.phone}" style="color: #2D2D2D !important; text-decoration: none !important;">{inquiry.phone or 'Not provided'}</a></td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Country</td>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;">{inquiry.country}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Type</td>
-                        <td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;">{inquiry.inquiry_type}</td>
-                    </tr>
-                </table>
-                <div style="margin-top: 24px;">
-                    <p style="color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">Message</p>
-                    <div style="background-color: #F5F2EB; padding: 20px; border-radius: 8px; border-left: 4px solid #6B7B8C;">
-                        <p style="color: #2D2D2D; font-size: 15px; line-height: 1.7; margin: 0;">{inquiry.message}</p>
-                    </div>
-                </div>
-            </div>
-            <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.7) !important; text-decoration: none !important;">golfinmallorca.com</a></p>
-                <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 8px 0 0 0;"><a href="mailto:contact@golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">contact@golfinmallorca.com</a> | <a href="tel:+34620987575" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">+34 620 987 575</a></p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    params = {
-        "from": SENDER_EMAIL,
-        "to": ["contact@golfinmallorca.com"],
-        "subject": f"New Contact Inquiry from {inquiry.name} - golfinmallorca.com",
-        "html": html_content
-    }
-    
-    try:
-        await asyncio.to_thread(resend.Emails.send, params)
-        logger.info(f"Contact notification email sent for inquiry from {inquiry.email}")
-    except Exception as e:
-        logger.error(f"Failed to send contact notification email: {str(e)}")
-
-async def send_newsletter_welcome_email(name: str, email: str):
-    """Send welcome email to new newsletter subscriber."""
-    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
-    html_content = f"""
-    <html>
-    <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-    <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-            <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-            </div>
-            <div style="background-color: #ffffff; padding: 30px 30px 10px 30px;">
-                <h2 style="color: #2D2D2D; font-size: 22px; margin: 0 0 8px 0; font-weight: 500;">Welcome, {name}!</h2>
-                <p style="color: #6B7B8C; font-size: 15px; line-height: 1.6; margin: 0;">
-                    Thank you for joining our exclusive community of golf enthusiasts. You're now part of a select group who appreciate the finest courses and experiences Mallorca has to offer.
-                </p>
-            </div>
-            <div style="background-color: #ffffff; padding: 10px 30px 30px 30px;">
-                <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 16px;">
-                    <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">As a subscriber, you'll receive:</p>
-                    <table style="width: 100%;">
-                        <tr><td style="padding: 8px 0; color: #2D2D2D; font-size: 14px;">&#10003; Exclusive deals on green fees at premium courses</td></tr>
-                        <tr><td style="padding: 8px 0; color: #2D2D2D; font-size: 14px;">&#10003; Early access to golf &amp; hotel packages</td></tr>
-                        <tr><td style="padding: 8px 0; color: #2D2D2D; font-size: 14px;">&#10003; Insider tips on the best courses and restaurants</td></tr>
-                        <tr><td style="padding: 8px 0; color: #2D2D2D; font-size: 14px;">&#10003; Seasonal offers and special promotions</td></tr>
-                    </table>
-                </div>
-                <div style="text-align: center; margin: 32px 0;">
-                    <a href="https://golfinmallorca.greenfee365.com" style="display: inline-block; background-color: #6B7B8C; color: white; padding: 16px 40px; text-decoration: none; border-radius: 8px; font-weight: 600; font-size: 14px;">Book Your Tee Time</a>
-                </div>
-            </div>
-            <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Questions? Contact us at</p>
-                <a href="mailto:contact@golfinmallorca.com" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">contact@golfinmallorca.com</a>
-                <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> &mdash; Your Gateway to Luxury Golf in Mallorca</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    params = {
-        "from": SENDER_EMAIL,
-        "to": [email],
-        "subject": "Welcome to golfinmallorca.com!",
-        "html": html_content
-    }
-    
-    try:
-        await asyncio.to_thread(resend.Emails.send, params)
-        logger.info(f"Welcome newsletter email sent to {email}")
-    except Exception as e:
-        logger.error(f"Failed to send welcome newsletter email: {str(e)}")
+async def send_contact_notification_email(inquiry: ContactInquiry):
+    """Queue the admin notification for a new contact inquiry."""
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=["contact@golfinmallorca.com"],
+        subject=f"New Contact Inquiry from {inquiry.name} - golfinmallorca.com",
+        html=email_templates.render("contact_notification", inquiry=inquiry),
+        dedup_key=f"contact-{inquiry.id}",
+        kind="contact_notification",
+    )
+
+async def send_newsletter_welcome_email(subscription: NewsletterSubscription):
+    """Queue the welcome email for a new newsletter subscriber."""
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=[subscription.email],
+        subject="Welcome to golfinmallorca.com!",
+        html=email_templates.render("newsletter_welcome", name=subscription.name),
+        dedup_key=f"newsletter-welcome-{subscription.id}",
+        kind="newsletter_welcome",
+    )
+
+# Auth helper functions
+async def resolve_session(session_token: str) -> User:
+    """Resolve a session token to its user, raising SessionInvalid if it is unknown or expired."""
+    cached = session_cache.get(session_token)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at < datetime.now(timezone.utc):
+            session_cache.invalidate(session_token)
+            raise SessionInvalid("Session expired. Please sign in again.")
+        return user
 
-# Auth helper function
-async def get_current_user(request: Request) -> Optional[User]:
-    """Get current user from session token in cookie or Authorization header."""
-    session_token = request.cookies.get("session_token")
-    
-    if not session_token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            session_token = auth_header[7:]
-    
-    if not session_token:
-        return None
-    
     session_doc = await db.user_sessions.find_one(
         {"session_token": session_token},
         {"_id": 0}
     )
     
     if not session_doc:
-        return None
+        raise SessionInvalid("Session not found. Please sign in again.")
     
     # Check expiry with timezone awareness
-    expires_at = session_doc["expires_at"]
-    if isinstance(expires_at, str):
-        expires_at = datetime.fromisoformat(expires_at)
-    if expires_at.tzinfo is None:
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    expires_at = parse_expiry(session_doc["expires_at"])
     if expires_at < datetime.now(timezone.utc):
-        return None
+        raise SessionInvalid("Session expired. Please sign in again.")
     
     user_doc = await db.users.find_one(
         {"user_id": session_doc["user_id"]},
@@ -443,12 +443,24 @@ async def get_current_user(request: Request) -> Optional[User]:
     )
     
     if not user_doc:
-        return None
+        raise SessionInvalid("User not found.")
     
     if isinstance(user_doc.get('created_at'), str):
         user_doc['created_at'] = datetime.fromisoformat(user_doc['created_at'])
     
-    return User(**user_doc)
+    user = User(**user_doc)
+    session_cache.put(session_token, user.user_id, user, expires_at)
+    return user
+
+async def get_current_user(request: Request) -> Optional[User]:
+    """Get current user from session token in cookie or Authorization header."""
+    session_token = session_token_from_request(request)
+    if not session_token:
+        return None
+    try:
+        return await resolve_session(session_token)
+    except SessionInvalid:
+        return None
 
 # Auth Routes
 @api_router.post("/auth/session")
@@ -508,6 +520,8 @@ async def exchange_session(request: SessionIdRequest, response: Response):
         # Remove old sessions for this user
         await db.user_sessions.delete_many({"user_id": user_id})
         await db.user_sessions.insert_one(session_doc)
+        session_cache.invalidate_user(user_id)
+        session_cache.invalidate(session_token)
         
         # Set httpOnly cookie
         response.set_cookie(
@@ -547,6 +561,7 @@ async def logout(request: Request, response: Response):
     
     if session_token:
         await db.user_sessions.delete_many({"session_token": session_token})
+        session_cache.invalidate(session_token)
     
     response.delete_cookie(
         key="session_token",
@@ -572,493 +587,252 @@ async def health():
     """Lightweight health endpoint for Kubernetes liveness/readiness probes."""
     return {"status": "ok"}
 
+async def _catalog_listing(request: Request, collection: str, fallback: Callable[[], List[dict]], include_inactive: bool,
+                           lang: Optional[str], fields: Optional[str], cursor: Optional[str], limit: Optional[int]) -> Response:
+    """Active (or all) documents of a catalog collection as a JSON response.
+    Plain listings are pre-serialized snapshots; fields= and cursor/limit pages are built per request."""
+    lang = normalize_lang(lang)
+    try:
+        field_names = parse_fields(fields)
+        if cursor:
+            decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    docs = await catalog_cache.get(collection)
+    
+    def build():
+        items = docs if include_inactive else [d for d in docs if d.get("is_active") is True]
+        # If the collection is empty, return hardcoded data (for backward compatibility)
+        return project_list(items or fallback(), lang)
+    
+    if not field_names and cursor is None and limit is None:
+        snapshot = catalog_snapshots.get((collection, include_inactive, lang), [docs], build)
+        return snapshot_response(request, snapshot)
+    
+    items = build()
+    if cursor is None and limit is None:
+        return Response(content=orjson.dumps(project_fields(items, field_names)), media_type="application/json")
+    page, next_cursor = paginate(items, cursor, limit or DEFAULT_PAGE_SIZE)
+    return Response(
+        content=orjson.dumps({"items": project_fields(page, field_names), "next_cursor": next_cursor}),
+        media_type="application/json",
+    )
+
+
 @api_router.get("/golf-courses", response_model=List[dict])
-async def get_golf_courses(include_inactive: bool = False):
-    """Get all golf courses from MongoDB, falls back to hardcoded data if empty"""
-    # Try to fetch from MongoDB first
-    query = {} if include_inactive else {"is_active": True}
-    cursor = db.golf_courses.find(query, {"_id": 0}).sort("display_order", 1)
-    
-    courses = await cursor.to_list(length=100)
-    
-    # If no courses in database, return hardcoded data (for backward compatibility)
-    if not courses:
-        return GOLF_COURSES
-    
-    return courses
+async def get_golf_courses(
+    request: Request,
+    include_inactive: bool = False,
+    lang: Optional[str] = None,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Get all golf courses from MongoDB, falls back to hardcoded data if empty.
+    With ?lang= only that language's texts are returned (English fallback).
+    fields=id,name,... returns a sparse fieldset; limit/cursor switch to
+    {"items": [...], "next_cursor": ...} pages ordered by (display_order, id)."""
+    return await _catalog_listing(request, "golf_courses", static.golf_courses, include_inactive, lang, fields, cursor, limit)
 
 
 @api_router.get("/golf-courses/{course_id}")
-async def get_golf_course_by_id(course_id: str):
+async def get_golf_course_by_id(course_id: str, lang: Optional[str] = None):
     """Get a single golf course by its ID/slug"""
+    lang = normalize_lang(lang)
     course = await db.golf_courses.find_one({"id": course_id}, {"_id": 0})
     if not course:
         # Fallback to hardcoded data
-        for c in GOLF_COURSES:
+        for c in static.golf_courses():
             if c["id"] == course_id:
-                return c
+                return project_language(c, lang)
         raise HTTPException(status_code=404, detail="Golf course not found")
-    return course
-
-
-@api_router.post("/golf-courses", response_model=dict, status_code=201)
-async def create_golf_course(course: dict):
-    """Create a new golf course (admin only)"""
-    # Check if course with same ID already exists
-    existing = await db.golf_courses.find_one({"id": course.get("id")})
-    if existing:
-        raise HTTPException(status_code=400, detail="Golf course with this ID already exists")
-    
-    # Add metadata
-    now = datetime.now(timezone.utc)
-    course["is_active"] = True
-    course["display_order"] = course.get("display_order", 0)
-    course["created_at"] = now
-    course["updated_at"] = now
-    
-    await db.golf_courses.insert_one(course)
-    
-    # Return without _id
-    course.pop("_id", None)
-    return course
-
-
-@api_router.put("/golf-courses/{course_id}", response_model=dict)
-async def update_golf_course(course_id: str, course_update: dict):
-    """Update an existing golf course (admin only)"""
-    existing = await db.golf_courses.find_one({"id": course_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Golf course not found")
-    
-    # Remove fields that shouldn't be updated directly
-    course_update.pop("_id", None)
-    course_update.pop("id", None)
-    course_update.pop("created_at", None)
-    
-    if course_update:
-        course_update["updated_at"] = datetime.now(timezone.utc)
-        await db.golf_courses.update_one(
-            {"id": course_id},
-            {"$set": course_update}
-        )
-    
-    updated = await db.golf_courses.find_one({"id": course_id}, {"_id": 0})
-    return updated
-
-
-@api_router.delete("/golf-courses/{course_id}", status_code=204)
-async def delete_golf_course(course_id: str):
-    """Soft delete a golf course (sets is_active to False)"""
-    result = await db.golf_courses.update_one(
-        {"id": course_id},
-        {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Golf course not found")
-    return None
+    return project_language(course, lang)
 
 
 @api_router.post("/golf-courses/reorder", status_code=200)
 async def reorder_golf_courses(course_ids: List[str]):
-    """Reorder golf courses by updating display_order (admin only)"""
-    for index, course_id in enumerate(course_ids):
-        await db.golf_courses.update_one(
-            {"id": course_id},
-            {"$set": {"display_order": index, "updated_at": datetime.now(timezone.utc)}}
-        )
-    return {"message": "Courses reordered successfully"}
+    """Reorder golf courses by updating display_order (admin only); positions start at 0"""
+    try:
+        result = await golf_course_repository.reorder(course_ids, start=0)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"message": "Courses reordered successfully", "updated": result["updated"]}
+
+PARTNER_COLLECTIONS = {
+    "hotel": "hotels",
+    "restaurant": "restaurants",
+    "beach_club": "beach_clubs",
+    "cafe_bar": "cafe_bars",
+}
+
 
 @api_router.get("/partner-offers", response_model=List[dict])
-async def get_partner_offers(type: Optional[str] = None):
+async def get_partner_offers(request: Request, type: Optional[str] = None, lang: Optional[str] = None):
     """Get partner offers from MongoDB, falls back to hardcoded data if empty"""
-    
-    if type == "hotel":
-        cursor = db.hotels.find({}, {"_id": 0}).sort("display_order", 1)
-        items = await cursor.to_list(length=200)
-        if items:
-            return items
-    elif type == "restaurant":
-        cursor = db.restaurants.find({}, {"_id": 0}).sort("display_order", 1)
-        items = await cursor.to_list(length=200)
-        if items:
-            return items
-    elif type == "beach_club":
-        cursor = db.beach_clubs.find({}, {"_id": 0}).sort("display_order", 1)
-        items = await cursor.to_list(length=200)
-        if items:
-            return items
-    elif type == "cafe_bar":
-        cursor = db.cafe_bars.find({}, {"_id": 0}).sort("display_order", 1)
-        items = await cursor.to_list(length=200)
-        if items:
-            return items
+    lang = normalize_lang(lang)
+    if type in PARTNER_COLLECTIONS:
+        sources = [await catalog_cache.get(PARTNER_COLLECTIONS[type])]
     elif type is None:
         # Return all partners combined
-        hotels = await db.hotels.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-        restaurants = await db.restaurants.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-        beach_clubs = await db.beach_clubs.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-        cafe_bars = await db.cafe_bars.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-        
-        all_partners = hotels + restaurants + beach_clubs + cafe_bars
-        if all_partners:
-            return all_partners
+        sources = await asyncio.gather(*(catalog_cache.get(name) for name in PARTNER_COLLECTIONS.values()))
+    else:
+        # Unknown type: nothing can match, and it must not become a cache key
+        return []
+    
+    def build():
+        items = [item for docs in sources for item in docs]
+        if not items:
+            # Fallback to hardcoded data
+            items = static.partner_offers(type)
+        return project_list(items, lang)
     
-    # Fallback to hardcoded data
-    if type:
-        return [o for o in PARTNER_OFFERS if o["type"] == type]
-    return PARTNER_OFFERS
+    snapshot = catalog_snapshots.get(("partner-offers", type, lang), sources, build)
+    return snapshot_response(request, snapshot)
 
 
 # Individual partner type endpoints
 @api_router.get("/hotels", response_model=List[dict])
-async def get_hotels(include_inactive: bool = False):
+async def get_hotels(
+    request: Request,
+    include_inactive: bool = False,
+    lang: Optional[str] = None,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
     """Get all hotels from MongoDB"""
-    query = {} if include_inactive else {"is_active": True}
-    cursor = db.hotels.find(query, {"_id": 0}).sort("display_order", 1)
-    hotels = await cursor.to_list(length=200)
-    if not hotels:
-        return [o for o in PARTNER_OFFERS if o["type"] == "hotel"]
-    return hotels
+    return await _catalog_listing(request, PARTNER_COLLECTIONS["hotel"], lambda: static.partner_offers("hotel"), include_inactive, lang, fields, cursor, limit)
 
 
 @api_router.get("/restaurants", response_model=List[dict])
-async def get_restaurants(include_inactive: bool = False):
+async def get_restaurants(
+    request: Request,
+    include_inactive: bool = False,
+    lang: Optional[str] = None,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
     """Get all restaurants from MongoDB"""
-    query = {} if include_inactive else {"is_active": True}
-    cursor = db.restaurants.find(query, {"_id": 0}).sort("display_order", 1)
-    restaurants = await cursor.to_list(length=200)
-    if not restaurants:
-        return [o for o in PARTNER_OFFERS if o["type"] == "restaurant"]
-    return restaurants
+    return await _catalog_listing(request, PARTNER_COLLECTIONS["restaurant"], lambda: static.partner_offers("restaurant"), include_inactive, lang, fields, cursor, limit)
 
 
 @api_router.get("/beach-clubs", response_model=List[dict])
-async def get_beach_clubs(include_inactive: bool = False):
+async def get_beach_clubs(
+    request: Request,
+    include_inactive: bool = False,
+    lang: Optional[str] = None,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
     """Get all beach clubs from MongoDB"""
-    query = {} if include_inactive else {"is_active": True}
-    cursor = db.beach_clubs.find(query, {"_id": 0}).sort("display_order", 1)
-    beach_clubs = await cursor.to_list(length=200)
-    if not beach_clubs:
-        return [o for o in PARTNER_OFFERS if o["type"] == "beach_club"]
-    return beach_clubs
+    return await _catalog_listing(request, PARTNER_COLLECTIONS["beach_club"], lambda: static.partner_offers("beach_club"), include_inactive, lang, fields, cursor, limit)
 
 
 @api_router.get("/cafe-bars", response_model=List[dict])
-async def get_cafe_bars(include_inactive: bool = False):
+async def get_cafe_bars(
+    request: Request,
+    include_inactive: bool = False,
+    lang: Optional[str] = None,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
     """Get all cafés and bars from MongoDB"""
-    query = {} if include_inactive else {"is_active": True}
-    cursor = db.cafe_bars.find(query, {"_id": 0}).sort("display_order", 1)
-    cafe_bars = await cursor.to_list(length=200)
-    if not cafe_bars:
-        return [o for o in PARTNER_OFFERS if o["type"] == "cafe_bar"]
-    return cafe_bars
+    return await _catalog_listing(request, PARTNER_COLLECTIONS["cafe_bar"], lambda: static.partner_offers("cafe_bar"), include_inactive, lang, fields, cursor, limit)
 
 
-# CRUD endpoints for each partner type
-@api_router.post("/hotels", response_model=dict, status_code=201)
-async def create_hotel(hotel: dict):
-    """Create a new hotel"""
-    existing = await db.hotels.find_one({"id": hotel.get("id")})
-    if existing:
-        raise HTTPException(status_code=400, detail="Hotel with this ID already exists")
-    
-    now = datetime.now(timezone.utc)
-    hotel["type"] = "hotel"
-    hotel["is_active"] = True
-    # Auto-assign display_order as max+1 so new hotels get sequential numbering (1, 2, 3...)
-    if "display_order" not in hotel or not hotel["display_order"]:
-        last = await db.hotels.find({}, {"display_order": 1}).sort("display_order", -1).limit(1).to_list(1)
-        max_order = last[0].get("display_order", 0) if last else 0
-        hotel["display_order"] = max_order + 1
-    hotel["created_at"] = now
-    hotel["updated_at"] = now
-    
-    await db.hotels.insert_one(hotel)
-    hotel.pop("_id", None)
-    return hotel
-
-
-@api_router.put("/hotels/{hotel_id}", response_model=dict)
-async def update_hotel(hotel_id: str, hotel_update: dict):
-    """Update an existing hotel"""
-    existing = await db.hotels.find_one({"id": hotel_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Hotel not found")
-    
-    hotel_update.pop("_id", None)
-    hotel_update.pop("id", None)
-    hotel_update.pop("created_at", None)
-    
-    if hotel_update:
-        hotel_update["updated_at"] = datetime.now(timezone.utc)
-        await db.hotels.update_one({"id": hotel_id}, {"$set": hotel_update})
-    
-    updated = await db.hotels.find_one({"id": hotel_id}, {"_id": 0})
-    return updated
-
-
-@api_router.delete("/hotels/{hotel_id}", status_code=204)
-async def delete_hotel(hotel_id: str):
-    """Soft delete a hotel"""
-    result = await db.hotels.update_one(
-        {"id": hotel_id},
-        {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Hotel not found")
-    return None
-
+# CRUD endpoints for each catalog collection (golf courses and the partner types)
+def add_catalog_crud_routes(path: str, repository: PartnerRepository):
+    """Register POST /{path}, PUT /{path}/{id} and DELETE /{path}/{id} backed by `repository`."""
+    label = repository.label
 
-@api_router.post("/restaurants", response_model=dict, status_code=201)
-async def create_restaurant(restaurant: dict):
-    """Create a new restaurant"""
-    existing = await db.restaurants.find_one({"id": restaurant.get("id")})
-    if existing:
-        raise HTTPException(status_code=400, detail="Restaurant with this ID already exists")
-    
-    now = datetime.now(timezone.utc)
-    restaurant["type"] = "restaurant"
-    restaurant["is_active"] = True
-    restaurant["display_order"] = restaurant.get("display_order", 0)
-    restaurant["created_at"] = now
-    restaurant["updated_at"] = now
-    
-    await db.restaurants.insert_one(restaurant)
-    restaurant.pop("_id", None)
-    return restaurant
-
-
-@api_router.put("/restaurants/{restaurant_id}", response_model=dict)
-async def update_restaurant(restaurant_id: str, restaurant_update: dict):
-    """Update an existing restaurant"""
-    existing = await db.restaurants.find_one({"id": restaurant_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-    
-    restaurant_update.pop("_id", None)
-    restaurant_update.pop("id", None)
-    restaurant_update.pop("created_at", None)
-    
-    if restaurant_update:
-        restaurant_update["updated_at"] = datetime.now(timezone.utc)
-        await db.restaurants.update_one({"id": restaurant_id}, {"$set": restaurant_update})
-    
-    updated = await db.restaurants.find_one({"id": restaurant_id}, {"_id": 0})
-    return updated
-
-
-@api_router.delete("/restaurants/{restaurant_id}", status_code=204)
-async def delete_restaurant(restaurant_id: str):
-    """Soft delete a restaurant"""
-    result = await db.restaurants.update_one(
-        {"id": restaurant_id},
-        {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-    return None
+    async def create(doc: dict):
+        try:
+            return await repository.create(doc)
+        except PartnerExists:
+            raise HTTPException(status_code=400, detail=f"{label} with this ID already exists")
 
+    async def update(partner_id: str, changes: dict):
+        try:
+            return await repository.update(partner_id, changes)
+        except PartnerNotFound:
+            raise HTTPException(status_code=404, detail=f"{label} not found")
 
-@api_router.post("/beach-clubs", response_model=dict, status_code=201)
-async def create_beach_club(beach_club: dict):
-    """Create a new beach club"""
-    existing = await db.beach_clubs.find_one({"id": beach_club.get("id")})
-    if existing:
-        raise HTTPException(status_code=400, detail="Beach club with this ID already exists")
-    
-    now = datetime.now(timezone.utc)
-    beach_club["type"] = "beach_club"
-    beach_club["is_active"] = True
-    beach_club["display_order"] = beach_club.get("display_order", 0)
-    beach_club["created_at"] = now
-    beach_club["updated_at"] = now
-    
-    await db.beach_clubs.insert_one(beach_club)
-    beach_club.pop("_id", None)
-    return beach_club
-
-
-@api_router.put("/beach-clubs/{beach_club_id}", response_model=dict)
-async def update_beach_club(beach_club_id: str, beach_club_update: dict):
-    """Update an existing beach club"""
-    existing = await db.beach_clubs.find_one({"id": beach_club_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Beach club not found")
-    
-    beach_club_update.pop("_id", None)
-    beach_club_update.pop("id", None)
-    beach_club_update.pop("created_at", None)
-    
-    if beach_club_update:
-        beach_club_update["updated_at"] = datetime.now(timezone.utc)
-        await db.beach_clubs.update_one({"id": beach_club_id}, {"$set": beach_club_update})
-    
-    updated = await db.beach_clubs.find_one({"id": beach_club_id}, {"_id": 0})
-    return updated
-
-
-@api_router.delete("/beach-clubs/{beach_club_id}", status_code=204)
-async def delete_beach_club(beach_club_id: str):
-    """Soft delete a beach club"""
-    result = await db.beach_clubs.update_one(
-        {"id": beach_club_id},
-        {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Beach club not found")
-    return None
+    async def delete(partner_id: str):
+        try:
+            await repository.delete(partner_id)
+        except PartnerNotFound:
+            raise HTTPException(status_code=404, detail=f"{label} not found")
+        return None
 
+    name = repository.collection_name
+    api_router.add_api_route(f"/{path}", create, methods=["POST"], response_model=dict, status_code=201,
+                             name=f"create_{name}", summary=f"Create a new {label.lower()}")
+    api_router.add_api_route(f"/{path}/{{partner_id}}", update, methods=["PUT"], response_model=dict,
+                             name=f"update_{name}", summary=f"Update an existing {label.lower()}")
+    api_router.add_api_route(f"/{path}/{{partner_id}}", delete, methods=["DELETE"], status_code=204,
+                             name=f"delete_{name}", summary=f"Soft delete a {label.lower()}")
 
-@api_router.post("/cafe-bars", response_model=dict, status_code=201)
-async def create_cafe_bar(cafe_bar: dict):
-    """Create a new café/bar"""
-    existing = await db.cafe_bars.find_one({"id": cafe_bar.get("id")})
-    if existing:
-        raise HTTPException(status_code=400, detail="Café/Bar with this ID already exists")
-    
-    now = datetime.now(timezone.utc)
-    cafe_bar["type"] = "cafe_bar"
-    cafe_bar["is_active"] = True
-    cafe_bar["display_order"] = cafe_bar.get("display_order", 0)
-    cafe_bar["created_at"] = now
-    cafe_bar["updated_at"] = now
-    
-    await db.cafe_bars.insert_one(cafe_bar)
-    cafe_bar.pop("_id", None)
-    return cafe_bar
-
-
-@api_router.put("/cafe-bars/{cafe_bar_id}", response_model=dict)
-async def update_cafe_bar(cafe_bar_id: str, cafe_bar_update: dict):
-    """Update an existing café/bar"""
-    existing = await db.cafe_bars.find_one({"id": cafe_bar_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Café/Bar not found")
-    
-    cafe_bar_update.pop("_id", None)
-    cafe_bar_update.pop("id", None)
-    cafe_bar_update.pop("created_at", None)
-    
-    if cafe_bar_update:
-        cafe_bar_update["updated_at"] = datetime.now(timezone.utc)
-        await db.cafe_bars.update_one({"id": cafe_bar_id}, {"$set": cafe_bar_update})
-    
-    updated = await db.cafe_bars.find_one({"id": cafe_bar_id}, {"_id": 0})
-    return updated
-
-
-@api_router.delete("/cafe-bars/{cafe_bar_id}", status_code=204)
-async def delete_cafe_bar(cafe_bar_id: str):
-    """Soft delete a café/bar"""
-    result = await db.cafe_bars.update_one(
-        {"id": cafe_bar_id},
-        {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}}
-    )
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Café/Bar not found")
-    return None
 
+# Keyed by URL path segment, also used by /admin/{collection}/reorder
+catalog_repositories = {
+    "golf-courses": golf_course_repository,
+    "hotels": partner_repositories["hotel"],
+    "restaurants": partner_repositories["restaurant"],
+    "beach-clubs": partner_repositories["beach_club"],
+    "cafe-bars": partner_repositories["cafe_bar"],
+}
+for _path, _repository in catalog_repositories.items():
+    add_catalog_crud_routes(_path, _repository)
 
-# Fuzzy matching helper for search
-def _fuzzy_match(query: str, text: str) -> bool:
-    """Check if query approximately matches any word in text (Levenshtein distance).
-    Threshold scales with word length: 1 for 4-6 chars, 2 for 7+ chars."""
-    if not query or not text:
-        return False
-    query_words = query.split()
-    text_words = text.split()
-    for qw in query_words:
-        if len(qw) < 4:
-            continue
-        max_dist = 1 if len(qw) < 7 else 2
-        for tw in text_words:
-            if len(tw) < 3:
-                continue
-            if abs(len(qw) - len(tw)) > max_dist:
-                continue
-            if len(qw) <= len(tw):
-                short, long_ = qw, tw
-            else:
-                short, long_ = tw, qw
-            distances = list(range(len(short) + 1))
-            for c2 in long_:
-                new_distances = [distances[0] + 1]
-                for i1, c1 in enumerate(short):
-                    if c1 == c2:
-                        new_distances.append(distances[i1])
-                    else:
-                        new_distances.append(1 + min(distances[i1], distances[i1 + 1], new_distances[-1]))
-                distances = new_distances
-            if distances[-1] <= max_dist:
-                return True
-    return False
 
 # Combined search endpoint for all partners
 @api_router.get("/search")
-async def search_partners(q: str = "", category: str = "all"):
+async def search_partners(q: str = "", category: str = "all", lang: Optional[str] = None):
     """Search across all partner types with fuzzy matching"""
     query = q.lower().strip()
+    lang = normalize_lang(lang)
     
     # Results grouped by priority
     golf_results = []
     hotel_results = []
     other_results = []
     
-    # Define collections to search
-    collections = {
-        "golf": db.golf_courses,
-        "hotel": db.hotels,
-        "restaurant": db.restaurants,
-        "beach_club": db.beach_clubs,
-        "cafe_bar": db.cafe_bars
-    }
+    # If category is specified, only search that partner type
+    partner_types = None
+    if category != "all" and category in search_index.sources:
+        partner_types = [category]
     
-    # If category is specified, only search that collection
-    if category != "all" and category in collections:
-        collections = {category: collections[category]}
+    matches = await search_index.search(query, partner_types)
     
-    for partner_type, collection in collections.items():
-        items = await collection.find({"is_active": True}, {"_id": 0}).to_list(100)
-        
+    for partner_type, items in matches.items():
         for item in items:
-            # Search in name and location
-            name = item.get("name", "").lower()
-            location = item.get("location", "").lower()
+            result_item = {
+                "id": item.get("id"),
+                "type": partner_type,
+                "name": item.get("name"),
+                "location": item.get("location"),
+                "image": item.get("image"),
+                "description": project_language(item, lang).get("description"),
+                "booking_url": item.get("booking_url") or item.get("contact_url"),
+                "price_from": item.get("price_from"),
+                "offer_price": item.get("offer_price"),
+                "discount_percent": item.get("discount_percent"),
+                "michelin_stars": item.get("michelin_stars"),
+                "category": item.get("category"),
+            }
             
-            # Search in description (which might be multilingual)
-            description = item.get("description", {})
-            if isinstance(description, dict):
-                desc_text = " ".join([str(v).lower() for v in description.values()])
+            # Sort into priority groups
+            if partner_type == "golf":
+                golf_results.append(result_item)
+            elif partner_type == "hotel":
+                hotel_results.append(result_item)
             else:
-                desc_text = str(description).lower()
-            
-            # Check exact substring match first, then fuzzy match on name/location
-            if not query or query in name or query in location or query in desc_text or _fuzzy_match(query, name) or _fuzzy_match(query, location):
-                result_item = {
-                    "id": item.get("id"),
-                    "type": partner_type,
-                    "name": item.get("name"),
-                    "location": item.get("location"),
-                    "image": item.get("image"),
-                    "description": item.get("description"),
-                    "booking_url": item.get("booking_url") or item.get("contact_url"),
-                    "price_from": item.get("price_from"),
-                    "offer_price": item.get("offer_price"),
-                    "discount_percent": item.get("discount_percent"),
-                    "michelin_stars": item.get("michelin_stars"),
-                    "category": item.get("category"),
-                }
-                
-                # Sort into priority groups
-                if partner_type == "golf":
-                    golf_results.append(result_item)
-                elif partner_type == "hotel":
-                    hotel_results.append(result_item)
-                else:
-                    other_results.append(result_item)
+                other_results.append(result_item)
     
     # Shuffle the "other" results to mix restaurants, beach clubs, cafes
-    import random
     random.shuffle(other_results)
     
     # Static page results for landing pages
@@ -1103,7 +877,7 @@ async def search_partners(q: str = "", category: str = "all"):
         page_desc = page["description"]["en"].lower()
         if not query or query in page_name or query in page_keywords or query in page_desc:
             result_copy = {k: v for k, v in page.items() if k != "keywords"}
-            matching_pages.append(result_copy)
+            matching_pages.append(project_language(result_copy, lang))
 
     # Combine: Pages first, Golf second, Hotels third, then mixed others
     results = matching_pages + golf_results + hotel_results + other_results
@@ -1115,35 +889,34 @@ async def search_partners(q: str = "", category: str = "all"):
         "category": category
     }
 
-@api_router.get("/all-partners", response_model=dict)
-async def get_all_partners():
-    """Get all partners grouped by type (includes inactive for greyed-out display)"""
-    golf_courses = await db.golf_courses.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-    hotels = await db.hotels.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-    restaurants = await db.restaurants.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-    beach_clubs = await db.beach_clubs.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-    cafe_bars = await db.cafe_bars.find({}, {"_id": 0}).sort("display_order", 1).to_list(200)
-    
+def _build_all_partners(golf_courses, hotels, restaurants, beach_clubs, cafe_bars, overrides, lang=None) -> dict:
+    """Group catalog snapshots by type, applying fallbacks and image overrides (never mutates the inputs)."""
     # Fallback to hardcoded data if collections are empty
     if not golf_courses:
-        golf_courses = GOLF_COURSES
+        golf_courses = static.golf_courses()
     if not hotels:
-        hotels = [o for o in PARTNER_OFFERS if o["type"] == "hotel"]
+        hotels = static.partner_offers("hotel")
     if not restaurants:
-        restaurants = [o for o in PARTNER_OFFERS if o["type"] == "restaurant"]
+        restaurants = static.partner_offers("restaurant")
     if not beach_clubs:
-        beach_clubs = [o for o in PARTNER_OFFERS if o["type"] == "beach_club"]
+        beach_clubs = static.partner_offers("beach_club")
     if not cafe_bars:
-        cafe_bars = [o for o in PARTNER_OFFERS if o["type"] == "cafe_bar"]
+        cafe_bars = static.partner_offers("cafe_bar")
     
     # Apply image overrides from DB
-    overrides = await db.image_overrides.find({}, {"_id": 0}).to_list(500)
-    if overrides:
-        override_map = {o["partner_id"]: o["image"] for o in overrides}
-        for collection in [golf_courses, hotels, restaurants, beach_clubs, cafe_bars]:
-            for item in collection:
-                if item.get("id") in override_map:
-                    item["image"] = override_map[item["id"]]
+    override_map = {
+        o["partner_id"]: {"image": o["image"], **({"image_srcset": o["image_srcset"]} if o.get("image_srcset") else {})}
+        for o in overrides
+    }
+    
+    def with_overrides(items):
+        if override_map:
+            items = [{**item, **override_map[item["id"]]} if item.get("id") in override_map else item for item in items]
+        return project_list(items, lang)
+    
+    golf_courses, hotels, restaurants, beach_clubs, cafe_bars = (
+        with_overrides(items) for items in (golf_courses, hotels, restaurants, beach_clubs, cafe_bars)
+    )
     
     return {
         "golf_courses": golf_courses,
@@ -1155,59 +928,94 @@ async def get_all_partners():
     }
 
 
+@api_router.get("/all-partners", response_model=dict)
+async def get_all_partners(request: Request, lang: Optional[str] = None):
+    """Get all partners grouped by type (includes inactive for greyed-out display).
+    Served as a pre-serialized body with an ETag; clients sending If-None-Match get a 304.
+    With ?lang= only that language's texts are returned (English fallback)."""
+    lang = normalize_lang(lang)
+    sources = await asyncio.gather(
+        catalog_cache.get("golf_courses"),
+        catalog_cache.get("hotels"),
+        catalog_cache.get("restaurants"),
+        catalog_cache.get("beach_clubs"),
+        catalog_cache.get("cafe_bars"),
+        catalog_cache.get("image_overrides"),
+    )
+    snapshot = catalog_snapshots.get(("all-partners", lang), sources, lambda: _build_all_partners(*sources, lang=lang))
+    return snapshot_response(request, snapshot)
+
+
 # Admin: Update partner image
 @api_router.patch("/admin/partner/{partner_id}/image")
-async def update_partner_image(partner_id: str, body: dict):
-    """Update a partner's image URL"""
+async def update_partner_image(partner_id: str, body: dict, request: Request):
+    """Update a partner's image URL (admin only: external URLs are fetched by the mirror)"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
     image_url = body.get("image")
     if not image_url:
         raise HTTPException(status_code=400, detail="image URL is required")
+    # Uploaded images with generated variants get a srcset for the card grids
+    image_srcset = None
+    if image_url.startswith("/api/images/"):
+        manifest = await image_pipeline.manifest(image_url[len("/api/images/"):])
+        if manifest:
+            image_srcset = build_srcset(image_url, manifest)
+    # External URLs are served as-is until the mirror has a local copy
+    update = {"$set": {"image": image_url, "image_srcset": image_srcset, "image_source": None}}
     # Update in the actual collection
     for coll_name in ['hotels', 'restaurants', 'beach_clubs', 'cafe_bars', 'golf_courses']:
-        result = await db[coll_name].update_one({"id": partner_id}, {"$set": {"image": image_url}})
+        result = await db[coll_name].update_one({"id": partner_id}, update)
         if result.modified_count > 0:
-            return {"status": "ok", "partner_id": partner_id, "collection": coll_name}
+            catalog_cache.invalidate(coll_name)
+            await image_mirror.enqueue(image_url)
+            return {"status": "ok", "partner_id": partner_id, "collection": coll_name, "image_srcset": image_srcset}
     # Fallback: store override for hardcoded data
     await db.image_overrides.update_one(
         {"partner_id": partner_id},
-        {"$set": {"partner_id": partner_id, "image": image_url}},
+        {"$set": {"partner_id": partner_id, "image": image_url, "image_srcset": image_srcset, "image_source": None}},
         upsert=True
     )
-    return {"status": "ok", "partner_id": partner_id}
+    catalog_cache.invalidate("image_overrides")
+    await image_mirror.enqueue(image_url)
+    return {"status": "ok", "partner_id": partner_id, "image_srcset": image_srcset}
 
 
 @api_router.post("/admin/hotels/resequence")
 async def resequence_hotels():
     """Manually re-sequence hotel display_order to 1..N, removing duplicates and zeros.
     Preserves current relative ordering (sorted by current display_order asc, then created_at)."""
-    hotels = await db.hotels.find({}, {"_id": 0, "id": 1, "display_order": 1, "created_at": 1}).to_list(500)
-    if not hotels:
-        return {"status": "ok", "updated": 0, "total": 0}
+    result = await partner_repositories["hotel"].resequence()
+    return {"status": "ok", **result}
 
-    def sort_key(h):
-        order = h.get("display_order") or 0
-        if order == 0:
-            order = 999999
-        created = h.get("created_at") or datetime.min.replace(tzinfo=timezone.utc)
-        return (order, created)
 
-    hotels_sorted = sorted(hotels, key=sort_key)
-    updated = 0
-    now = datetime.now(timezone.utc)
-    for idx, h in enumerate(hotels_sorted, start=1):
-        if h.get("display_order") != idx:
-            await db.hotels.update_one(
-                {"id": h["id"]},
-                {"$set": {"display_order": idx, "updated_at": now}}
-            )
-            updated += 1
-    return {"status": "ok", "updated": updated, "total": len(hotels_sorted)}
+@api_router.post("/admin/{collection}/reorder")
+async def reorder_catalog(collection: str, body: ReorderRequest, request: Request):
+    """Admin: set display_order 1..N for `ids` in the given order (golf-courses, hotels, restaurants,
+    beach-clubs, cafe-bars). Only changed positions are written, in one bulk write."""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    repository = catalog_repositories.get(collection)
+    if repository is None:
+        raise HTTPException(status_code=404, detail="Unknown catalog collection")
+    try:
+        result = await repository.reorder(body.ids, transaction=body.transaction)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TransactionsUnsupported:
+        raise HTTPException(status_code=409, detail="Transactions require a MongoDB replica set")
+    return {"status": "ok", **result}
 
 
 # Admin: Upload partner image file
 @api_router.post("/admin/upload-image")
-async def upload_partner_image(file: UploadFile = File(...)):
-    """Upload an image to object storage and return the serve URL"""
+async def upload_partner_image(request: Request, file: UploadFile = File(...)):
+    """Upload an image to object storage with its resized variants and return the serve URL"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
     allowed = {'image/jpeg', 'image/png', 'image/webp', 'image/gif'}
     if file.content_type not in allowed:
         raise HTTPException(status_code=400, detail="Only JPEG, PNG, WebP, and GIF images are allowed")
@@ -1216,17 +1024,80 @@ async def upload_partner_image(file: UploadFile = File(...)):
     data = await file.read()
     if len(data) > 10 * 1024 * 1024:
         raise HTTPException(status_code=400, detail="File too large (max 10MB)")
-    result = await asyncio.to_thread(put_object, storage_path, data, file.content_type)
-    serve_url = f"/api/images/{result['path']}"
-    return {"url": serve_url, "path": result["path"]}
+    try:
+        manifest = await image_pipeline.ingest(data, file.content_type, storage_path)
+    except UnidentifiedImageError:
+        raise HTTPException(status_code=400, detail="File is not a valid image")
+    except Image.DecompressionBombError:
+        raise HTTPException(status_code=400, detail="Image dimensions too large")
+    except StorageError as e:
+        logger.error(f"Image upload failed: {e}")
+        raise HTTPException(status_code=502, detail="Image storage unavailable")
+    serve_url = f"/api/images/{manifest['path']}"
+    return {
+        "url": serve_url,
+        "path": manifest["path"],
+        "width": manifest["width"],
+        "height": manifest["height"],
+        "srcset": build_srcset(serve_url, manifest),
+    }
 
 
 # Serve uploaded images from object storage
 @api_router.get("/images/{path:path}")
-async def serve_image(path: str):
-    """Serve an image from object storage"""
-    data, content_type = await asyncio.to_thread(get_object, path)
-    return Response(content=data, media_type=content_type, headers={"Cache-Control": "public, max-age=31536000"})
+async def serve_image(path: str, request: Request, w: Optional[int] = Query(None, ge=1, le=4096)):
+    """Serve an image from object storage through the local memory/disk cache.
+
+    Images with generated variants are negotiated: the smallest variant at
+    least `w` pixels wide in the best format the Accept header allows (AVIF,
+    then WebP), else the original.
+    """
+    manifest = await image_pipeline.manifest(path)
+    variant = choose_variant(manifest, request.headers.get("accept"), w) if manifest else None
+    try:
+        entry = await image_cache.get(variant["path"] if variant else path)
+    except ObjectNotFound:
+        raise HTTPException(status_code=404, detail="Image not found")
+    except StorageError as e:
+        logger.error(f"Image fetch failed: {e}")
+        raise HTTPException(status_code=502, detail="Image storage unavailable")
+    return image_response(request, entry, vary="Accept" if manifest and manifest.get("variants") else None)
+
+
+@api_router.get("/admin/image-cache")
+async def get_image_cache_stats(request: Request):
+    """Admin: image cache hit/miss counters and memory/disk usage"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return image_cache.stats()
+
+
+@api_router.get("/admin/migrations")
+async def get_migration_status(request: Request):
+    """Admin: every data migration with its status and result"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await migration_runner.status()
+
+
+@api_router.get("/admin/image-mirrors")
+async def get_image_mirror_report(request: Request):
+    """Admin: mirrored partner images by status, and every broken source with its partners"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await image_mirror.report()
+
+
+@api_router.post("/admin/image-mirrors/check")
+async def check_image_mirrors(request: Request):
+    """Admin: rescan the catalog for external images and re-check every mirror now"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await image_mirror.check_all()
 
 
 
@@ -1269,8 +1140,8 @@ ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
 @api_router.post("/upload-image")
-async def upload_image(file: UploadFile = File(...)):
-    """Upload an image file and return the URL"""
+async def upload_image(request: Request, file: UploadFile = File(...)):
+    """Upload an image file and return the URL (resized variants for signed-in users only)"""
     
     # Check file extension
     file_ext = Path(file.filename).suffix.lower()
@@ -1287,15 +1158,39 @@ async def upload_image(file: UploadFile = File(...)):
     if len(content) > MAX_FILE_SIZE:
         raise HTTPException(status_code=400, detail="File too large. Maximum size is 10MB")
     
+    # Strip EXIF (process pool). Encoding variants costs seconds of CPU, so
+    # anonymous uploads skip them; only WebP is listed below, so no AVIF either
+    with_variants = await get_current_user(request) is not None
+    try:
+        processed = await image_pipeline.process(content, variants=with_variants, avif=False)
+    except UnidentifiedImageError:
+        raise HTTPException(status_code=400, detail="File is not a valid image")
+    except Image.DecompressionBombError:
+        raise HTTPException(status_code=400, detail="Image dimensions too large")
+    if processed["original"]:
+        content = processed["original"][0]
+    
     # Generate unique filename
     unique_id = str(uuid.uuid4())[:8]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     safe_filename = f"{timestamp}_{unique_id}{file_ext}"
-    
-    # Save file
-    file_path = UPLOADS_DIR / safe_filename
-    with open(file_path, "wb") as f:
-        f.write(content)
+    stem = safe_filename.rsplit(".", 1)[0]
+    
+    # Static files cannot negotiate by Accept, so only WebP variants are listed
+    files = {safe_filename: content}
+    srcset = []
+    for variant in processed["variants"]:
+        if variant["format"] == "webp":
+            variant_name = f"{stem}_w{variant['width']}.webp"
+            files[variant_name] = variant["data"]
+            srcset.append(f"/api/uploads/{variant_name} {variant['width']}w")
+    
+    # Save files
+    def write_files():
+        for name, data in files.items():
+            with open(UPLOADS_DIR / name, "wb") as f:
+                f.write(data)
+    await asyncio.to_thread(write_files)
     
     # Return the URL (relative to API)
     # The frontend will prepend the BACKEND_URL automatically when displaying
@@ -1305,7 +1200,8 @@ async def upload_image(file: UploadFile = File(...)):
         "success": True,
         "filename": safe_filename,
         "url": image_url,
-        "size": len(content)
+        "size": len(content),
+        "srcset": ", ".join(srcset) or None,
     }
 
 
@@ -1322,6 +1218,9 @@ async def delete_uploaded_image(filename: str):
         raise HTTPException(status_code=400, detail="Invalid filename")
     
     file_path.unlink()
+    # Resized variants written alongside it on upload
+    for variant_path in UPLOADS_DIR.glob(f"{file_path.stem}_w*.webp"):
+        variant_path.unlink(missing_ok=True)
     return {"success": True, "message": "Image deleted"}
 
 @api_router.post("/contact", response_model=ContactInquiry)
@@ -1332,8 +1231,8 @@ async def create_contact_inquiry(inquiry: ContactInquiryCreate):
     
     await db.contact_inquiries.insert_one(doc)
     
-    # Send notification email to admin (non-blocking)
-    asyncio.create_task(send_contact_notification_email(inquiry))
+    # Notify the admin (queued, sent by the outbox workers)
+    await send_contact_notification_email(inquiry_obj)
     
     return inquiry_obj
 
@@ -1353,9 +1252,9 @@ async def create_trip_request(request: TripPlannerRequest):
     doc['created_at'] = doc['created_at'].isoformat()
     await db.trip_planner_requests.insert_one(doc)
     
-    # Send notification email to admin + confirmation to customer
-    asyncio.create_task(send_trip_planner_email(entry))
-    asyncio.create_task(send_trip_planner_confirmation(entry))
+    # Queue the notification email to admin + confirmation to customer
+    await send_trip_planner_email(entry)
+    await send_trip_planner_confirmation(entry)
     
     return {"id": entry.id, "status": "received", "message": "Your trip request has been received! We'll get back to you shortly."}
 
@@ -1364,188 +1263,122 @@ async def get_trip_requests():
     requests = await db.trip_planner_requests.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
     return requests
 
+TRIP_SCHEDULE_LABELS = {'transfer_arrival': 'Arrival Pickup', 'transfer_departure': 'Departure Pickup', 'restaurant': 'Dinner Reservation', 'beach_club': 'Beach Club'}
+
+def _trip_date_display(entry: TripPlannerEntry) -> str:
+    if entry.departure_date:
+        return f"{entry.date} → {entry.departure_date}"
+    return entry.date
+
+def _trip_schedule_rows(entry: TripPlannerEntry) -> List[tuple]:
+    """(label, "date time") rows for every scheduled item that has a date or time."""
+    rows = []
+    for key, val in (entry.schedule or {}).items():
+        if val and (val.get('date') or val.get('time')):
+            label = TRIP_SCHEDULE_LABELS.get(key, key.replace('_', ' ').title())
+            rows.append((label, f"{val.get('date', '')} {val.get('time', '')}".strip() or 'TBD'))
+    return rows
+
 async def send_trip_planner_email(entry: TripPlannerEntry):
-    """Send notification email when a new trip planner request is received."""
-    try:
-        services_html = ""
-        if entry.group_type:
-            group_label = "Golf Society" if entry.group_type == "society" else "Friends Golf Trip"
-            services_html += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Group Type</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{group_label}</td></tr>'
-        if entry.group_name:
-            services_html += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Group Name</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{entry.group_name}</td></tr>'
-        if entry.preferred_hotel:
-            services_html += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Hotel</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{entry.preferred_hotel}</td></tr>'
-        if entry.preferred_restaurant:
-            services_html += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Restaurant</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{entry.preferred_restaurant}</td></tr>'
-        if entry.preferred_beach_club:
-            services_html += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Beach Club</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{entry.preferred_beach_club}</td></tr>'
-        if entry.transfer_pickup:
-            transfer_info = f"{entry.transfer_pickup} → {entry.transfer_dropoff or 'TBD'}"
-            if entry.transfer_type:
-                type_labels = {'sedan': 'Mercedes S-Class', 'minibus': 'Luxury Minibus', 'coach': 'Premium Coach'}
-                transfer_info += f" ({type_labels.get(entry.transfer_type, entry.transfer_type)})"
-            services_html += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Transfer</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{transfer_info}</td></tr>'
-        
-        special_requests_html = ""
-        if entry.special_requests:
-            special_requests_html = '<div style="margin-top: 20px; padding: 16px; background-color: #F5F2EB; border-radius: 8px;"><p style="color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; margin: 0 0 4px 0;">Special Requests</p><p style="color: #2D2D2D; font-size: 14px; margin: 0;">' + entry.special_requests + '</p></div>'
-
-        date_display = entry.date
-        if entry.departure_date:
-            date_display = f"{entry.date} → {entry.departure_date}"
-
-        schedule_labels = {'transfer_arrival': 'Arrival Pickup', 'transfer_departure': 'Departure Pickup', 'restaurant': 'Dinner Reservation', 'beach_club': 'Beach Club'}
-        schedule_rows = ''
-        if entry.schedule:
-            for key, val in entry.schedule.items():
-                if val and (val.get('date') or val.get('time')):
-                    label = schedule_labels.get(key, key.replace('_', ' ').title())
-                    detail = f"{val.get('date', '')} {val.get('time', '')}".strip() or 'TBD'
-                    schedule_rows += f'<tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">{label}</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;">{detail}</td></tr>'
-
-        logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
-        html_content = f"""
-        <html>
-        <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-        <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-                <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                    <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-                </div>
-                <div style="background: linear-gradient(135deg, #6B7B8C 0%, #7D8D9C 100%); padding: 14px 30px; text-align: center;">
-                    <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 12px; letter-spacing: 2px;">NEW TRIP PLANNER REQUEST</p>
-                </div>
-                <div style="background-color: white; padding: 40px 30px; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 140px;">Name</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{entry.name}</td></tr>
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Email</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;">{entry.email}</td></tr>
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Phone</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;"><a href="tel:{entry.phone}" style="color: #2D2D2D !important; text-decoration: none !important;">{entry.phone or 'N/A'}</a></td></tr>
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Date</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{date_display}</td></tr>
-                        {schedule_rows}
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Group Size</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;">{entry.group_size} people</td></tr>
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Services</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px;">{', '.join(entry.services)}</td></tr>
-                        <tr><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Budget</td><td style="padding: 12px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 15px; font-weight: 500;">{entry.budget or 'N/A'}</td></tr>
-                        {services_html}
-                    </table>
-                    {special_requests_html}
-                </div>
-                <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                    <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.7) !important; text-decoration: none !important;">golfinmallorca.com</a></p>
-                    <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 8px 0 0 0;"><a href="mailto:contact@golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">contact@golfinmallorca.com</a> | <a href="tel:+34620987575" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">+34 620 987 575</a></p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        params = {
-            "from": SENDER_EMAIL,
-            "to": [SENDER_EMAIL],
-            "subject": f"{'GOLF GROUP: ' if entry.group_type else ''}Trip Planner: {entry.name} - {', '.join(entry.services)}",
-            "html": html_content,
-        }
-        await asyncio.to_thread(resend.Emails.send, params)
-    except Exception as e:
-        print(f"Error sending trip planner email: {e}")
+    """Queue the admin notification for a new trip planner request."""
+    detail_rows = []
+    if entry.group_type:
+        group_label = "Golf Society" if entry.group_type == "society" else "Friends Golf Trip"
+        detail_rows.append(("Group Type", group_label))
+    if entry.group_name:
+        detail_rows.append(("Group Name", entry.group_name))
+    if entry.preferred_hotel:
+        detail_rows.append(("Hotel", entry.preferred_hotel))
+    if entry.preferred_restaurant:
+        detail_rows.append(("Restaurant", entry.preferred_restaurant))
+    if entry.preferred_beach_club:
+        detail_rows.append(("Beach Club", entry.preferred_beach_club))
+    if entry.transfer_pickup:
+        transfer_info = f"{entry.transfer_pickup} → {entry.transfer_dropoff or 'TBD'}"
+        if entry.transfer_type:
+            type_labels = {'sedan': 'Mercedes S-Class', 'minibus': 'Luxury Minibus', 'coach': 'Premium Coach'}
+            transfer_info += f" ({type_labels.get(entry.transfer_type, entry.transfer_type)})"
+        detail_rows.append(("Transfer", transfer_info))
+
+    html_content = email_templates.render(
+        "trip_planner_admin",
+        entry=entry,
+        date_display=_trip_date_display(entry),
+        schedule_rows=_trip_schedule_rows(entry),
+        detail_rows=detail_rows,
+    )
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=[SENDER_EMAIL],
+        subject=f"{'GOLF GROUP: ' if entry.group_type else ''}Trip Planner: {entry.name} - {', '.join(entry.services)}",
+        html=html_content,
+        dedup_key=f"trip-planner-admin-{entry.id}",
+        kind="trip_planner_admin",
+    )
 
 async def send_trip_planner_confirmation(entry: TripPlannerEntry):
-    """Send confirmation email to the customer."""
-    try:
-        service_names = []
-        for s in entry.services:
-            if s == 'hotel':
-                service_names.append('Hotel Stay')
-            elif s == 'restaurant':
-                service_names.append('Michelin Dining')
-            elif s == 'beach_club':
-                service_names.append('Beach Club')
-            elif s == 'transfer':
-                service_names.append('Premium Transfer')
-
-        details_rows = ""
-        if entry.preferred_hotel:
-            details_rows += f'<tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Hotel</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{entry.preferred_hotel}</td></tr>'
-        if entry.preferred_restaurant:
-            details_rows += f'<tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Restaurant</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{entry.preferred_restaurant}</td></tr>'
-        if entry.preferred_beach_club:
-            details_rows += f'<tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Beach Club</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{entry.preferred_beach_club}</td></tr>'
-        if entry.transfer_pickup:
-            details_rows += f'<tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Transfer</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{entry.transfer_pickup} → {entry.transfer_dropoff or "TBD"}</td></tr>'
-
-        budget_map = {'moderate': '€1,000 – €2,500', 'premium': '€2,500 – €4,000', 'luxury': '€4,000+'}
-        budget_display = budget_map.get(entry.budget, 'N/A')
-        group_word = 'person' if entry.group_size == 1 else 'people'
-        date_display = entry.date
-        if entry.departure_date:
-            date_display = f"{entry.date} → {entry.departure_date}"
-
-        schedule_labels = {'transfer_arrival': 'Arrival Pickup', 'transfer_departure': 'Departure Pickup', 'restaurant': 'Dinner Reservation', 'beach_club': 'Beach Club'}
-        schedule_rows = ''
-        if entry.schedule:
-            for key, val in entry.schedule.items():
-                if val and (val.get('date') or val.get('time')):
-                    label = schedule_labels.get(key, key.replace('_', ' ').title())
-                    detail = f"{val.get('date', '')} {val.get('time', '')}".strip() or 'TBD'
-                    schedule_rows += f'<tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">{label}</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px;">{detail}</td></tr>'
-
-        logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
-        html_content = f"""
-        <html>
-        <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-        <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-                <!-- Header with logo -->
-                <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                    <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-                </div>
-
-                <!-- Greeting -->
-                <div style="background-color: #ffffff; padding: 30px 30px 10px 30px;">
-                    <h1 style="color: #2D2D2D; font-size: 22px; margin: 0 0 8px 0;">Thank you, {entry.name}!</h1>
-                    <p style="color: #6B7B8C; font-size: 15px; line-height: 1.6; margin: 0;">We've received your request and our team will get back to you within 24 hours with a personalised plan.</p>
-                </div>
-
-                <!-- Request Summary -->
-                <div style="background-color: #ffffff; padding: 10px 30px 30px 30px;">
-                    <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 16px;">
-                        <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">Your Request Summary</p>
-                        <table style="width: 100%; border-collapse: collapse;">
-                            <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px; width: 120px;">Services</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{', '.join(service_names)}</td></tr>
-                            <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Budget</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{budget_display}</td></tr>
-                            <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Date</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{date_display}</td></tr>
-                            {schedule_rows}
-                            <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Group</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px;">{entry.group_size} {group_word}</td></tr>
-                            {details_rows}
-                        </table>
-                    </div>
-                </div>
-
-                <!-- Footer -->
-                <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                    <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Questions? Reply to this email or contact us at</p>
-                    <a href="mailto:contact@golfinmallorca.com" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">contact@golfinmallorca.com</a>
-                    <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> — Your Gateway to Luxury Golf in Mallorca</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        params = {
-            "from": SENDER_EMAIL,
-            "to": [entry.email],
-            "subject": "Your Trip Request Confirmation — golfinmallorca.com",
-            "html": html_content,
-        }
-        await asyncio.to_thread(resend.Emails.send, params)
-    except Exception as e:
-        print(f"Error sending trip confirmation email: {e}")
+    """Queue the confirmation email to the customer."""
+    service_names = []
+    for s in entry.services:
+        if s == 'hotel':
+            service_names.append('Hotel Stay')
+        elif s == 'restaurant':
+            service_names.append('Michelin Dining')
+        elif s == 'beach_club':
+            service_names.append('Beach Club')
+        elif s == 'transfer':
+            service_names.append('Premium Transfer')
+
+    detail_rows = []
+    if entry.preferred_hotel:
+        detail_rows.append(("Hotel", entry.preferred_hotel))
+    if entry.preferred_restaurant:
+        detail_rows.append(("Restaurant", entry.preferred_restaurant))
+    if entry.preferred_beach_club:
+        detail_rows.append(("Beach Club", entry.preferred_beach_club))
+    if entry.transfer_pickup:
+        detail_rows.append(("Transfer", f"{entry.transfer_pickup} → {entry.transfer_dropoff or 'TBD'}"))
+
+    budget_map = {'moderate': '€1,000 – €2,500', 'premium': '€2,500 – €4,000', 'luxury': '€4,000+'}
+    html_content = email_templates.render(
+        "trip_planner_confirmation",
+        entry=entry,
+        service_names=service_names,
+        budget_display=budget_map.get(entry.budget, 'N/A'),
+        group_word='person' if entry.group_size == 1 else 'people',
+        date_display=_trip_date_display(entry),
+        schedule_rows=_trip_schedule_rows(entry),
+        detail_rows=detail_rows,
+    )
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=[entry.email],
+        subject="Your Trip Request Confirmation — golfinmallorca.com",
+        html=html_content,
+        dedup_key=f"trip-planner-confirmation-{entry.id}",
+        kind="trip_planner_confirmation",
+    )
+
 
 
+def render_newsletter_html(subject: str, message: str) -> str:
+    """HTML body of a bulk newsletter email (identical for every recipient)."""
+    return email_templates.render("newsletter", subject=subject, message=message)
+
+
+def send_newsletter_batch(params: List[dict], idempotency_key: str):
+    """One Resend batch call; invalid recipients are reported per index instead of failing the batch."""
+    return resend.Batch.send(params, {"idempotency_key": idempotency_key, "batch_validation": "permissive"})
+
+
+newsletter_dispatcher = NewsletterDispatcher(db, send_newsletter_batch)
+subscriber_importer = SubscriberImporter(db)
+
 
 # Newsletter endpoints
 @api_router.post("/newsletter", response_model=NewsletterSubscription)
 async def subscribe_newsletter(subscription: NewsletterSubscriptionCreate):
+    subscription.email = normalize_email(subscription.email)
     # Check if email already exists
     existing = await db.newsletter_subscriptions.find_one({"email": subscription.email})
     if existing:
@@ -1555,10 +1388,14 @@ async def subscribe_newsletter(subscription: NewsletterSubscriptionCreate):
     doc = subscription_obj.model_dump()
     doc['subscribed_at'] = doc['subscribed_at'].isoformat()
     
-    await db.newsletter_subscriptions.insert_one(doc)
+    try:
+        await db.newsletter_subscriptions.insert_one(doc)
+    except DuplicateKeyError:
+        # A concurrent subscribe of the same address won the unique index
+        raise HTTPException(status_code=400, detail="Email already subscribed")
     
-    # Send welcome email to subscriber (non-blocking)
-    asyncio.create_task(send_newsletter_welcome_email(subscription.name, subscription.email))
+    # Queue the welcome email to the subscriber
+    await send_newsletter_welcome_email(subscription_obj)
     
     return subscription_obj
 
@@ -1590,21 +1427,25 @@ async def add_subscriber_manual(request: Request, name: str = "", email: str = "
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
+    email = normalize_email(email)
     # Check if email exists
-    existing = await db.newsletter_subscriptions.find_one({"email": email.lower()})
+    existing = await db.newsletter_subscriptions.find_one({"email": email})
     if existing:
         raise HTTPException(status_code=400, detail="Email already subscribed")
     
     subscription = {
         "id": str(uuid.uuid4()),
-        "email": email.lower(),
+        "email": email,
         "name": name,
         "country": country,
         "subscribed_at": datetime.now(timezone.utc).isoformat(),
         "is_active": True
     }
     
-    await db.newsletter_subscriptions.insert_one(subscription)
+    try:
+        await db.newsletter_subscriptions.insert_one(subscription)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already subscribed")
     if "_id" in subscription:
         del subscription["_id"]
     
@@ -1612,68 +1453,29 @@ async def add_subscriber_manual(request: Request, name: str = "", email: str = "
 
 @api_router.post("/newsletter/import-csv")
 async def import_subscribers_csv(request: Request, file: UploadFile = File(...)):
-    """Import subscribers from CSV file (admin only)."""
+    """Import subscribers from a CSV file in the background (admin only); returns the import id."""
     user = await get_current_user(request)
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
-    import csv
-    import io
-    
-    content = await file.read()
-    decoded = content.decode('utf-8')
-    
-    reader = csv.DictReader(io.StringIO(decoded))
-    
-    imported = 0
-    skipped = 0
-    errors = []
-    
-    for row in reader:
-        # Try to find email, name, country columns (flexible naming)
-        email = row.get('email') or row.get('Email') or row.get('EMAIL') or row.get('e-mail') or ''
-        name = row.get('name') or row.get('Name') or row.get('NAME') or row.get('first_name', '') + ' ' + row.get('last_name', '') or ''
-        country = row.get('country') or row.get('Country') or row.get('COUNTRY') or ''
-        
-        email = email.strip().lower()
-        name = name.strip()
-        country = country.strip()
-        
-        if not email or '@' not in email:
-            skipped += 1
-            continue
-        
-        # Check if exists
-        existing = await db.newsletter_subscriptions.find_one({"email": email})
-        if existing:
-            skipped += 1
-            continue
-        
-        subscription = {
-            "id": str(uuid.uuid4()),
-            "email": email,
-            "name": name or "Subscriber",
-            "country": country or "Unknown",
-            "subscribed_at": datetime.now(timezone.utc).isoformat(),
-            "is_active": True
-        }
-        
-        try:
-            await db.newsletter_subscriptions.insert_one(subscription)
-            imported += 1
-        except Exception as e:
-            errors.append(f"{email}: {str(e)}")
+    job = await subscriber_importer.start(file, created_by=user.email)
+    return {"success": True, **job}
+
+@api_router.get("/newsletter/import-csv/{import_id}")
+async def get_subscriber_import(import_id: str, request: Request):
+    """Progress, counts and per-row errors of a CSV import (admin only)."""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
     
-    return {
-        "success": True,
-        "imported": imported,
-        "skipped": skipped,
-        "errors": errors[:10]  # Limit errors shown
-    }
+    job = await subscriber_importer.progress(import_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return {"success": job["status"] != "failed", **job}
 
 @api_router.post("/newsletter/send-bulk")
 async def send_bulk_email(request: Request, subject: str = "", message: str = ""):
-    """Send bulk email to all active subscribers (admin only)."""
+    """Queue a bulk email to all active subscribers (admin only); returns the job id immediately."""
     user = await get_current_user(request)
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -1681,76 +1483,74 @@ async def send_bulk_email(request: Request, subject: str = "", message: str = ""
     if not subject or not message:
         raise HTTPException(status_code=400, detail="Subject and message are required")
     
-    # Get all active subscribers
-    subscribers = await db.newsletter_subscriptions.find({"is_active": True}, {"_id": 0}).to_list(10000)
-    
-    if not subscribers:
+    job = await newsletter_dispatcher.create_job(
+        subject=subject,
+        html=render_newsletter_html(subject, message),
+        sender=SENDER_EMAIL,
+        created_by=user.email,
+    )
+    if not job:
         raise HTTPException(status_code=400, detail="No active subscribers found")
     
-    sent = 0
-    failed = 0
-    
-    for sub in subscribers:
-        try:
-            logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
-            html_content = f"""
-            <html>
-            <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-            <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-                    <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                        <img src="{logo_url}" alt="golfinmallorca.com" style="width: 200px; height: auto; display: block; margin: 0 auto;" />
-                    </div>
-                    <div style="background: linear-gradient(135deg, #6B7B8C 0%, #7D8D9C 100%); padding: 14px 30px; text-align: center;">
-                        <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 13px; font-style: italic;">Your Gateway to Luxury Golf in Mallorca</p>
-                    </div>
-                    
-                    <div style="background-color: white; padding: 40px 30px; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
-                        <h2 style="color: #2D2D2D; font-size: 22px; margin: 0 0 20px 0; font-weight: 500;">{subject}</h2>
-                        
-                        <div style="color: #57534E; font-size: 15px; line-height: 1.7;">
-                            {message.replace(chr(10), '<br>')}
-                        </div>
-                        
-                        <div style="text-align: center; margin: 32px 0;">
-                            <a href="https://golfinmallorca.greenfee365.com" style="display: inline-block; background-color: #6B7B8C; color: white; padding: 16px 40px; text-decoration: none; border-radius: 8px; font-weight: 600; font-size: 14px; letter-spacing: 0.5px;">Book Your Tee Time</a>
-                        </div>
-                    </div>
-                    
-                    <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                        <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Questions? Contact us at</p>
-                        <a href="mailto:contact@golfinmallorca.com" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">contact@golfinmallorca.com</a>
-                        <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> &mdash; Your Gateway to Luxury Golf in Mallorca</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-            """
-            
-            params = {
-                "from": SENDER_EMAIL,
-                "to": [sub["email"]],
-                "subject": subject,
-                "html": html_content
-            }
-            
-            await asyncio.to_thread(resend.Emails.send, params)
-            sent += 1
-            
-            # Small delay to avoid rate limiting
-            await asyncio.sleep(0.1)
-            
-        except Exception as e:
-            logging.error(f"Failed to send to {sub['email']}: {e}")
-            failed += 1
-    
     return {
         "success": True,
-        "sent": sent,
-        "failed": failed,
-        "total_subscribers": len(subscribers)
+        "job_id": job["id"],
+        "status": job["status"],
+        "total_subscribers": job["total"]
     }
 
+@api_router.get("/newsletter/jobs")
+async def list_newsletter_jobs(request: Request):
+    """Recent bulk email jobs with their progress (admin only)."""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    jobs = await db.newsletter_jobs.find(
+        {}, {"_id": 0, "html": 0, "lease_owner": 0}
+    ).sort("created_at", -1).to_list(20)
+    for job in jobs:
+        job["pending"] = job["total"] - job["sent"] - job["failed"]
+    return jobs
+
+@api_router.get("/newsletter/jobs/{job_id}")
+async def get_newsletter_job(job_id: str, request: Request):
+    """Progress of a bulk email job (admin only)."""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    job = await newsletter_dispatcher.progress(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@api_router.get("/newsletter/jobs/{job_id}/deliveries")
+async def get_newsletter_job_deliveries(job_id: str, request: Request, status: str = "failed"):
+    """Per-recipient delivery status of a bulk email job, filtered by status (admin only)."""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    return await db.newsletter_deliveries.find(
+        {"job_id": job_id, "status": status}, {"_id": 0}
+    ).sort("seq", 1).to_list(1000)
+
+@api_router.post("/newsletter/jobs/{job_id}/resume")
+async def resume_newsletter_job(job_id: str, request: Request):
+    """Resume an interrupted bulk email job; only still-pending recipients are sent (admin only)."""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    
+    job = await newsletter_dispatcher.progress(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] == "completed":
+        return job
+    newsletter_dispatcher.start(job_id)
+    return {**job, "resumed": True}
+
 @api_router.delete("/contact/{contact_id}")
 async def delete_contact_inquiry(contact_id: str, request: Request):
     """Delete a contact inquiry (admin only)."""
@@ -1766,38 +1566,135 @@ async def delete_contact_inquiry(contact_id: str, request: Request):
 
 # Blog endpoints
 @api_router.get("/blog", response_model=List[dict])
-async def get_blog_posts(category: Optional[str] = None):
-    posts = BLOG_POSTS
-    if category:
-        posts = [p for p in posts if p["category"] == category]
-    return sorted(posts, key=lambda x: x["created_at"], reverse=True)
+async def get_blog_posts(request: Request, category: Optional[str] = None, tag: Optional[str] = None,
+                         lang: Optional[str] = None):
+    """Newest-first post summaries (no `content`; see /blog/{slug}), optionally by category and/or tag"""
+    lang = normalize_lang(lang)
+    blog_store = await blog_posts.store()
+    # Unknown filters never reach the snapshot cache, so its keys stay bounded
+    if category and not blog_store.summaries(category=category):
+        return []
+    if tag:
+        tag = tag.lower()
+        if not blog_store.summaries(tag=tag):
+            return []
+    
+    def build():
+        return project_list(blog_store.summaries(category=category, tag=tag), lang)
+    
+    # The summaries list is replaced on every load, which invalidates the snapshots
+    snapshot = catalog_snapshots.get(("blog", category, tag, lang), [blog_store.summaries()], build)
+    return snapshot_response(request, snapshot)
 
 @api_router.get("/blog/{slug}", response_model=dict)
-async def get_blog_post(slug: str):
-    for post in BLOG_POSTS:
-        if post["slug"] == slug:
-            return post
-    raise HTTPException(status_code=404, detail="Blog post not found")
+async def get_blog_post(slug: str, lang: Optional[str] = None):
+    lang = normalize_lang(lang)
+    post = (await blog_posts.store()).get(slug)
+    if post is None:
+        raise HTTPException(status_code=404, detail="Blog post not found")
+    return project_language(post, lang)
+
+
+# Admin: blog CMS (drafts included)
+@api_router.get("/admin/blog")
+async def admin_list_blog_posts(request: Request):
+    """Admin: every post without its body, newest first"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await blog_posts.list_all()
+
+
+@api_router.get("/admin/blog/{slug}")
+async def admin_get_blog_post(slug: str, request: Request):
+    """Admin: one post with all languages, published or not"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        return await blog_posts.get_any(slug)
+    except BlogPostNotFound:
+        raise HTTPException(status_code=404, detail="Blog post not found")
+
+
+@api_router.post("/admin/blog", status_code=201)
+async def admin_create_blog_post(post: BlogPostCreate, request: Request):
+    """Admin: publish (or save as draft with published=false) a new post"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        return await blog_posts.create(post.model_dump())
+    except BlogPostExists:
+        raise HTTPException(status_code=400, detail="Blog post with this slug already exists")
+
+
+@api_router.put("/admin/blog/{slug}")
+async def admin_update_blog_post(slug: str, changes: dict, request: Request):
+    """Admin: update fields of a post (set published to publish/unpublish)"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        changes = BlogPostUpdate.model_validate(changes).model_dump(exclude_unset=True)
+    except ValidationError as e:
+        fields = sorted({".".join(str(part) for part in error["loc"]) for error in e.errors()})
+        raise HTTPException(status_code=400, detail=f"Invalid blog post fields: {', '.join(fields)}")
+    try:
+        return await blog_posts.update(slug, changes)
+    except BlogPostNotFound:
+        raise HTTPException(status_code=404, detail="Blog post not found")
+    except BlogPostExists:
+        raise HTTPException(status_code=400, detail="Blog post with this slug already exists")
+
+
+@api_router.delete("/admin/blog/{slug}", status_code=204)
+async def admin_delete_blog_post(slug: str, request: Request):
+    """Admin: delete a post"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    try:
+        await blog_posts.delete(slug)
+    except BlogPostNotFound:
+        raise HTTPException(status_code=404, detail="Blog post not found")
+    return None
 
 # Review endpoints
-@api_router.get("/reviews", response_model=List[dict])
-async def get_reviews(limit: Optional[int] = None, country: Optional[str] = None, platform: Optional[str] = None):
-    """Get all reviews with optional filters."""
-    reviews = REVIEWS_DATA.copy()
-    
-    if country:
-        reviews = [r for r in reviews if r["country"].lower() == country.lower()]
-    if platform:
-        reviews = [r for r in reviews if r["platform"].lower() == platform.lower()]
-    if limit:
-        reviews = reviews[:limit]
-    
-    return reviews
+@api_router.get("/reviews", response_model=Union[List[dict], ReviewPage])
+async def get_reviews(
+    country: Optional[str] = None,
+    platform: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+):
+    """Get all public reviews (static dataset and approved user reviews)
+    in id order, with optional country/platform filters. limit alone returns the
+    first `limit` reviews as a plain list, as before. Passing cursor (empty for
+    the first page) switches to {"items": [...], "next_cursor": ...} pages of
+    `limit` reviews."""
+    after = None
+    if cursor:
+        try:
+            (after,) = decode_key(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not isinstance(after, int) or isinstance(after, bool):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    index = await review_feed.index()
+    if cursor is None:
+        reviews = index.select(country, platform)
+        return Response(content=orjson.dumps(reviews[:limit] if limit else reviews), media_type="application/json")
+    page, last_id = index.page(country, platform, after, limit or DEFAULT_PAGE_SIZE)
+    return Response(
+        content=orjson.dumps({"items": page, "next_cursor": encode_key([last_id]) if last_id is not None else None}),
+        media_type="application/json",
+    )
 
 @api_router.post("/reviews", response_model=dict)
 async def create_review(review: ClientReviewCreate):
     """Submit a new review."""
-    new_id = max(r["id"] for r in REVIEWS_DATA) + 1
+    new_id = await review_feed.ids.next()
     review_data = {
         "id": new_id,
         "user_name": review.user_name,
@@ -1805,59 +1702,34 @@ async def create_review(review: ClientReviewCreate):
         "platform": review.platform,
         "rating": review.rating,
         "language": review.language,
-        "review_text": review.review_text
+        "review_text": review.review_text,
+        "created_at": datetime.now(timezone.utc).isoformat()
     }
     await db.reviews.insert_one(review_data)
+    await review_stats.add(review_data)
+    # Unmoderated: stored with a unique id but never part of the public stream
     return {"message": "Review submitted successfully!", "id": new_id}
 
 @api_router.post("/reviews/submit", response_model=dict)
 async def submit_user_review(review: UserReviewSubmission, request: Request):
     """Submit a review from authenticated user (requires login, pending admin approval)."""
     # Get user from session
-    session_token = request.cookies.get("session_token")
-    if not session_token:
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            session_token = auth_header[7:]
-    
+    session_token = session_token_from_request(request)
     if not session_token:
         raise HTTPException(status_code=401, detail="Authentication required. Please sign in with Google to submit a review.")
-    
-    # Find session
-    session_doc = await db.user_sessions.find_one(
-        {"session_token": session_token},
-        {"_id": 0}
-    )
-    
-    if not session_doc:
-        raise HTTPException(status_code=401, detail="Session not found. Please sign in again.")
-    
-    # Check session expiry
-    expires_at = session_doc["expires_at"]
-    if isinstance(expires_at, str):
-        expires_at = datetime.fromisoformat(expires_at)
-    if expires_at.tzinfo is None:
-        expires_at = expires_at.replace(tzinfo=timezone.utc)
-    if expires_at < datetime.now(timezone.utc):
-        raise HTTPException(status_code=401, detail="Session expired. Please sign in again.")
-    
-    # Get user
-    user_doc = await db.users.find_one(
-        {"user_id": session_doc["user_id"]},
-        {"_id": 0}
-    )
-    
-    if not user_doc:
-        raise HTTPException(status_code=401, detail="User not found.")
+    try:
+        user = await resolve_session(session_token)
+    except SessionInvalid as e:
+        raise HTTPException(status_code=401, detail=str(e))
     
     # Create the review
     review_id = f"review_{uuid.uuid4().hex[:12]}"
     review_doc = {
         "review_id": review_id,
-        "user_id": user_doc["user_id"],
-        "user_name": user_doc["name"],
-        "user_email": user_doc["email"],
-        "user_picture": user_doc.get("picture"),
+        "user_id": user.user_id,
+        "user_name": user.name,
+        "user_email": user.email,
+        "user_picture": user.picture,
         "rating": review.rating,
         "review_text": review.review_text,
         "platform": review.platform,
@@ -1888,60 +1760,65 @@ async def get_pending_reviews(request: Request):
 @api_router.put("/reviews/{review_id}/approve", response_model=dict)
 async def approve_review(review_id: str):
     """Approve a pending review (admin only)."""
-    result = await db.user_reviews.update_one(
+    previous = await db.user_reviews.find_one_and_update(
         {"review_id": review_id},
-        {"$set": {"status": "approved", "reviewed_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"status": "approved", "reviewed_at": datetime.now(timezone.utc).isoformat()}},
+        projection={"_id": 0, "id": 1, "status": 1, "rating": 1, "country": 1, "platform": 1},
+        return_document=ReturnDocument.BEFORE,
     )
     
-    if result.modified_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Review not found")
+    # Approved reviews join the public stream under an allocated id, kept on re-approval
+    assigned = False
+    if previous.get("id") is None:
+        result = await db.user_reviews.update_one(
+            {"review_id": review_id, "id": {"$exists": False}},
+            {"$set": {"id": await review_feed.ids.next()}},
+        )
+        assigned = result.modified_count > 0
+    # Only the transition into "approved" counts (the update is atomic, so a
+    # concurrent second approval sees status "approved" here)
+    if previous.get("status") != "approved":
+        await review_stats.add(previous)
+    if previous.get("status") != "approved" or assigned:
+        await review_feed.changed()
     
     return {"message": "Review approved", "review_id": review_id}
 
 @api_router.put("/reviews/{review_id}/reject", response_model=dict)
 async def reject_review(review_id: str):
     """Reject a pending review (admin only)."""
-    result = await db.user_reviews.update_one(
+    previous = await db.user_reviews.find_one_and_update(
         {"review_id": review_id},
-        {"$set": {"status": "rejected", "reviewed_at": datetime.now(timezone.utc).isoformat()}}
+        {"$set": {"status": "rejected", "reviewed_at": datetime.now(timezone.utc).isoformat()}},
+        projection={"_id": 0, "status": 1, "rating": 1, "country": 1, "platform": 1},
+        return_document=ReturnDocument.BEFORE,
     )
     
-    if result.modified_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Review not found")
+    # Rejecting a published review takes it out of the stats
+    if previous.get("status") == "approved":
+        await review_stats.remove(previous)
+        await review_feed.changed()
     
     return {"message": "Review rejected", "review_id": review_id}
 
 @api_router.get("/reviews/stats", response_model=dict)
 async def get_review_stats():
-    """Get review statistics."""
-    reviews = REVIEWS_DATA
-    
-    if not reviews:
-        return {"average_rating": 0, "total_reviews": 0, "rating_distribution": {}, "by_country": {}, "by_platform": {}}
-    
-    total = len(reviews)
-    avg = sum(r["rating"] for r in reviews) / total
-    distribution = {i: len([r for r in reviews if r["rating"] == i]) for i in range(1, 6)}
-    
-    # Count by country
-    by_country = {}
-    for r in reviews:
-        country = r["country"]
-        by_country[country] = by_country.get(country, 0) + 1
-    
-    # Count by platform
-    by_platform = {}
-    for r in reviews:
-        platform = r["platform"]
-        by_platform[platform] = by_platform.get(platform, 0) + 1
-    
-    return {
-        "average_rating": round(avg, 1),
-        "total_reviews": total,
-        "rating_distribution": distribution,
-        "by_country": by_country,
-        "by_platform": by_platform
-    }
+    """Get review statistics (static dataset, client reviews and approved user reviews)."""
+    return await review_stats.read()
+
+
+@api_router.post("/admin/reviews/stats/rebuild", response_model=dict)
+async def rebuild_review_stats(request: Request):
+    """Admin: recompute the review counters from every review"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    await review_stats.rebuild(static.reviews())
+    return await review_stats.read()
 
 
 # ─── Stripe Payment Endpoints ─────────────────────────────────────────────────
@@ -1965,142 +1842,54 @@ CURRENCY_SYMBOLS = {"eur": "\u20AC", "gbp": "\u00A3", "usd": "$"}
 
 
 async def send_payment_link_email(payment: dict, payment_link: str):
-    """Send payment link to customer"""
-    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
+    """Queue the payment link email to the customer"""
     sym = CURRENCY_SYMBOLS.get(payment["currency"], payment["currency"].upper())
     stype = "Package Payment" if payment["service_type"] == "package" else "Reservation Deposit"
-    html = f"""
-    <html><head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head><body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-    <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-        <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-            <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-        </div>
-        <div style="background: linear-gradient(135deg, #6B7B8C 0%, #7D8D9C 100%); padding: 14px 30px; text-align: center;">
-            <p style="color: rgba(255,255,255,0.9); margin: 0; font-size: 12px; letter-spacing: 2px;">{stype.upper()}</p>
-        </div>
-        <div style="background-color: white; padding: 40px 30px; border-radius: 0 0 16px 16px; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
-            <p style="color: #2D2D2D; font-size: 16px; margin: 0 0 8px;">Hello {payment["customer_name"]},</p>
-            <p style="color: #6B7B8C; font-size: 14px; line-height: 1.6; margin: 0 0 24px;">
-                A payment request has been created for you by Golf in Mallorca.
-            </p>
-            <div style="background-color: #F5F2EB; padding: 20px; border-radius: 8px; margin-bottom: 24px;">
-                <p style="color: #6B7B8C; font-size: 11px; text-transform: uppercase; letter-spacing: 1px; margin: 0 0 4px;">Description</p>
-                <p style="color: #2D2D2D; font-size: 15px; font-weight: 500; margin: 0 0 12px;">{payment["description"]}</p>
-                <p style="color: #6B7B8C; font-size: 11px; text-transform: uppercase; letter-spacing: 1px; margin: 0 0 4px;">Amount</p>
-                <p style="color: #2D2D2D; font-size: 24px; font-weight: 700; margin: 0;">{sym}{payment["amount"]:.2f}</p>
-            </div>
-            <div style="text-align: center;">
-                <a href="{payment_link}" style="display: inline-block; background-color: #6B7B8C; color: white; text-decoration: none; padding: 14px 40px; border-radius: 8px; font-size: 14px; font-weight: 600;">Pay Now</a>
-            </div>
-            <p style="color: #9CA3AF; font-size: 12px; text-align: center; margin: 20px 0 0;">
-                Or copy this link: <a href="{payment_link}" style="color: #3D3D3D !important; text-decoration: none !important;">{payment_link}</a>
-            </p>
-        </div>
-        <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-            <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Secure payment powered by Stripe</p>
-            <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 8px 0 0 0;"><a href="mailto:contact@golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">contact@golfinmallorca.com</a> | <a href="tel:+34620987575" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">+34 620 987 575</a></p>
-        </div>
-    </div></body></html>"""
-    try:
-        await asyncio.to_thread(resend.Emails.send, {
-            "from": SENDER_EMAIL,
-            "to": [payment["customer_email"]],
-            "subject": f"Payment Request from Golf in Mallorca - {sym}{payment['amount']:.2f}",
-            "html": html,
-        })
-        logger.info(f"Payment link email sent to {payment['customer_email']}")
-    except Exception as e:
-        logger.error(f"Failed to send payment link email: {e}")
+    html = email_templates.render(
+        "payment_link",
+        payment=payment,
+        payment_link=payment_link,
+        service_label=stype,
+        amount=f"{sym}{payment['amount']:.2f}",
+    )
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=[payment["customer_email"]],
+        subject=f"Payment Request from Golf in Mallorca - {sym}{payment['amount']:.2f}",
+        html=html,
+        dedup_key=f"payment-link-{payment['payment_id']}",
+        kind="payment_link",
+    )
 
 
 async def send_payment_confirmation_emails(payment: dict):
-    """Send confirmation emails to both admin and customer after successful payment"""
-    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
+    """Queue confirmation emails to both admin and customer after successful payment.
+
+    Keyed by payment_id, so the status poll and the Stripe webhook racing to
+    mark the same payment as paid still produce one pair of emails.
+    """
     sym = CURRENCY_SYMBOLS.get(payment.get("currency", "eur"), "EUR")
     stype = "Package Payment" if payment.get("service_type") == "package" else "Reservation Deposit"
-
-    # --- Email to ADMIN (Style B - notification with green subheader) ---
-    admin_html = f"""
-    <html><head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head><body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-    <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-        <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-            <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-        </div>
-        <div style="background: linear-gradient(135deg, #6B7B8C 0%, #7D8D9C 100%); padding: 14px 30px; text-align: center;">
-            <p style="color: white; margin: 0; font-size: 12px; letter-spacing: 2px;">PAYMENT RECEIVED</p>
-        </div>
-        <div style="background-color: white; padding: 40px 30px; box-shadow: 0 4px 20px rgba(0,0,0,0.08);">
-            <p style="color: #2D2D2D; font-size: 16px; font-weight: 600; margin: 0 0 20px;">
-                {payment.get("customer_name", "A customer")} just paid {sym}{payment.get("amount", 0):.2f}
-            </p>
-            <table style="width: 100%; border-collapse: collapse;">
-                <tr><td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px; width: 120px;">Customer</td>
-                    <td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 14px;">{payment.get("customer_name", "")}</td></tr>
-                <tr><td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Email</td>
-                    <td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 14px;">{payment.get("customer_email", "")}</td></tr>
-                <tr><td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Type</td>
-                    <td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 14px;">{stype}</td></tr>
-                <tr><td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Amount</td>
-                    <td style="padding: 10px 0; border-bottom: 1px solid #E5E5E5; color: #2D2D2D; font-size: 18px; font-weight: 700;">{sym}{payment.get("amount", 0):.2f}</td></tr>
-                <tr><td style="padding: 10px 0; color: #6B7B8C; font-size: 12px; text-transform: uppercase; letter-spacing: 1px;">Description</td>
-                    <td style="padding: 10px 0; color: #2D2D2D; font-size: 14px;">{payment.get("description", "")}</td></tr>
-            </table>
-        </div>
-        <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-            <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.7) !important; text-decoration: none !important;">golfinmallorca.com</a></p>
-            <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 8px 0 0 0;"><a href="mailto:contact@golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">contact@golfinmallorca.com</a> | <a href="tel:+34620987575" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">+34 620 987 575</a></p>
-        </div>
-    </div></body></html>"""
-
-    # --- Email to CUSTOMER (Style A - warm confirmation like trip planner) ---
-    customer_html = f"""
-    <html><head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head><body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-    <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-        <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-            <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-        </div>
-        <div style="background-color: #ffffff; padding: 30px 30px 10px 30px;">
-            <h1 style="color: #2D2D2D; font-size: 22px; margin: 0 0 8px 0;">Thank you, {payment.get("customer_name", "")}!</h1>
-            <p style="color: #6B7B8C; font-size: 15px; line-height: 1.6; margin: 0;">Your payment has been received successfully. Here's your receipt:</p>
-        </div>
-        <div style="background-color: #ffffff; padding: 10px 30px 30px 30px;">
-            <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 16px;">
-                <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">Payment Receipt</p>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px; width: 120px;">Description</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{payment.get("description", "")}</td></tr>
-                    <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Type</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{stype}</td></tr>
-                    <tr><td style="padding: 10px 0; color: #8B8680; font-size: 13px;">Amount Paid</td><td style="padding: 10px 0; color: #2D2D2D; font-size: 20px; font-weight: 700;">{sym}{payment.get("amount", 0):.2f}</td></tr>
-                </table>
-            </div>
-        </div>
-        <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-            <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Questions? Reply to this email or contact us at</p>
-            <a href="mailto:contact@golfinmallorca.com" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">contact@golfinmallorca.com</a>
-            <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> &mdash; Your Gateway to Luxury Golf in Mallorca</p>
-        </div>
-    </div></body></html>"""
-
-    try:
-        await asyncio.to_thread(resend.Emails.send, {
-            "from": SENDER_EMAIL,
-            "to": ["contact@golfinmallorca.com"],
-            "subject": f"Payment Received: {sym}{payment.get('amount', 0):.2f} from {payment.get('customer_name', 'Customer')}",
-            "html": admin_html,
-        })
-        logger.info("Payment confirmation sent to admin")
-    except Exception as e:
-        logger.error(f"Failed to send admin payment confirmation: {e}")
-
-    try:
-        await asyncio.to_thread(resend.Emails.send, {
-            "from": SENDER_EMAIL,
-            "to": [payment.get("customer_email")],
-            "subject": f"Payment Confirmation - Golf in Mallorca - {sym}{payment.get('amount', 0):.2f}",
-            "html": customer_html,
-        })
-        logger.info(f"Payment receipt sent to {payment.get('customer_email')}")
-    except Exception as e:
-        logger.error(f"Failed to send customer payment receipt: {e}")
+    amount = f"{sym}{payment.get('amount', 0):.2f}"
+    admin_html = email_templates.render("payment_received_admin", payment=payment, service_label=stype, amount=amount)
+    customer_html = email_templates.render("payment_receipt", payment=payment, service_label=stype, amount=amount)
+
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=["contact@golfinmallorca.com"],
+        subject=f"Payment Received: {sym}{payment.get('amount', 0):.2f} from {payment.get('customer_name', 'Customer')}",
+        html=admin_html,
+        dedup_key=f"payment-received-{payment['payment_id']}",
+        kind="payment_received_admin",
+    )
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=[payment.get("customer_email")],
+        subject=f"Payment Confirmation - Golf in Mallorca - {sym}{payment.get('amount', 0):.2f}",
+        html=customer_html,
+        dedup_key=f"payment-receipt-{payment['payment_id']}",
+        kind="payment_receipt",
+    )
 
 
 @api_router.post("/admin/payment-request")
@@ -2124,7 +1913,7 @@ async def create_payment_request(body: CreatePaymentRequest, request: Request):
     await db.payment_transactions.insert_one(doc)
     origin = request.headers.get("origin") or str(request.base_url).rstrip("/")
     payment_link = f"{origin}/pay/{payment_id}"
-    asyncio.create_task(send_payment_link_email(doc, payment_link))
+    await send_payment_link_email(doc, payment_link)
     return {
         "payment_id": payment_id,
         "status": "pending",
@@ -2252,7 +2041,7 @@ async def get_payment_status(session_id: str, request: Request):
         {"$set": update_fields}
     )
     if checkout_status.payment_status == "paid" and was_unpaid:
-        asyncio.create_task(send_payment_confirmation_emails(doc))
+        await send_payment_confirmation_emails(doc)
 
     return {
         "status": update_fields.get("status", doc["status"]),
@@ -2284,7 +2073,7 @@ async def stripe_webhook(request: Request):
             if result.modified_count > 0:
                 doc = await db.payment_transactions.find_one({"checkout_session_id": event.session_id}, {"_id": 0})
                 if doc:
-                    asyncio.create_task(send_payment_confirmation_emails(doc))
+                    await send_payment_confirmation_emails(doc)
     except Exception as e:
         logging.error(f"Webhook error: {e}")
     return {"status": "ok"}
@@ -2308,11 +2097,58 @@ async def create_booking_request(booking: BookingRequestCreate):
     booking_dict["created_at"] = datetime.now(timezone.utc).isoformat()
     await db.booking_requests.insert_one(booking_dict)
     booking_dict.pop("_id", None)
-    asyncio.create_task(send_booking_admin_email(booking_dict))
-    asyncio.create_task(send_booking_confirmation_email(booking_dict))
+    await send_booking_admin_email(booking_dict)
+    await send_booking_confirmation_email(booking_dict)
     return {"success": True, "id": booking_dict["id"], "message": "Booking request submitted successfully"}
 
 
+@api_router.get("/admin/indexes")
+async def get_index_report(request: Request):
+    """Admin: declared vs. actual indexes per collection (missing, non-unique, undeclared, unused)"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await index_report(db)
+
+
+@api_router.get("/admin/email-outbox")
+async def get_email_outbox_metrics(request: Request):
+    """Admin: outbox queue depth, send latency and delivery lag"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await email_outbox.metrics()
+
+
+@api_router.get("/admin/email-outbox/dead")
+async def list_dead_letter_emails(request: Request):
+    """Admin: emails that exhausted their retries, most recent first"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await email_outbox.dead_letters()
+
+
+@api_router.post("/admin/email-outbox/{message_id}/requeue")
+async def requeue_dead_letter_email(message_id: str, request: Request):
+    """Admin: retry a dead-lettered email"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not await email_outbox.requeue(message_id):
+        raise HTTPException(status_code=404, detail="Dead-lettered email not found")
+    return {"success": True, "id": message_id}
+
+
+@api_router.post("/admin/indexes/ensure")
+async def ensure_index_declarations(request: Request):
+    """Admin: (re)create declared indexes, e.g. after removing duplicates that blocked a unique index"""
+    user = await get_current_user(request)
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return await ensure_indexes(db)
+
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -2333,295 +2169,208 @@ logger = logging.getLogger(__name__)
 
 # ============ BOOKING REQUEST ============
 
-async def send_booking_admin_email(booking: dict):
-    """Send booking request notification to admin."""
-    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
-    is_hotel = booking.get("venue_type") == "hotel"
-    dietary_text = ", ".join(booking.get("dietary", [])) if booking.get("dietary") else "None"
-    allergies_text = booking.get("allergies", "") or "None"
-    special_text = booking.get("special_requests", "") or "None"
-    checkout_text = booking.get("date_checkout", "")
-
-    # Build date/time rows depending on venue type
+def _booking_date_rows(booking: dict, is_hotel: bool) -> List[tuple]:
     if is_hotel:
-        date_rows = f"""
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Check-in</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["date"]}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Check-out</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{checkout_text or 'Not specified'}</td></tr>"""
-    else:
-        date_rows = f"""
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Date</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["date"]}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Time</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking.get("time", "")}</td></tr>"""
+        return [("Check-in", booking["date"]), ("Check-out", booking.get("date_checkout", "") or 'Not specified')]
+    return [("Date", booking["date"]), ("Time", booking.get("time", ""))]
 
-    # Build dining-specific rows (only for non-hotel)
-    dining_rows = ""
-    if not is_hotel:
-        dining_rows = f"""
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Dietary</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px;">{dietary_text}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Allergies</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px;">{allergies_text}</td></tr>"""
 
+async def send_booking_admin_email(booking: dict):
+    """Queue the booking request notification to admin."""
+    is_hotel = booking.get("venue_type") == "hotel"
+    checkout_text = booking.get("date_checkout", "")
     request_label = "Hotel Inquiry" if is_hotel else "Booking Request"
-    html_content = f"""
-    <html>
-    <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-    <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-            <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-            </div>
-            <div style="background-color: #ffffff; padding: 30px 30px 10px 30px;">
-                <h1 style="color: #3D3D3D; font-size: 22px; margin: 0 0 8px 0;">New {request_label}</h1>
-                <p style="color: #6B7B8C; font-size: 15px; line-height: 1.6; margin: 0;">A new {request_label.lower()} has been submitted via golfinmallorca.com</p>
-            </div>
-            <div style="background-color: #ffffff; padding: 10px 30px 30px 30px;">
-                <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 16px;">
-                    <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">{'Inquiry' if is_hotel else 'Reservation'} Details</p>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px; width: 120px;">{'Hotel' if is_hotel else 'Venue'}</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["venue_name"]}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Type</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["venue_type"].replace("_", " ").title()}</td></tr>
-                        {date_rows}
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Guests</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["guests"]}</td></tr>
-                    </table>
-                </div>
-                <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 12px;">
-                    <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">Guest Information</p>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px; width: 120px;">Name</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["guest_name"]}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Email</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px;"><a href="mailto:{booking["guest_email"]}" style="color: #6B7B8C; text-decoration: none;">{booking["guest_email"]}</a></td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Phone</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px;"><a href="tel:{booking["guest_phone"]}" style="color: #6B7B8C; text-decoration: none;">{booking["guest_phone"]}</a></td></tr>
-                        {dining_rows}
-                        <tr><td style="padding: 10px 0; color: #8B8680; font-size: 13px;">Special Req.</td><td style="padding: 10px 0; color: #3D3D3D; font-size: 14px;">{special_text}</td></tr>
-                    </table>
-                </div>
-            </div>
-            <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Reply to this email or contact the guest directly</p>
-                <a href="mailto:{booking["guest_email"]}" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">{booking["guest_email"]}</a>
-                <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> — Your Gateway to Luxury Golf in Mallorca</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    try:
-        subject_date = booking["date"]
-        if is_hotel and checkout_text:
-            subject_date = f"{booking['date']} to {checkout_text}"
-        await asyncio.to_thread(resend.Emails.send, {
-            "from": SENDER_EMAIL,
-            "to": ["contact@golfinmallorca.com"],
-            "subject": f"{request_label}: {booking['venue_name']} - {subject_date} ({booking['guests']} guests)",
-            "html": html_content
-        })
-    except Exception as e:
-        logger.error(f"Failed to send booking admin email: {e}")
+    html_content = email_templates.render(
+        "booking_admin",
+        booking=booking,
+        is_hotel=is_hotel,
+        request_label=request_label,
+        date_rows=_booking_date_rows(booking, is_hotel),
+        dietary_text=", ".join(booking.get("dietary", [])) if booking.get("dietary") else "None",
+        allergies_text=booking.get("allergies", "") or "None",
+        special_text=booking.get("special_requests", "") or "None",
+    )
+    subject_date = booking["date"]
+    if is_hotel and checkout_text:
+        subject_date = f"{booking['date']} to {checkout_text}"
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=["contact@golfinmallorca.com"],
+        subject=f"{request_label}: {booking['venue_name']} - {subject_date} ({booking['guests']} guests)",
+        html=html_content,
+        dedup_key=f"booking-admin-{booking['id']}",
+        kind="booking_admin",
+    )
 
 
 async def send_booking_confirmation_email(booking: dict):
-    """Send confirmation email to the customer."""
-    logo_url = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
+    """Queue the booking confirmation email to the customer."""
     is_hotel = booking.get("venue_type") == "hotel"
-    checkout_text = booking.get("date_checkout", "")
+    html_content = email_templates.render(
+        "booking_confirmation",
+        booking=booking,
+        is_hotel=is_hotel,
+        date_rows=_booking_date_rows(booking, is_hotel),
+    )
+    subject_prefix = "Hotel Inquiry" if is_hotel else "Booking Request"
+    await email_outbox.enqueue(
+        sender=SENDER_EMAIL,
+        to=[booking["guest_email"]],
+        subject=f"{subject_prefix} Received - {booking['venue_name']} | golfinmallorca.com",
+        html=html_content,
+        dedup_key=f"booking-confirmation-{booking['id']}",
+        kind="booking_confirmation",
+    )
 
-    # Build date rows depending on venue type
-    if is_hotel:
-        date_rows = f"""
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Check-in</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["date"]}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Check-out</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{checkout_text or 'Not specified'}</td></tr>"""
-    else:
-        date_rows = f"""
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Date</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["date"]}</td></tr>
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px;">Time</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking.get("time", "")}</td></tr>"""
-
-    venue_label = "Hotel" if is_hotel else "Venue"
-    availability_text = "Availability is subject to confirmation by the hotel." if is_hotel else "All bookings are subject to the restaurant's availability."
-    confirmation_text = f"We will confirm your {'stay' if is_hotel else 'reservation'} within <strong>72 hours</strong>. In many cases, we'll get back to you much sooner."
-
-    html_content = f"""
-    <html>
-    <head><meta name="format-detection" content="telephone=no"><meta name="x-apple-disable-message-reformatting"></head>
-    <body style="font-family: 'Helvetica Neue', Arial, sans-serif; padding: 0; margin: 0; background-color: #F5F2EB;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 40px 20px;">
-            <div style="background-color: #ffffff; padding: 30px 40px; border-radius: 16px 16px 0 0; text-align: center; border-bottom: 2px solid #E5E5E5;">
-                <img src="{logo_url}" alt="golfinmallorca.com" style="width: 180px; height: auto; display: block; margin: 0 auto;" />
-            </div>
-            <div style="background-color: #ffffff; padding: 30px 30px 10px 30px;">
-                <h1 style="color: #3D3D3D; font-size: 22px; margin: 0 0 8px 0;">Thank you, {booking["guest_name"]}!</h1>
-                <p style="color: #6B7B8C; font-size: 15px; line-height: 1.6; margin: 0;">We've received your {'inquiry' if is_hotel else 'reservation request'} and our team will get back to you shortly.</p>
-            </div>
-            <div style="background-color: #ffffff; padding: 10px 30px 30px 30px;">
-                <div style="background-color: #F5F2EB; border-radius: 12px; padding: 24px; margin-top: 16px;">
-                    <p style="color: #8B8680; font-size: 11px; text-transform: uppercase; letter-spacing: 2px; margin: 0 0 16px 0;">Your {'Inquiry' if is_hotel else 'Reservation'} Details</p>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #8B8680; font-size: 13px; width: 120px;">{venue_label}</td><td style="padding: 10px 0; border-bottom: 1px solid #E8E4DD; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["venue_name"]}</td></tr>
-                        {date_rows}
-                        <tr><td style="padding: 10px 0; color: #8B8680; font-size: 13px;">Guests</td><td style="padding: 10px 0; color: #3D3D3D; font-size: 14px; font-weight: 500;">{booking["guests"]}</td></tr>
-                    </table>
-                </div>
-                <div style="background: linear-gradient(135deg, #6B7B8C 0%, #8B9BAC 100%); border-radius: 12px; padding: 24px; margin-top: 16px; text-align: center;">
-                    <p style="color: rgba(255,255,255,0.9); font-size: 14px; line-height: 1.6; margin: 0;">
-                        <strong>Please note:</strong> {availability_text} {confirmation_text}
-                    </p>
-                </div>
-                <p style="color: #8B8680; font-size: 13px; line-height: 1.6; margin-top: 20px; text-align: center;">
-                    If you have any questions, don't hesitate to contact us at<br/>
-                    <a href="mailto:contact@golfinmallorca.com" style="color: #6B7B8C; text-decoration: none;">contact@golfinmallorca.com</a> or
-                    <a href="tel:+34620987575" style="color: #6B7B8C; text-decoration: none;">+34 620 987 575</a>
-                </p>
-            </div>
-            <div style="background-color: #3D3D3D; padding: 24px 30px; border-radius: 0 0 16px 16px; text-align: center;">
-                <p style="color: rgba(255,255,255,0.7); font-size: 13px; margin: 0 0 4px 0;">Questions? Reply to this email or contact us at</p>
-                <a href="mailto:contact@golfinmallorca.com" style="color: #ffffff !important; font-size: 13px; text-decoration: none !important;">contact@golfinmallorca.com</a>
-                <p style="color: rgba(255,255,255,0.4); font-size: 11px; margin: 16px 0 0 0;"><a href="https://golfinmallorca.com" style="color: rgba(255,255,255,0.4) !important; text-decoration: none !important;">golfinmallorca.com</a> — Your Gateway to Luxury Golf in Mallorca</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    try:
-        subject_prefix = "Hotel Inquiry" if is_hotel else "Booking Request"
-        await asyncio.to_thread(resend.Emails.send, {
-            "from": SENDER_EMAIL,
-            "to": [booking["guest_email"]],
-            "subject": f"{subject_prefix} Received - {booking['venue_name']} | golfinmallorca.com",
-            "html": html_content
-        })
-    except Exception as e:
-        logger.error(f"Failed to send booking confirmation email: {e}")
 
+# ─── Data migrations (each runs once; see services/migrations.py) ─────────────
+
+async def seed_hotels(database) -> dict:
+    """Insert the hotels from seed_hotels.py after the existing ones and apply update_new_hotels.py."""
+    from seed_hotels import NEW_HOTELS
+    from update_new_hotels import HOTEL_UPDATES
+
+    # IDs the user has explicitly removed/deactivated — never re-insert these
+    excluded = {"st-regis-mallorca-resort"}
+    # Databases seeded before migrations were recorded: keep admin edits
+    if await database.hotels.count_documents({}) >= 59:
+        return {"skipped": "hotels already seeded"}
+
+    last = await database.hotels.find_one({}, {"_id": 0, "display_order": 1}, sort=[("display_order", -1)])
+    next_order = ((last or {}).get("display_order") or 0) + 1
+    now = datetime.now(timezone.utc)
+    updates = {
+        hotel_id: {"image": data["image"], "offer_price": data["offer_price"], "updated_at": now}
+        for hotel_id, data in HOTEL_UPDATES.items()
+    }
+    # New hotels get sequential display_order after the existing ones, already updated
+    hotels = [
+        {**hotel, **updates.get(hotel["id"], {}), "display_order": next_order + i}
+        for i, hotel in enumerate(h for h in NEW_HOTELS if h["id"] not in excluded)
+    ]
+    result = await database.hotels.bulk_write(
+        seed_upserts(hotels, defaults={"is_active": True, "created_at": now, "updated_at": now})
+        + seed_updates(updates, exclude=excluded),
+        ordered=False,
+    )
+    if result.upserted_count or result.modified_count:
+        catalog_cache.invalidate("hotels")
+    return {"added": result.upserted_count, "updated": result.modified_count}
+
+
+async def normalize_hotel_display_order(database) -> dict:
+    """Resequence hotel display_order 1..N: zero/missing positions go last, duplicates are split."""
+    return await partner_repositories["hotel"].resequence()
+
+
+async def seed_new_golf_courses(database) -> dict:
+    """Insert the golf courses from new_golf_courses.py (2026-04-23) that are missing."""
+    from new_golf_courses import NEW_GOLF_COURSES
+
+    now = datetime.now(timezone.utc)
+    result = await database.golf_courses.bulk_write(
+        seed_upserts(NEW_GOLF_COURSES, defaults={"is_active": True, "created_at": now, "updated_at": now}),
+        ordered=False,
+    )
+    if result.upserted_count:
+        catalog_cache.invalidate("golf_courses")
+    return {"added": result.upserted_count}
 
-@app.on_event("startup")
-async def ensure_hotels_seeded():
-    """Schedule hotel seed as background task so startup completes immediately (health-check safe)."""
-    async def _run_seed():
-        try:
-            from seed_hotels import NEW_HOTELS
-            from update_new_hotels import HOTEL_UPDATES
-
-            # IDs the user has explicitly removed/deactivated — never re-insert these
-            EXCLUDED_IDS = {"st-regis-mallorca-resort"}
-
-            existing_count = await db.hotels.count_documents({})
-            if existing_count >= 59:
-                logger.info(f"Hotels already seeded: {existing_count} found")
-                return
-
-            added = 0
-            for hotel in NEW_HOTELS:
-                if hotel["id"] in EXCLUDED_IDS:
-                    continue
-                found = await db.hotels.find_one({"id": hotel["id"]})
-                if not found:
-                    now = datetime.now(timezone.utc)
-                    # Auto-assign next display_order so new hotels get sequential numbering
-                    last = await db.hotels.find({}, {"display_order": 1}).sort("display_order", -1).limit(1).to_list(1)
-                    next_order = (last[0].get("display_order", 0) if last else 0) + 1
-                    doc = {**hotel, "is_active": True, "display_order": next_order, "created_at": now, "updated_at": now}
-                    await db.hotels.insert_one(doc)
-                    added += 1
-
-            updated = 0
-            for hotel_id, data in HOTEL_UPDATES.items():
-                if hotel_id in EXCLUDED_IDS:
-                    continue
-                result = await db.hotels.update_one(
-                    {"id": hotel_id},
-                    {"$set": {"image": data["image"], "offer_price": data["offer_price"], "updated_at": datetime.now(timezone.utc)}}
-                )
-                if result.modified_count > 0:
-                    updated += 1
-
-            final_count = await db.hotels.count_documents({})
-            logger.info(f"Hotel seed complete: added={added}, updated={updated}, total={final_count}")
-        except Exception as e:
-            logger.error(f"Hotel seed error: {e}")
 
-    asyncio.create_task(_run_seed())
+async def seed_blog_posts(database) -> dict:
+    """Insert the posts from data/blog_posts.py that are missing."""
+    from data.blog_posts import BLOG_POSTS
+
+    result = await database.blog_posts.bulk_write(seed_upserts(BLOG_POSTS), ordered=False)
+    if result.upserted_count:
+        await blog_posts.changed()
+    return {"added": result.upserted_count}
+
+
+
+async def seed_review_stats(database) -> dict:
+    """Initial review counters; afterwards they are maintained with $inc."""
+    return await review_stats.rebuild(static.reviews())
+
+
+
+async def assign_review_ids(database) -> dict:
+    """Replace the max()+1 ids of older client reviews and number approved user reviews."""
+    result = await review_feed.assign_ids()
+    # The unique id indexes could not be built at startup while duplicates existed
+    await ensure_indexes(database, {name: REQUIRED_INDEXES[name] for name in ("reviews", "user_reviews")})
+    return result
+
+
+async def dedupe_newsletter_emails(database) -> dict:
+    """Lower-case subscriber emails and drop case-variant duplicates."""
+    result = await dedupe_emails(database)
+    # The unique email index could not be built at startup while duplicates existed
+    await ensure_indexes(database, {"newsletter_subscriptions": REQUIRED_INDEXES["newsletter_subscriptions"]})
+    return result
+
+
+migration_runner = MigrationRunner(db, [
+    Migration("0001_seed_hotels", "Seed hotels and apply hotel image/price updates", seed_hotels),
+    Migration("0002_normalize_hotel_display_order", "Resequence hotel display_order to 1..N",
+              normalize_hotel_display_order),
+    Migration("0003_seed_new_golf_courses", "Seed the golf courses added on 2026-04-23", seed_new_golf_courses),
+    Migration("0004_seed_blog_posts", "Move the blog posts from data/partners.py into blog_posts", seed_blog_posts),
+    Migration("0005_seed_review_stats", "Build review_stats from the static and stored reviews", seed_review_stats),
+    Migration("0006_assign_review_ids", "Allocate unique ids to stored reviews", assign_review_ids),
+    Migration("0007_dedupe_newsletter_emails", "Lower-case subscriber emails and drop duplicates",
+              dedupe_newsletter_emails),
+])
 
 
 @app.on_event("startup")
-async def normalize_hotel_display_order():
-    """Resequence hotel display_order on startup:
-    - Fixes hotels with display_order=0 (missing/orphans) by pushing to end
-    - Fixes duplicate positions (two hotels sharing same order) by re-sequencing everything 1..N
-    Preserves current relative ordering as much as possible (sorted by current display_order, then created_at).
-    """
+async def run_migrations():
+    """Apply pending migrations in the background so startup completes immediately (health-check safe)."""
     async def _run():
         try:
-            # Fetch all hotels sorted by current order, then created_at for stable tie-break
-            hotels = await db.hotels.find(
-                {}, {"_id": 0, "id": 1, "display_order": 1, "created_at": 1}
-            ).to_list(500)
-            if not hotels:
-                return
-
-            # Check if resequencing is needed: any zero/missing OR any duplicate
-            orders = [h.get("display_order") or 0 for h in hotels]
-            has_zero_or_missing = any(o == 0 for o in orders)
-            has_duplicates = len(set(orders)) != len(orders)
-
-            if not has_zero_or_missing and not has_duplicates:
-                return  # Nothing to fix
-
-            # Sort: by display_order asc (but treat 0/None as infinity so they go to end), then created_at asc
-            def sort_key(h):
-                order = h.get("display_order") or 0
-                if order == 0:
-                    order = 999999  # push orphans to the end
-                created = h.get("created_at") or datetime.min.replace(tzinfo=timezone.utc)
-                return (order, created)
-
-            hotels_sorted = sorted(hotels, key=sort_key)
-
-            # Re-sequence 1..N
-            updated = 0
-            now = datetime.now(timezone.utc)
-            for idx, h in enumerate(hotels_sorted, start=1):
-                if h.get("display_order") != idx:
-                    await db.hotels.update_one(
-                        {"id": h["id"]},
-                        {"$set": {"display_order": idx, "updated_at": now}}
-                    )
-                    updated += 1
-
-            logger.info(
-                f"Hotel display_order normalized: resequenced {updated} hotels "
-                f"(had_zero={has_zero_or_missing}, had_duplicates={has_duplicates}, total={len(hotels_sorted)})"
-            )
+            await migration_runner.run()
         except Exception as e:
-            logger.error(f"Hotel display_order normalizer error: {e}")
+            logger.error(f"Migrations error: {e}")
 
     asyncio.create_task(_run())
 
 
 @app.on_event("startup")
-async def ensure_new_golf_courses_seeded():
-    """Schedule golf course seed as background task so startup completes immediately (health-check safe)."""
-    async def _run_seed():
-        try:
-            from new_golf_courses import NEW_GOLF_COURSES
-
-            # IDs the user has explicitly removed/deactivated — never re-insert these
-            EXCLUDED_IDS = set()
-
-            added = 0
-            for course in NEW_GOLF_COURSES:
-                if course["id"] in EXCLUDED_IDS:
-                    continue
-                found = await db.golf_courses.find_one({"id": course["id"]})
-                if not found:
-                    now = datetime.now(timezone.utc)
-                    doc = {**course, "is_active": True, "created_at": now, "updated_at": now}
-                    await db.golf_courses.insert_one(doc)
-                    added += 1
-
-            total = await db.golf_courses.count_documents({})
-            logger.info(f"Golf course seed check: new_added={added}, total={total}")
-        except Exception as e:
-            logger.error(f"Golf course seed error: {e}")
+async def ensure_required_indexes():
+    """Create the indexes declared in services/indexes.py (idempotent)."""
+    asyncio.create_task(ensure_indexes(db))
 
-    asyncio.create_task(_run_seed())
+
+@app.on_event("startup")
+async def start_email_outbox():
+    """Start the outbox workers; mail queued before a restart is sent now."""
+    email_outbox.start()
+
+
+@app.on_event("startup")
+async def start_image_mirror():
+    """Mirror external partner images and re-check them in the background."""
+    image_mirror.start()
+
+
+@app.on_event("startup")
+async def resume_newsletter_jobs():
+    """Pick up bulk email jobs abandoned by a restart or a failed run, now and periodically."""
+    newsletter_dispatcher.start_resuming()
+
+
+@app.on_event("startup")
+async def start_catalog_cache_watch():
+    """Invalidate the catalog cache from a MongoDB change stream (falls back to TTL expiry)."""
+    catalog_cache.start_watching()
 
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await catalog_cache.stop_watching()
+    await newsletter_dispatcher.stop()
+    await email_outbox.stop()
+    await image_mirror.stop()
+    await storage.aclose()
+    image_pipeline.shutdown()
     client.close()
@@ -0,0 +1,110 @@
+"""Blog posts stored in MongoDB behind a versioned in-memory cache.
+
+Posts live in the `blog_posts` collection (unique slug; published +
+created_at index for the public listing) and are edited through the admin
+API, so publishing no longer needs a deploy. Public reads are served from a
+`BlogStore` built from the published posts and held in a `VersionedCache`:
+every write bumps the version in `cache_versions`, the writing process
+reloads immediately and other processes notice within
+VERSION_CHECK_SECONDS.
+"""
+import os
+from datetime import datetime, timezone
+from typing import List
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from services.blog_store import BlogStore
+from services.cache_versions import VersionedCache
+
+VERSION_CHECK_SECONDS = float(os.environ.get("BLOG_VERSION_CHECK_SECONDS", "5"))
+VERSION_KEY = "blog_posts"
+# Never written from a request body
+PROTECTED_FIELDS = ("_id", "id", "created_at")
+
+
+class BlogPostExists(Exception):
+    pass
+
+
+class BlogPostNotFound(Exception):
+    pass
+
+
+def _timestamp() -> str:
+    # Same format as the seeded posts, so created_at sorts as one type
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class BlogPosts:
+    """Admin writes to `blog_posts` and the cached BlogStore of published posts."""
+
+    def __init__(self, database):
+        self._db = database
+        self._cache = VersionedCache(database, VERSION_KEY, self._load, check_seconds=VERSION_CHECK_SECONDS)
+
+    @property
+    def posts(self):
+        return self._db.blog_posts
+
+    # ─── Reads ────────────────────────────────────────────────────────────────
+
+    async def store(self) -> BlogStore:
+        """The published posts, reloaded when another process changed them."""
+        return await self._cache.get()
+
+    async def list_all(self) -> List[dict]:
+        """Every post (drafts included) as summaries, newest first, for the admin."""
+        return await self.posts.find({}, {"_id": 0, "content": 0}).sort("created_at", -1).to_list(None)
+
+    async def get_any(self, slug: str) -> dict:
+        """A post by slug, published or not (raises BlogPostNotFound)."""
+        post = await self.posts.find_one({"slug": slug}, {"_id": 0})
+        if post is None:
+            raise BlogPostNotFound(slug)
+        return post
+
+    # ─── Writes ───────────────────────────────────────────────────────────────
+
+    async def create(self, post: dict) -> dict:
+        """Insert a post (raises BlogPostExists if the slug or id is taken)."""
+        post = {k: v for k, v in post.items() if k != "_id"}
+        post.setdefault("id", post["slug"])
+        post["created_at"] = post["updated_at"] = _timestamp()
+        try:
+            await self.posts.insert_one(post)
+        except DuplicateKeyError:
+            raise BlogPostExists(post["slug"])
+        post.pop("_id", None)
+        await self.changed()
+        return post
+
+    async def update(self, slug: str, changes: dict) -> dict:
+        """$set `changes` on a post and return it (raises BlogPostNotFound / BlogPostExists on a slug clash)."""
+        changes = {k: v for k, v in changes.items() if k not in PROTECTED_FIELDS}
+        changes["updated_at"] = _timestamp()
+        try:
+            post = await self.posts.find_one_and_update(
+                {"slug": slug}, {"$set": changes}, projection={"_id": 0}, return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            raise BlogPostExists(changes.get("slug"))
+        if post is None:
+            raise BlogPostNotFound(slug)
+        await self.changed()
+        return post
+
+    async def delete(self, slug: str):
+        result = await self.posts.delete_one({"slug": slug})
+        if result.deleted_count == 0:
+            raise BlogPostNotFound(slug)
+        await self.changed()
+
+    async def changed(self):
+        """Bump the shared version and reload this process's store right away."""
+        await self._cache.changed()
+
+    async def _load(self) -> BlogStore:
+        posts = await self.posts.find({"published": True}, {"_id": 0}).sort("created_at", -1).to_list(None)
+        return BlogStore(posts)
@@ -0,0 +1,70 @@
+"""In-memory index over the blog posts.
+
+Posts are indexed once per load instead of per request: a slug -> post map
+for the detail route, summaries (every field except the multilingual
+`content` body) pre-sorted newest first, and the same summaries bucketed by
+category and by tag. Listing endpoints return summaries only; the full body
+is served by the detail route. Each load produces new list objects, so the
+lists can key SnapshotCache entries directly.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+# Omitted from list responses
+BODY_FIELDS = ("content",)
+
+
+def summarize(post: dict) -> dict:
+    return {key: value for key, value in post.items() if key not in BODY_FIELDS}
+
+
+def _created_at(post: dict) -> str:
+    created = post.get("created_at") or ""
+    # ISO strings sort chronologically; datetimes from MongoDB are normalized to them
+    return created if isinstance(created, str) else created.isoformat()
+
+
+class BlogStore:
+    """Slug map, newest-first summaries and category/tag buckets for one set of posts."""
+
+    def __init__(self, posts: Iterable[dict] = ()):
+        self.version = 0
+        self.load(posts)
+
+    def load(self, posts: Iterable[dict]):
+        """Replace the indexed posts (the previous lists stay valid for readers holding them)."""
+        ordered = sorted(posts, key=_created_at, reverse=True)
+        summaries = [summarize(post) for post in ordered]
+        by_category: Dict[str, List[dict]] = defaultdict(list)
+        by_tag: Dict[str, List[dict]] = defaultdict(list)
+        for summary in summaries:
+            by_category[summary.get("category")].append(summary)
+            for tag in {t.lower() for t in summary.get("tags") or []}:
+                by_tag[tag].append(summary)
+        self._by_slug: Dict[str, dict] = {post["slug"]: post for post in ordered}
+        self._summaries = summaries
+        self._by_category = dict(by_category)
+        self._by_tag = dict(by_tag)
+        self.version += 1
+
+    def get(self, slug: str) -> Optional[dict]:
+        """Full post, including `content`."""
+        return self._by_slug.get(slug)
+
+    def summaries(self, category: Optional[str] = None, tag: Optional[str] = None) -> List[dict]:
+        """Newest-first summaries, optionally for one category and/or tag (shared lists: do not mutate)."""
+        if category is not None and tag is None:
+            return self._by_category.get(category, [])
+        if tag is not None:
+            posts = self._by_tag.get(tag.lower(), [])
+            return [p for p in posts if p.get("category") == category] if category is not None else posts
+        return self._summaries
+
+    def categories(self) -> List[str]:
+        return sorted(c for c in self._by_category if c)
+
+    def tags(self) -> List[str]:
+        return sorted(self._by_tag)
+
+    def __len__(self) -> int:
+        return len(self._summaries)
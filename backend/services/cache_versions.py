@@ -0,0 +1,62 @@
+"""In-process caches of MongoDB data, kept coherent across processes.
+
+A `VersionedCache` holds the result of a loader (e.g. an index built from a
+collection). Every write to the underlying data calls `changed()`, which
+bumps a version number in the `cache_versions` collection and reloads the
+writing process right away; other processes compare the version at most
+every `check_seconds` (one small find_one by _id) and reload when it moved.
+"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class VersionedCache(Generic[T]):
+    """`load()` result for the data versioned under `key` in cache_versions."""
+
+    def __init__(self, database, key: str, load: Callable[[], Awaitable[T]], *, check_seconds: float = 5.0):
+        self._db = database
+        self.key = key
+        self._load = load
+        self.check_seconds = check_seconds
+        self._value: Optional[T] = None
+        self._version: Optional[int] = None
+        self._checked = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> T:
+        """The cached value, reloaded first when another process changed the data."""
+        if self._value is not None and time.monotonic() - self._checked < self.check_seconds:
+            return self._value
+        async with self._lock:
+            if self._value is None or time.monotonic() - self._checked >= self.check_seconds:
+                version = await self._current_version()
+                if self._value is None or version != self._version:
+                    await self._reload(version)
+                self._checked = time.monotonic()
+        return self._value
+
+    async def changed(self):
+        """Bump the shared version and reload this process's value right away."""
+        doc = await self._db.cache_versions.find_one_and_update(
+            {"_id": self.key}, {"$inc": {"version": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        async with self._lock:
+            await self._reload(doc["version"])
+            self._checked = time.monotonic()
+
+    async def _current_version(self) -> int:
+        doc = await self._db.cache_versions.find_one({"_id": self.key})
+        return (doc or {}).get("version", 0)
+
+    async def _reload(self, version: int):
+        self._value = await self._load()
+        self._version = version
+        logger.info(f"Cache {self.key} reloaded (version {version})")
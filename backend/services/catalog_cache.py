@@ -0,0 +1,135 @@
+"""In-process read-through cache for the partner catalog collections.
+
+The catalog (golf courses, hotels, restaurants, beach clubs, cafés/bars and
+the image overrides applied on top of them) is a few hundred documents that
+change a handful of times a day, so the public listing endpoints serve it
+from memory. Entries are dropped when an admin
+handler calls `invalidate`, when the MongoDB change stream reports a write,
+and, as a safety net, when they are older than the TTL.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+CATALOG_COLLECTIONS = ("golf_courses", "hotels", "restaurants", "beach_clubs", "cafe_bars", "image_overrides")
+
+# While the change stream is running the TTL only guards against missed events;
+# without it (standalone mongod) entries must expire quickly.
+WATCH_TTL_SECONDS = int(os.environ.get("CATALOG_CACHE_WATCH_TTL", "3600"))
+FALLBACK_TTL_SECONDS = int(os.environ.get("CATALOG_CACHE_TTL", "60"))
+WATCH_RETRY_SECONDS = 5
+
+
+class CatalogCache:
+    """Shared snapshot of each catalog collection, sorted by (display_order, id)."""
+
+    def __init__(self, database, collections: Iterable[str] = CATALOG_COLLECTIONS):
+        self._db = database
+        self.collections = tuple(collections)
+        self._entries: Dict[str, Tuple[float, List[dict]]] = {}
+        self._locks = {name: asyncio.Lock() for name in self.collections}
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self._watch_task: Optional[asyncio.Task] = None
+        self.watching = False
+        # Bumped per collection by invalidate(); a load publishes its snapshot
+        # only if its collection's generation did not move meanwhile
+        self._generations: Dict[str, int] = {name: 0 for name in self.collections}
+
+    @property
+    def ttl(self) -> int:
+        return WATCH_TTL_SECONDS if self.watching else FALLBACK_TTL_SECONDS
+
+    def _fresh(self, name: str) -> Optional[List[dict]]:
+        entry = self._entries.get(name)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    async def get(self, name: str) -> List[dict]:
+        """Return every document of `name` (active and inactive) sorted by (display_order, id).
+
+        The list and its documents are shared between requests: callers must
+        copy before mutating.
+        """
+        docs = self._fresh(name)
+        if docs is not None:
+            return docs
+        async with self._locks[name]:
+            docs = self._fresh(name)
+            if docs is not None:
+                return docs
+            generation = self._generations.get(name, 0)
+            cursor = self._db[name].find({}, {"_id": 0}).sort([("display_order", 1), ("id", 1)])
+            docs = await cursor.to_list(None)
+            # Only publish the snapshot if this collection was not invalidated while loading
+            if generation == self._generations.get(name, 0):
+                self._entries[name] = (time.monotonic(), docs)
+            return docs
+
+    async def get_active(self, name: str) -> List[dict]:
+        """Same as `get` but only documents with is_active == True."""
+        return [doc for doc in await self.get(name) if doc.get("is_active") is True]
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one collection (or all of them when `name` is None) and notify listeners."""
+        if name is None:
+            self._entries.clear()
+            for collection in self._generations:
+                self._generations[collection] += 1
+        else:
+            self._entries.pop(name, None)
+            self._generations[name] = self._generations.get(name, 0) + 1
+        for listener in self._listeners:
+            try:
+                listener(name)
+            except Exception as e:
+                logger.error(f"Catalog cache listener failed: {e}")
+
+    def subscribe(self, listener: Callable[[Optional[str]], None]):
+        """Register a callback invoked with the collection name on every invalidation."""
+        self._listeners.append(listener)
+
+    # ─── Change stream ────────────────────────────────────────────────────────
+
+    def start_watching(self):
+        if self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch())
+
+    async def stop_watching(self):
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+        self.watching = False
+
+    async def _watch(self):
+        pipeline = [{"$match": {"ns.coll": {"$in": list(self.collections)}}}]
+        while True:
+            try:
+                async with self._db.watch(pipeline) as stream:
+                    self.watching = True
+                    logger.info("Catalog cache: change stream active")
+                    async for change in stream:
+                        self.invalidate(change.get("ns", {}).get("coll"))
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                # Standalone servers cannot open change streams; rely on the TTL
+                self.watching = False
+                logger.info(f"Catalog cache: change stream unavailable ({e}), using {FALLBACK_TTL_SECONDS}s TTL")
+                return
+            except PyMongoError as e:
+                logger.warning(f"Catalog cache: change stream interrupted ({e}), retrying")
+            # Events may have been missed while disconnected
+            self.watching = False
+            self.invalidate()
+            await asyncio.sleep(WATCH_RETRY_SECONDS)
@@ -0,0 +1,58 @@
+"""Jinja2 templates for transactional and newsletter emails.
+
+Templates live in backend/templates/email and are compiled once per process
+(Jinja keeps compiled templates in memory, and the bytecode cache on disk
+lets new worker processes skip the compile step). The static header and
+footer fragments shared by every email are rendered once per language and
+inserted as pre-rendered markup; the rest of the template is rendered on
+every call. Transactional emails have a single recipient, and a newsletter
+body is identical for every subscriber, so it is rendered once per job.
+"""
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined, Template, select_autoescape
+from markupsafe import Markup
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+BYTECODE_CACHE_DIR = os.environ.get(
+    "EMAIL_TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "golfinmallorca-email-templates")
+)
+LOGO_URL = "https://golfinmallorca.com/api/uploads/logo_email_v2.jpg"
+DEFAULT_LANGUAGE = "en"
+
+
+@lru_cache(maxsize=64)
+def _render_fragment(template: Template, lang: str) -> Markup:
+    # Keyed on the compiled template (cached by its Environment), not on an
+    # EmailTemplates instance, so the cache holds no reference to one
+    return Markup(template.render(lang=lang))
+
+
+class EmailTemplates:
+    """Compiled email templates plus per-language cached fragments."""
+
+    def __init__(self, directory: Path = TEMPLATE_DIR, bytecode_cache_dir: str = BYTECODE_CACHE_DIR):
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(str(directory)),
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir),
+            # Templates ship with the code; never stat the files on render
+            auto_reload=False,
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.env.globals.update(logo_url=LOGO_URL, fragment=self.fragment)
+
+    def fragment(self, name: str, lang: str = DEFAULT_LANGUAGE) -> Markup:
+        """Render a static fragment (fragments/<name>.html) once per language."""
+        return _render_fragment(self.env.get_template(f"fragments/{name}.html"), lang)
+
+    def render(self, template: str, /, lang: str = DEFAULT_LANGUAGE, **context) -> str:
+        """Render <template>.html with the per-recipient context."""
+        return self.env.get_template(f"{template}.html").render(lang=lang, **context)
+
@@ -0,0 +1,118 @@
+"""Bounded edit-distance matching for search typo tolerance.
+
+Search only ever asks "is this word within k edits of that word" with k of 1
+or 2, so nothing here computes a full Levenshtein matrix:
+
+- `bounded_distance` walks only the diagonal band |i - j| <= k (Ukkonen) and
+  stops as soon as every cell in a row exceeds k.
+- `FuzzyPattern` precompiles a query word into Myers/Hyyrö bit-parallel
+  match vectors, so each candidate costs one pass of integer operations per
+  character, and memoizes the answer per token.
+"""
+from functools import lru_cache
+from typing import Dict
+
+
+def bounded_distance(a: str, b: str, max_dist: int) -> int:
+    """Levenshtein distance between a and b, or max_dist + 1 if it exceeds max_dist."""
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    if m - n > max_dist:
+        return max_dist + 1
+    over = max_dist + 1
+    # prev[j] holds D[i-1][j]; cells outside the band are treated as over
+    prev = [j if j <= max_dist else over for j in range(m + 1)]
+    for i in range(1, n + 1):
+        lo = max(1, i - max_dist)
+        hi = min(m, i + max_dist)
+        cur = [over] * (m + 1)
+        cur[0] = i if i <= max_dist else over
+        ca = a[i - 1]
+        row_min = cur[0] if lo == 1 else over
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] if ca == b[j - 1] else prev[j - 1] + 1
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if cur[j - 1] + 1 < cost:
+                cost = cur[j - 1] + 1
+            if cost > over:
+                cost = over
+            cur[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > max_dist:
+            return over
+        prev = cur
+    return prev[m] if prev[m] <= max_dist else over
+
+
+def within_distance(a: str, b: str, max_dist: int) -> bool:
+    return bounded_distance(a, b, max_dist) <= max_dist
+
+
+class FuzzyPattern:
+    """A query word compiled for repeated "within max_dist edits" checks.
+
+    Uses Myers' bit-vector algorithm (Hyyrö's formulation for global edit
+    distance): the DP column is encoded as vertical +1/-1 delta bitmasks, and
+    the running score is the distance between the pattern and the text prefix.
+    """
+
+    __slots__ = ("word", "max_dist", "_peq", "_full", "_high", "_memo")
+
+    def __init__(self, word: str, max_dist: int):
+        self.word = word
+        self.max_dist = max_dist
+        peq: Dict[str, int] = {}
+        for i, ch in enumerate(word):
+            peq[ch] = peq.get(ch, 0) | (1 << i)
+        self._peq = peq
+        self._full = (1 << len(word)) - 1
+        self._high = 1 << (len(word) - 1) if word else 0
+        self._memo: Dict[str, bool] = {}
+
+    def distance(self, text: str) -> int:
+        """Edit distance to text, or max_dist + 1 once it cannot come back under."""
+        m, k = len(self.word), self.max_dist
+        remaining = len(text)
+        if abs(m - remaining) > k:
+            return k + 1
+        if m == 0:
+            return remaining
+        peq, full, high = self._peq, self._full, self._high
+        pv, mv, score = full, 0, m
+        for ch in text:
+            eq = peq.get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = ((ph << 1) | 1) & full
+            mh = (mh << 1) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+            remaining -= 1
+            # Each remaining character lowers the score by at most one
+            if score - remaining > k:
+                return k + 1
+        return score if score <= k else k + 1
+
+    def matches(self, token: str) -> bool:
+        result = self._memo.get(token)
+        if result is None:
+            result = self.distance(token) <= self.max_dist
+            self._memo[token] = result
+        return result
+
+
+@lru_cache(maxsize=2048)
+def compile_pattern(word: str, max_dist: int) -> FuzzyPattern:
+    """Compiled pattern for word, shared across requests (keystrokes repeat words)."""
+    return FuzzyPattern(word, max_dist)
@@ -0,0 +1,81 @@
+"""Pre-serialized JSON bodies with ETag / If-None-Match handling.
+
+Catalog responses are derived from catalog cache snapshots, so the JSON body
+(encoded with orjson, skipping FastAPI's response_model validation) and its
+content hash only need computing once per snapshot. Clients that send back
+the ETag get a bodyless 304.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import orjson
+from fastapi import Request, Response
+
+# Cacheable, but browsers must revalidate so admin edits show up immediately
+CATALOG_CACHE_CONTROL = "public, no-cache"
+# Snapshots kept per cache; keys come from query parameters, so they are capped
+MAX_SNAPSHOTS = 512
+
+
+class JsonSnapshot:
+    """A payload serialized once, with a strong ETag derived from the body."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, payload: Any):
+        self.body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+
+
+class SnapshotCache:
+    """Keeps one JsonSnapshot per key, rebuilt when its source lists change.
+
+    `sources` are the catalog cache lists the payload was derived from; the
+    cache hands out new list objects whenever a collection changes, so an
+    identity check is enough to know the snapshot is stale. At most
+    `max_entries` snapshots are kept, least recently used first out.
+    """
+
+    def __init__(self, max_entries: int = MAX_SNAPSHOTS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Sequence[Any], JsonSnapshot]]" = OrderedDict()
+
+    def get(self, key: Hashable, sources: Sequence[Any], build: Callable[[], Any]) -> JsonSnapshot:
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_sources, snapshot = entry
+            if len(cached_sources) == len(sources) and all(a is b for a, b in zip(cached_sources, sources)):
+                self._entries.move_to_end(key)
+                return snapshot
+        snapshot = JsonSnapshot(build())
+        self._entries[key] = (tuple(sources), snapshot)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def snapshot_response(request: Request, snapshot: JsonSnapshot, cache_control: Optional[str] = CATALOG_CACHE_CONTROL) -> Response:
+    """Return the snapshot body, or 304 Not Modified if the client already has it."""
+    headers = {"ETag": snapshot.etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
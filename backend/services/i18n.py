@@ -0,0 +1,52 @@
+"""Language projection for multilingual catalog and blog documents.
+
+Text fields such as `description`, `deal`, `title`, `excerpt` and `content`
+are stored as {"en": ..., "de": ..., "fr": ..., "se": ...}. The frontend only
+ever renders one language, so `?lang=` responses keep the same dict shape but
+with a single key, falling back to English when a translation is missing.
+"""
+from typing import Dict, List, Optional
+
+LANGUAGES = ("en", "de", "fr", "se")
+DEFAULT_LANGUAGE = "en"
+# Some seeded hotels use the ISO code "sv" for Swedish; the site uses "se"
+LANGUAGE_ALIASES: Dict[str, str] = {"sv": "se"}
+_ALL_CODES = set(LANGUAGES) | set(LANGUAGE_ALIASES)
+
+
+def normalize_lang(lang: Optional[str]) -> Optional[str]:
+    """Map a ?lang= value to a supported language (None means no projection)."""
+    if not lang:
+        return None
+    lang = lang.strip().lower()
+    lang = LANGUAGE_ALIASES.get(lang, lang)
+    return lang if lang in LANGUAGES else DEFAULT_LANGUAGE
+
+
+def _is_multilingual(value) -> bool:
+    return isinstance(value, dict) and bool(value) and value.keys() <= _ALL_CODES
+
+
+def _pick(texts: dict, lang: str):
+    if lang in texts:
+        return texts[lang]
+    for alias, target in LANGUAGE_ALIASES.items():
+        if target == lang and alias in texts:
+            return texts[alias]
+    return texts.get(DEFAULT_LANGUAGE, next(iter(texts.values())))
+
+
+def project_language(doc: dict, lang: Optional[str]) -> dict:
+    """Shallow copy of doc with every multilingual field reduced to {lang: text}."""
+    if not lang:
+        return doc
+    return {
+        key: {lang: _pick(value, lang)} if _is_multilingual(value) else value
+        for key, value in doc.items()
+    }
+
+
+def project_list(items: List[dict], lang: Optional[str]) -> List[dict]:
+    if not lang:
+        return items
+    return [project_language(item, lang) for item in items]
@@ -0,0 +1,278 @@
+"""Tiered local cache for images served from object storage.
+
+`/api/images/{path}` used to download the whole object from storage on every
+request. Objects are now cached in two tiers:
+
+- a bounded in-memory LRU for small hot objects (logos, thumbnails), served
+  straight from bytes;
+- a size-capped LRU on disk for everything, served with FileResponse
+  (sendfile where the server supports it) so large hero images never sit in
+  memory. The directory must not be under a static mount such as
+  /api/uploads, or the cached bytes and metadata would be downloadable.
+
+Each entry has a strong ETag (the storage ETag, else a content hash) and a
+Last-Modified time, so browsers and CDNs revalidate with a bodyless 304.
+Concurrent misses for the same path share one storage download. Storage
+paths are immutable (uploads get a fresh uuid), so entries never go stale;
+`invalidate` exists for callers that rewrite an object in place.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+from services.http_cache import etag_matches
+
+logger = logging.getLogger(__name__)
+
+MEMORY_MAX_BYTES = int(os.environ.get("IMAGE_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+# Only objects up to this size are kept in memory; larger ones are served from disk
+MEMORY_MAX_OBJECT_BYTES = int(os.environ.get("IMAGE_CACHE_MEMORY_OBJECT_BYTES", str(256 * 1024)))
+DISK_MAX_BYTES = int(os.environ.get("IMAGE_CACHE_DISK_BYTES", str(1024 * 1024 * 1024)))
+IMAGE_CACHE_CONTROL = "public, max-age=31536000"
+
+
+class CachedImage:
+    """One cached object: `body` for memory entries, `file` on disk for all of them."""
+
+    __slots__ = ("file", "body", "content_type", "etag", "last_modified", "size")
+
+    def __init__(self, file: Path, content_type: str, etag: str, last_modified: float, size: int,
+                 body: Optional[bytes] = None):
+        self.file = file
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+
+    def meta(self, path: str) -> dict:
+        return {"path": path, "content_type": self.content_type, "etag": self.etag,
+                "last_modified": self.last_modified, "size": self.size}
+
+
+def _key(path: str) -> str:
+    return hashlib.sha256(path.encode()).hexdigest()
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class ImageCache:
+    """Memory + disk LRU in front of a StorageClient."""
+
+    def __init__(self, storage, directory: Path, *, memory_max_bytes: int = MEMORY_MAX_BYTES,
+                 memory_max_object_bytes: int = MEMORY_MAX_OBJECT_BYTES, disk_max_bytes: int = DISK_MAX_BYTES):
+        self._storage = storage
+        self.directory = Path(directory)
+        self.memory_max_bytes = memory_max_bytes
+        self.memory_max_object_bytes = memory_max_object_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._disk_bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    # ─── Lookup ───────────────────────────────────────────────────────────────
+
+    async def get(self, path: str) -> CachedImage:
+        """The cached object for a storage path, fetched on a miss (raises storage errors)."""
+        await self._ensure_loaded()
+        entry = self._memory.get(path)
+        if entry is not None:
+            self._memory.move_to_end(path)
+            self._counters["memory_hits"] += 1
+            return entry
+        entry = self._disk.get(path)
+        if entry is not None and entry.file.exists():
+            self._disk.move_to_end(path)
+            self._counters["disk_hits"] += 1
+            if entry.size <= self.memory_max_object_bytes:
+                body = await asyncio.to_thread(entry.file.read_bytes)
+                entry = self._remember(path, entry, body)
+            return entry
+
+        pending = self._inflight.get(path)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[path] = future
+        try:
+            entry = await self._fetch(path)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a miss nobody else waited on does not log "never retrieved"
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(path, None)
+
+    def invalidate(self, path: str):
+        entry = self._memory.pop(path, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+        entry = self._disk.pop(path, None)
+        if entry is not None:
+            self._disk_bytes -= entry.size
+            self._unlink(entry.file)
+
+    def stats(self) -> dict:
+        return {
+            **self._counters,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    # ─── Fill ─────────────────────────────────────────────────────────────────
+
+    async def _fetch(self, path: str) -> CachedImage:
+        self._counters["misses"] += 1
+        key = _key(path)
+        tmp = self.directory / f"{key}.{uuid.uuid4().hex}.tmp"
+        hasher = hashlib.sha1()
+        small = bytearray()
+        size = 0
+        try:
+            async with self._storage.stream(path) as resp:
+                content_type = resp.headers.get("Content-Type", "application/octet-stream")
+                upstream_etag = resp.headers.get("ETag")
+                last_modified = _parse_http_date(resp.headers.get("Last-Modified")) or time.time()
+                # File I/O runs in a thread so a slow disk never blocks the event loop
+                fileobj = await asyncio.to_thread(open, tmp, "wb")
+                try:
+                    async for chunk in resp.aiter_bytes():
+                        await asyncio.to_thread(fileobj.write, chunk)
+                        hasher.update(chunk)
+                        size += len(chunk)
+                        if size <= self.memory_max_object_bytes:
+                            small += chunk
+                finally:
+                    await asyncio.to_thread(fileobj.close)
+            file = self.directory / key
+            await asyncio.to_thread(os.replace, tmp, file)
+        except BaseException:
+            self._unlink(tmp)
+            raise
+
+        etag = upstream_etag if upstream_etag and not upstream_etag.startswith("W/") else f'"{hasher.hexdigest()}"'
+        entry = CachedImage(file, content_type, etag, last_modified, size)
+        meta_file = self.directory / f"{key}.json"
+        await asyncio.to_thread(meta_file.write_text, json.dumps(entry.meta(path)))
+        replaced = self._disk.pop(path, None)
+        if replaced is not None:
+            self._disk_bytes -= replaced.size
+        self._disk[path] = entry
+        self._disk_bytes += size
+        self._evict_disk()
+        if size <= self.memory_max_object_bytes:
+            entry = self._remember(path, entry, bytes(small))
+        return entry
+
+    def _remember(self, path: str, entry: CachedImage, body: bytes) -> CachedImage:
+        cached = CachedImage(entry.file, entry.content_type, entry.etag, entry.last_modified, entry.size, body)
+        # Concurrent disk hits for one path both land here: count it once
+        replaced = self._memory.pop(path, None)
+        if replaced is not None:
+            self._memory_bytes -= replaced.size
+        self._memory[path] = cached
+        self._memory_bytes += cached.size
+        while self._memory_bytes > self.memory_max_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+        return cached
+
+    def _evict_disk(self):
+        while self._disk_bytes > self.disk_max_bytes and len(self._disk) > 1:
+            _, evicted = self._disk.popitem(last=False)
+            self._disk_bytes -= evicted.size
+            self._counters["evictions"] += 1
+            # A memory entry serves from its own bytes and outlives the disk copy
+            self._unlink(evicted.file)
+
+    @staticmethod
+    def _unlink(file: Path):
+        for candidate in (file, file.with_name(f"{file.name}.json")):
+            try:
+                candidate.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ─── Disk index ───────────────────────────────────────────────────────────
+
+    async def _ensure_loaded(self):
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if not self._loaded:
+                await asyncio.to_thread(self._load_index)
+                self._loaded = True
+
+    def _load_index(self):
+        """Rebuild the disk LRU from the metadata files left by a previous process."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for meta_file in self.directory.glob("*.json"):
+            file = meta_file.with_suffix("")
+            try:
+                meta = json.loads(meta_file.read_text())
+                entries.append((file.stat().st_mtime, meta, file))
+            except (OSError, ValueError):
+                self._unlink(file)
+        for tmp in self.directory.glob("*.tmp"):
+            tmp.unlink(missing_ok=True)
+        # Oldest first, so the least recently filled entries are evicted first
+        for _, meta, file in sorted(entries, key=lambda e: e[0]):
+            entry = CachedImage(file, meta["content_type"], meta["etag"], meta["last_modified"], meta["size"])
+            self._disk[meta["path"]] = entry
+            self._disk_bytes += entry.size
+        self._evict_disk()
+        logger.info(f"Image cache: {len(self._disk)} objects ({self._disk_bytes // 1024} KiB) on disk")
+
+
+def image_response(request: Request, entry: CachedImage, cache_control: str = IMAGE_CACHE_CONTROL,
+                   vary: Optional[str] = None) -> Response:
+    """Serve a cached image: 304 if the client's copy is current, bytes from memory, or the disk file."""
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+    if vary:
+        headers["Vary"] = vary
+    if request.headers.get("if-none-match"):
+        not_modified = etag_matches(request, entry.etag)
+    else:
+        since = _parse_http_date(request.headers.get("if-modified-since"))
+        not_modified = since is not None and int(entry.last_modified) <= since
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    if entry.body is not None:
+        return Response(content=entry.body, media_type=entry.content_type, headers=headers)
+    return FileResponse(entry.file, media_type=entry.content_type, headers=headers)
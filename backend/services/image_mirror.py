@@ -0,0 +1,466 @@
+"""Mirroring and health checks for externally hosted partner images.
+
+Many partner cards point at images on hotel and restaurant websites, which
+can be slow, hotlink-protected or simply gone. Every external `image` URL
+in the catalog collections gets a record in `image_mirrors` (one per
+source URL, however many partners share it). A pool of workers claims due
+records with a leased `find_one_and_update`, downloads the source (at
+most PER_HOST_CONCURRENCY requests per origin) and stores an optimized
+copy through `ImagePipeline.ingest`. The partners' `image` is then
+rewritten to the mirrored `/api/images/...` URL; the original stays in
+`image_source`, and `image_srcset` is filled in.
+
+Mirrors are re-checked every RECHECK_SECONDS with conditional requests,
+and a changed source is stored under a new content-addressed path. A
+source that fails to download is marked "broken" and retried with backoff.
+Its partners keep serving the last good copy, and `report()` lists it for
+an admin to fix. Page loads never wait on the origin servers.
+
+Sources are fetched from inside our network, so every request (the source
+and each redirect hop, followed by hand) must resolve to public addresses
+only: loopback, private, link-local (cloud metadata) and other reserved
+ranges are refused before connecting. The request then goes to the address
+that was checked, with the original Host header and TLS server name, so a
+second DNS lookup (rebinding) cannot redirect it.
+"""
+import asyncio
+import hashlib
+import ipaddress
+import logging
+import os
+import socket
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+import httpx
+from PIL import Image, UnidentifiedImageError
+from pymongo import ReturnDocument, UpdateOne
+
+from services.image_pipeline import build_srcset
+
+logger = logging.getLogger(__name__)
+
+MIRROR_COLLECTIONS = ("golf_courses", "hotels", "restaurants", "beach_clubs", "cafe_bars", "image_overrides")
+WORKERS = int(os.environ.get("IMAGE_MIRROR_WORKERS", "8"))
+PER_HOST_CONCURRENCY = 2
+RECHECK_SECONDS = int(os.environ.get("IMAGE_MIRROR_RECHECK_SECONDS", str(24 * 3600)))
+# Broken sources are retried after 15m, 30m, 1h ... up to RECHECK_SECONDS
+BROKEN_RETRY_BASE_SECONDS = 900
+# Storage failures are ours, not the origin's: retry soon without marking broken
+ERROR_RETRY_SECONDS = 300
+# New partner images are picked up by a catalog scan this often
+SCAN_SECONDS = int(os.environ.get("IMAGE_MIRROR_SCAN_SECONDS", "900"))
+LEASE_SECONDS = 120
+POLL_SECONDS = 60
+FETCH_TIMEOUT_SECONDS = 15
+MAX_BYTES = 10 * 1024 * 1024
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# Smaller responses are hotlink-protection placeholders, not photos
+MIN_BYTES = 1000
+EXTENSIONS = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp", "image/gif": "gif", "image/avif": "avif"}
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+}
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def is_external(url: Optional[str]) -> bool:
+    return isinstance(url, str) and url.startswith(("http://", "https://"))
+
+
+class SourceUnavailable(Exception):
+    """The origin did not return a usable image (the mirror is marked broken)."""
+
+    def __init__(self, reason: str, status: Optional[int] = None):
+        super().__init__(reason)
+        self.status = status
+
+
+async def resolve_host(host: str, port: int) -> List[str]:
+    """Every address `host` resolves to."""
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return [info[4][0] for info in infos]
+
+
+async def check_public_url(url: str, resolve: Callable[[str, int], Awaitable[List[str]]] = resolve_host) -> List[str]:
+    """The addresses `url`'s host resolves to; raises SourceUnavailable unless it is
+    http(s) and they are all public."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise SourceUnavailable(f"Unsupported URL {url!r}")
+    try:
+        addresses = await resolve(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+    except (OSError, UnicodeError) as e:
+        raise SourceUnavailable(f"Cannot resolve {parts.hostname}: {e}") from e
+    if not addresses:
+        raise SourceUnavailable(f"Cannot resolve {parts.hostname}")
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+        if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+            ip = ip.ipv4_mapped
+        if not ip.is_global or ip.is_multicast:
+            raise SourceUnavailable(f"{parts.hostname} resolves to non-public address {ip}")
+    return addresses
+
+
+def pin_address(url: str, address: str) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+    """`url` rewritten to connect to `address`, plus the Host header and request
+    extensions (TLS server name) that keep it addressed to the original host."""
+    parts = urlsplit(url)
+    ip = ipaddress.ip_address(address)
+    host = f"[{ip}]" if ip.version == 6 else str(ip)
+    port = f":{parts.port}" if parts.port else ""
+    original = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+    pinned = urlunsplit((parts.scheme, host + port, parts.path, parts.query, ""))
+    extensions = {}
+    try:
+        ipaddress.ip_address(parts.hostname)
+    except ValueError:
+        extensions["sni_hostname"] = parts.hostname
+    return pinned, {"Host": original + port}, extensions
+
+
+class ImageMirror:
+    """Keeps `image_mirrors` in sync with the catalog and rewrites partners to the mirrored copies.
+
+    `on_change(collection)` is called after partner documents of a
+    collection were rewritten (the catalog cache invalidation).
+    """
+
+    def __init__(self, database, pipeline, prefix: str, *, on_change: Optional[Callable[[str], None]] = None,
+                 collections: Iterable[str] = MIRROR_COLLECTIONS, workers: int = WORKERS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None,
+                 resolve: Callable[[str, int], Awaitable[List[str]]] = resolve_host):
+        self._db = database
+        self._pipeline = pipeline
+        self.prefix = prefix.rstrip("/")
+        self._on_change = on_change
+        self.collections = tuple(collections)
+        self.workers = workers
+        self._transport = transport
+        self._resolve = resolve
+        self._client: Optional[httpx.AsyncClient] = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._owner = uuid.uuid4().hex
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._counters = {"mirrored": 0, "unchanged": 0, "broken": 0, "errors": 0}
+
+    @property
+    def mirrors(self):
+        return self._db.image_mirrors
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                # Redirects are followed in _open so every hop's address is checked
+                follow_redirects=False,
+                headers=FETCH_HEADERS,
+                limits=httpx.Limits(max_connections=self.workers),
+                timeout=FETCH_TIMEOUT_SECONDS,
+                transport=self._transport,
+            )
+        return self._client
+
+    def start(self):
+        """Start the scanner and the check workers (idempotent)."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._scan_loop())]
+        self._tasks += [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.mirrors.update_many(
+            {"lease_owner": self._owner}, {"$set": {"lease_owner": None, "lease_until": None}}
+        )
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ─── Catalog scan ─────────────────────────────────────────────────────────
+
+    async def sync_sources(self) -> Dict[str, int]:
+        """Create records for new external images and drop records nothing references any more."""
+        mirrored = {"$regex": f"^/api/images/{self.prefix}/"}
+        sources = set()
+        for name in self.collections:
+            collection = self._db[name]
+            sources.update(u for u in await collection.distinct("image") if is_external(u))
+            # Partners already rewritten to a mirror keep their source checked
+            sources.update(await collection.distinct("image_source", {"image": mirrored}))
+        sources.discard(None)
+
+        added = 0
+        if sources:
+            now = _now()
+            result = await self.mirrors.bulk_write([
+                UpdateOne({"source_url": url}, {"$setOnInsert": {
+                    "source_url": url,
+                    "status": "pending",
+                    "failures": 0,
+                    "created_at": now,
+                    "next_check_at": now,
+                    "lease_owner": None,
+                    "lease_until": None,
+                }}, upsert=True)
+                for url in sources
+            ], ordered=False)
+            added = result.upserted_count
+        removed = (await self.mirrors.delete_many({"source_url": {"$nin": list(sources)}})).deleted_count
+        if added:
+            self._wakeup.set()
+        return {"sources": len(sources), "added": added, "removed": removed}
+
+    async def enqueue(self, url: str):
+        """Mirror a newly set external image now rather than at the next scan."""
+        if not is_external(url):
+            return
+        await self.mirrors.update_one(
+            {"source_url": url},
+            {"$set": {"next_check_at": _now()},
+             "$setOnInsert": {"source_url": url, "status": "pending", "failures": 0, "created_at": _now(),
+                              "lease_owner": None, "lease_until": None}},
+            upsert=True,
+        )
+        self._wakeup.set()
+
+    async def check_all(self) -> Dict[str, int]:
+        """Rescan the catalog and make every mirror due for a check now."""
+        counts = await self.sync_sources()
+        await self.mirrors.update_many({}, {"$set": {"next_check_at": _now()}})
+        self._wakeup.set()
+        return counts
+
+    async def _scan_loop(self):
+        while True:
+            try:
+                await self.sync_sources()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Image mirror scan failed: {e}")
+            await asyncio.sleep(SCAN_SECONDS)
+
+    # ─── Workers ──────────────────────────────────────────────────────────────
+
+    async def _claim(self) -> Optional[dict]:
+        now = _now()
+        return await self.mirrors.find_one_and_update(
+            {"next_check_at": {"$lte": now}, "$or": [{"lease_until": None}, {"lease_until": {"$lt": now}}]},
+            {"$set": {"lease_owner": self._owner, "lease_until": now + timedelta(seconds=LEASE_SECONDS)}},
+            sort=[("next_check_at", 1)],
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _work(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                mirror = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Image mirror claim failed: {e}")
+                mirror = None
+            if mirror is None:
+                # asyncio.wait rather than wait_for, see EmailOutbox._work
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=POLL_SECONDS)
+                finally:
+                    waiter.cancel()
+                continue
+            await self.check(mirror)
+
+    async def check(self, mirror: dict):
+        """Re-fetch one source, store a new copy if it changed and point its partners at the mirror."""
+        source = mirror["source_url"]
+        try:
+            update = await self._refresh(mirror)
+        except asyncio.CancelledError:
+            raise
+        except SourceUnavailable as e:
+            await self._broken(mirror, str(e), e.status)
+            return
+        except Exception as e:
+            self._counters["errors"] += 1
+            logger.error(f"Image mirror failed for {source}: {e}")
+            await self.mirrors.update_one({"source_url": source}, {"$set": {
+                "error": str(e),
+                "next_check_at": _now() + timedelta(seconds=ERROR_RETRY_SECONDS),
+                "lease_owner": None,
+                "lease_until": None,
+            }})
+            return
+        now = _now()
+        update.update({
+            "status": "ok",
+            "failures": 0,
+            "error": None,
+            "http_status": None,
+            "checked_at": now,
+            "next_check_at": now + timedelta(seconds=RECHECK_SECONDS),
+            "lease_owner": None,
+            "lease_until": None,
+        })
+        await self.mirrors.update_one({"source_url": source}, {"$set": update})
+        await self._apply(source, mirror.get("url"), update.get("url", mirror.get("url")),
+                          update.get("srcset", mirror.get("srcset")))
+
+    async def _refresh(self, mirror: dict) -> Dict[str, Any]:
+        """Fields to $set on the mirror after downloading its source (raises SourceUnavailable)."""
+        source = mirror["source_url"]
+        have_copy = bool(mirror.get("path"))
+        headers = {}
+        if have_copy and mirror.get("etag"):
+            headers["If-None-Match"] = mirror["etag"]
+        if have_copy and mirror.get("last_modified"):
+            headers["If-Modified-Since"] = mirror["last_modified"]
+
+        host = urlsplit(source).hostname or ""
+        semaphore = self._hosts.setdefault(host, asyncio.Semaphore(PER_HOST_CONCURRENCY))
+        async with semaphore:
+            try:
+                async with self._open(source, headers) as resp:
+                    if resp.status_code == 304 and have_copy:
+                        self._counters["unchanged"] += 1
+                        return {}
+                    if resp.status_code != 200:
+                        raise SourceUnavailable(f"HTTP {resp.status_code}", resp.status_code)
+                    content_type = resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                    if content_type not in EXTENSIONS:
+                        raise SourceUnavailable(f"Not an image ({content_type or 'no content type'})", resp.status_code)
+                    body = bytearray()
+                    async for chunk in resp.aiter_bytes():
+                        body += chunk
+                        if len(body) > MAX_BYTES:
+                            raise SourceUnavailable(f"Larger than {MAX_BYTES // (1024 * 1024)}MB", resp.status_code)
+                    validators = {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+            except httpx.HTTPError as e:
+                raise SourceUnavailable(f"{type(e).__name__}: {e}") from e
+
+        data = bytes(body)
+        if len(data) < MIN_BYTES:
+            raise SourceUnavailable(f"Only {len(data)} bytes (placeholder?)", 200)
+        digest = hashlib.sha1(data).hexdigest()
+        if have_copy and digest == mirror.get("content_sha1"):
+            self._counters["unchanged"] += 1
+            return validators
+
+        # Content-addressed: a changed source gets a new path, cached copies of the old one stay valid
+        url_key = hashlib.sha1(source.encode()).hexdigest()[:16]
+        path = f"{self.prefix}/{url_key}-{digest[:12]}.{EXTENSIONS[content_type]}"
+        try:
+            manifest = await self._pipeline.ingest(data, content_type, path)
+        except UnidentifiedImageError:
+            raise SourceUnavailable("Not a decodable image", 200)
+        except Image.DecompressionBombError:
+            raise SourceUnavailable("Image dimensions too large", 200)
+        url = f"/api/images/{manifest['path']}"
+        self._counters["mirrored"] += 1
+        logger.info(f"Mirrored {source} -> {url}")
+        return {
+            **validators,
+            "path": manifest["path"],
+            "url": url,
+            "srcset": build_srcset(url, manifest),
+            "content_sha1": digest,
+            "content_type": content_type,
+            "size": len(data),
+            "width": manifest["width"],
+            "height": manifest["height"],
+            "mirrored_at": _now(),
+        }
+
+    @asynccontextmanager
+    async def _open(self, url: str, headers: Dict[str, str]) -> AsyncIterator[httpx.Response]:
+        """Stream GET `url`, following redirects by hand after checking each target (raises SourceUnavailable)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            addresses = await check_public_url(url, self._resolve)
+            # Connect to the address just checked, not whatever DNS returns next
+            pinned, host, extensions = pin_address(url, addresses[0])
+            async with self.client.stream("GET", pinned, headers={**headers, **host}, extensions=extensions) as resp:
+                location = resp.headers.get("Location")
+                if resp.status_code not in REDIRECT_STATUSES or not location:
+                    yield resp
+                    return
+            url = urljoin(url, location)
+        raise SourceUnavailable(f"More than {MAX_REDIRECTS} redirects")
+
+    async def _broken(self, mirror: dict, reason: str, status: Optional[int]):
+        failures = mirror.get("failures", 0) + 1
+        delay = min(RECHECK_SECONDS, BROKEN_RETRY_BASE_SECONDS * 2 ** (failures - 1))
+        now = _now()
+        self._counters["broken"] += 1
+        logger.warning(f"Image source broken ({failures}x) {mirror['source_url']}: {reason}")
+        await self.mirrors.update_one({"source_url": mirror["source_url"]}, {"$set": {
+            "status": "broken",
+            "failures": failures,
+            "error": reason,
+            "http_status": status,
+            "checked_at": now,
+            "next_check_at": now + timedelta(seconds=delay),
+            "lease_owner": None,
+            "lease_until": None,
+        }})
+
+    async def _apply(self, source: str, previous_url: Optional[str], url: Optional[str], srcset: Optional[str]):
+        """Point partners using `source` (or its previous mirror) at the current mirror."""
+        if not url:
+            return
+        match = [{"image": source}]
+        if previous_url and previous_url != url:
+            match.append({"image_source": source, "image": previous_url})
+        for name in self.collections:
+            result = await self._db[name].update_many(
+                {"$or": match},
+                {"$set": {"image": url, "image_source": source, "image_srcset": srcset}},
+            )
+            if result.modified_count and self._on_change is not None:
+                self._on_change(name)
+
+    # ─── Reporting ────────────────────────────────────────────────────────────
+
+    async def report(self) -> Dict[str, Any]:
+        """Mirror counts by status and every broken source with the partners that use it."""
+        summary = {"pending": 0, "ok": 0, "broken": 0}
+        async for row in self.mirrors.aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}]):
+            summary[row["_id"]] = row["count"]
+        broken = await self.mirrors.find(
+            {"status": "broken"}, {"_id": 0, "lease_owner": 0, "lease_until": 0}
+        ).sort("source_url", 1).to_list(None)
+
+        sources = [m["source_url"] for m in broken]
+        partners: Dict[str, List[dict]] = {url: [] for url in sources}
+        if sources:
+            for name in self.collections:
+                cursor = self._db[name].find(
+                    {"$or": [{"image": {"$in": sources}}, {"image_source": {"$in": sources}}]},
+                    {"_id": 0, "id": 1, "partner_id": 1, "name": 1, "image": 1, "image_source": 1},
+                )
+                async for doc in cursor:
+                    url = doc.get("image_source") if doc.get("image_source") in partners else doc.get("image")
+                    partners[url].append({
+                        "collection": name,
+                        "id": doc.get("id") or doc.get("partner_id"),
+                        "name": doc.get("name"),
+                        # Partners keep the last good copy; "origin" ones show a broken image
+                        "serving": "origin" if is_external(doc.get("image")) else "mirror",
+                    })
+        for mirror in broken:
+            mirror["partners"] = partners[mirror["source_url"]]
+        return {"summary": summary, "counters": dict(self._counters), "broken": broken}
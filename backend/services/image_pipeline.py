@@ -0,0 +1,237 @@
+"""Derivative images generated on upload.
+
+Uploaded images are decoded once in a process pool (Pillow work is CPU bound
+and would otherwise stall the event loop), auto-rotated from their EXIF
+orientation and re-encoded without EXIF metadata, then resized to a set of
+widths in WebP and, where the Pillow build supports it, AVIF. A manifest per
+original (`image_derivatives` collection) lists the variants so
+`/api/images/{path}?w=` can pick the smallest variant at least `w` pixels
+wide in the best format the browser's Accept header allows, and partners
+get an `image_srcset` for card grids.
+
+Encoding every variant costs seconds of CPU per upload, so callers only ask
+for variants on authenticated uploads, and images above MAX_PIXELS are
+refused before anything is decoded.
+"""
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+WIDTHS = (320, 640, 960, 1280, 1920)
+WORKERS = int(os.environ.get("IMAGE_PIPELINE_WORKERS", "2"))
+WEBP_QUALITY = 80
+AVIF_QUALITY = 60
+# libavif speed 0 (slowest, smallest) .. 10; the default is several times slower for ~5% smaller files
+AVIF_SPEED = 8
+JPEG_QUALITY = 90
+# Formats in order of preference when the client accepts several
+FORMAT_PREFERENCE = ("avif", "webp")
+CONTENT_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+ORIENTATION_TAG = 0x0112
+MANIFEST_CACHE_SIZE = 2048
+UPLOAD_CONCURRENCY = 4
+# Decoded size limit (a 10 MB upload can still expand to gigabytes of pixels)
+MAX_PIXELS = int(os.environ.get("IMAGE_MAX_PIXELS", "40000000"))
+
+Image.init()
+AVIF_AVAILABLE = "AVIF" in Image.SAVE
+
+
+def _has_alpha(img: Image.Image) -> bool:
+    return img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+
+
+def process_image(data: bytes, widths: Tuple[int, ...] = WIDTHS, avif: bool = AVIF_AVAILABLE) -> dict:
+    """Decode, strip metadata and resize one image (runs in a worker process).
+
+    Returns {"width", "height", "original": (bytes, content_type) or None when
+    the upload can be stored unchanged, "variants": [{"width", "format",
+    "content_type", "data"}]}. Animated images are stored as-is without
+    variants; empty `widths` skips them altogether. Raises
+    Image.DecompressionBombError above MAX_PIXELS.
+    """
+    img = Image.open(io.BytesIO(data))
+    if img.width * img.height > MAX_PIXELS:
+        raise Image.DecompressionBombError(f"Image size ({img.width}x{img.height}) exceeds {MAX_PIXELS} pixels")
+    source_format = img.format
+    if getattr(img, "is_animated", False):
+        return {"width": img.width, "height": img.height, "original": None, "variants": []}
+
+    exif = img.getexif()
+    rotated = exif.get(ORIENTATION_TAG, 1) != 1
+    oriented = ImageOps.exif_transpose(img) if rotated else img
+    icc_profile = img.info.get("icc_profile")
+
+    original = None
+    if exif or img.info.get("exif"):
+        # Re-encode without EXIF (camera model, GPS position...); keep the colour profile
+        buf = io.BytesIO()
+        if source_format == "JPEG" and not rotated:
+            # Same quantization tables as the upload: no visible loss, no size growth
+            img.save(buf, "JPEG", quality="keep", optimize=True, icc_profile=icc_profile)
+            original = (buf.getvalue(), "image/jpeg")
+        elif source_format == "JPEG":
+            oriented.convert("RGB").save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True, icc_profile=icc_profile)
+            original = (buf.getvalue(), "image/jpeg")
+        elif source_format == "WEBP":
+            oriented.save(buf, "WEBP", quality=JPEG_QUALITY, icc_profile=icc_profile)
+            original = (buf.getvalue(), "image/webp")
+        else:
+            oriented.save(buf, "PNG", icc_profile=icc_profile)
+            original = (buf.getvalue(), "image/png")
+
+    width, height = oriented.size
+    # Every standard width below the original, plus the original width if it is under the largest
+    targets = [w for w in widths if w < width]
+    if widths and width <= widths[-1]:
+        targets.append(width)
+    if not targets:
+        return {"width": width, "height": height, "original": original, "variants": []}
+    base = oriented.convert("RGBA" if _has_alpha(oriented) else "RGB")
+    formats = ["webp"] + (["avif"] if avif else [])
+
+    variants = []
+    for target in targets:
+        resized = base if target == width else base.resize(
+            (target, max(1, round(height * target / width))), Image.LANCZOS
+        )
+        for fmt in formats:
+            buf = io.BytesIO()
+            if fmt == "webp":
+                resized.save(buf, "WEBP", quality=WEBP_QUALITY, method=4, icc_profile=icc_profile)
+            else:
+                resized.save(buf, "AVIF", quality=AVIF_QUALITY, speed=AVIF_SPEED, icc_profile=icc_profile)
+            variants.append({"width": target, "format": fmt, "content_type": CONTENT_TYPES[fmt], "data": buf.getvalue()})
+    return {"width": width, "height": height, "original": original, "variants": variants}
+
+
+def accepted_formats(accept: Optional[str]) -> List[str]:
+    """Variant formats the client accepts, most preferred first."""
+    accept = (accept or "").lower()
+    return [fmt for fmt in FORMAT_PREFERENCE if CONTENT_TYPES[fmt] in accept]
+
+
+def choose_variant(manifest: dict, accept: Optional[str], width: Optional[int]) -> Optional[dict]:
+    """The variant to serve for this request, or None to serve the original.
+
+    Picks the smallest variant at least `width` wide (the largest one when
+    none is wide enough, or when no width was asked for) in the first format
+    the client accepts.
+    """
+    for fmt in accepted_formats(accept):
+        candidates = sorted((v for v in manifest.get("variants", []) if v["format"] == fmt), key=lambda v: v["width"])
+        if not candidates:
+            continue
+        if width:
+            for variant in candidates:
+                if variant["width"] >= width:
+                    return variant
+        return candidates[-1]
+    return None
+
+
+def build_srcset(url: str, manifest: dict) -> Optional[str]:
+    """`srcset` value for an /api/images URL: one entry per variant width (format is negotiated)."""
+    widths = sorted({v["width"] for v in manifest.get("variants", [])})
+    if not widths:
+        return None
+    return ", ".join(f"{url}?w={w} {w}w" for w in widths)
+
+
+class ImagePipeline:
+    """Processes uploads in a process pool, stores the variants and keeps their manifests."""
+
+    def __init__(self, database, storage, *, workers: int = WORKERS):
+        self._db = database
+        self._storage = storage
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manifests: "OrderedDict[str, Optional[dict]]" = OrderedDict()
+
+    @property
+    def manifests(self):
+        return self._db.image_derivatives
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds Mongo/HTTP client threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def process(self, data: bytes, *, variants: bool = True, avif: bool = AVIF_AVAILABLE) -> dict:
+        """Run `process_image` in the pool (raises PIL.UnidentifiedImageError for non-images
+        and Image.DecompressionBombError for oversized ones)."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, process_image, data, WIDTHS if variants else (), avif
+        )
+
+    async def ingest(self, data: bytes, content_type: str, path: str) -> dict:
+        """Store an upload at `path` plus its variants under `path` without extension; returns the manifest."""
+        processed = await self.process(data)
+        original, original_type = processed["original"] or (data, content_type)
+        stem = path.rsplit(".", 1)[0]
+        uploads = [(path, original, original_type)]
+        variants = []
+        for variant in processed["variants"]:
+            variant_path = f"{stem}/w{variant['width']}.{variant['format']}"
+            uploads.append((variant_path, variant["data"], variant["content_type"]))
+            variants.append({
+                "width": variant["width"],
+                "format": variant["format"],
+                "content_type": variant["content_type"],
+                "path": variant_path,
+                "size": len(variant["data"]),
+            })
+
+        semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+        async def put(item):
+            async with semaphore:
+                return await self._storage.put(*item)
+
+        results = await asyncio.gather(*(put(item) for item in uploads))
+        for variant, result in zip(variants, results[1:]):
+            variant["path"] = result["path"]
+        manifest = {
+            "path": results[0]["path"],
+            "content_type": original_type,
+            "size": len(original),
+            "width": processed["width"],
+            "height": processed["height"],
+            "variants": variants,
+        }
+        await self.manifests.update_one({"path": manifest["path"]}, {"$set": manifest}, upsert=True)
+        self._remember(manifest["path"], manifest)
+        return manifest
+
+    async def manifest(self, path: str) -> Optional[dict]:
+        """Manifest for an original path (None for images uploaded before the pipeline)."""
+        if path in self._manifests:
+            self._manifests.move_to_end(path)
+            return self._manifests[path]
+        manifest = await self.manifests.find_one({"path": path}, {"_id": 0})
+        self._remember(path, manifest)
+        return manifest
+
+    def _remember(self, path: str, manifest: Optional[dict]):
+        self._manifests[path] = manifest
+        self._manifests.move_to_end(path)
+        while len(self._manifests) > MANIFEST_CACHE_SIZE:
+            self._manifests.popitem(last=False)
@@ -0,0 +1,202 @@
+"""Declared MongoDB indexes for every hot query path, ensured at startup.
+
+`REQUIRED_INDEXES` lists, per collection, the indexes the handlers in
+server.py rely on. `ensure_indexes` creates them idempotently (create_index
+is a no-op when an identical index exists) and `index_report` compares the
+declaration against what the server actually has, including `$indexStats`
+usage counters so unused indexes can be spotted.
+"""
+import logging
+from typing import Dict, List
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+ASC = 1
+DESC = -1
+
+_CATALOG = [
+    {"keys": [("id", ASC)], "unique": True},
+    {"keys": [("display_order", ASC), ("id", ASC)]},
+]
+
+REQUIRED_INDEXES: Dict[str, List[dict]] = {
+    # Auth: session lookup on every authenticated request, user by id/email
+    "users": [
+        {"keys": [("user_id", ASC)], "unique": True},
+        {"keys": [("email", ASC)], "unique": True},
+    ],
+    "user_sessions": [
+        {"keys": [("session_token", ASC)], "unique": True},
+        {"keys": [("user_id", ASC)]},
+    ],
+    # Payments: link lookups, Stripe status polling and webhook, admin list
+    "payment_transactions": [
+        {"keys": [("payment_id", ASC)], "unique": True},
+        {
+            "keys": [("checkout_session_id", ASC)],
+            "unique": True,
+            # Pending payments have checkout_session_id = None
+            "partialFilterExpression": {"checkout_session_id": {"$type": "string"}},
+        },
+        {"keys": [("created_at", DESC)]},
+    ],
+    "newsletter_subscriptions": [
+        {"keys": [("email", ASC)], "unique": True},
+        {"keys": [("id", ASC)], "unique": True},
+        {"keys": [("is_active", ASC)]},
+    ],
+    # Bulk newsletter jobs and their per-recipient delivery status
+    "newsletter_jobs": [
+        {"keys": [("id", ASC)], "unique": True},
+        {"keys": [("status", ASC)]},
+        {"keys": [("created_at", DESC)]},
+    ],
+    "newsletter_deliveries": [
+        {"keys": [("job_id", ASC), ("seq", ASC)], "unique": True},
+        {"keys": [("job_id", ASC), ("status", ASC), ("seq", ASC)]},
+    ],
+    "newsletter_imports": [
+        {"keys": [("id", ASC)], "unique": True},
+    ],
+    # Transactional email outbox: workers claim by (status, next_attempt_at)
+    "email_outbox": [
+        {"keys": [("id", ASC)], "unique": True},
+        {"keys": [("dedup_key", ASC)], "unique": True},
+        {"keys": [("status", ASC), ("next_attempt_at", ASC)]},
+        {"keys": [("created_at", ASC)]},
+        # Sent messages are kept for 30 days
+        {"keys": [("sent_at", ASC)], "expireAfterSeconds": 30 * 24 * 3600},
+    ],
+    # Catalog
+    "golf_courses": _CATALOG,
+    "hotels": _CATALOG,
+    "restaurants": _CATALOG,
+    "beach_clubs": _CATALOG,
+    "cafe_bars": _CATALOG,
+    # Blog CMS: public listing reads published posts newest first
+    "blog_posts": [
+        {"keys": [("slug", ASC)], "unique": True},
+        {"keys": [("id", ASC)], "unique": True},
+        {"keys": [("published", ASC), ("created_at", DESC)]},
+    ],
+    # Resized variants per uploaded original, looked up by /api/images
+    "image_derivatives": [
+        {"keys": [("path", ASC)], "unique": True},
+    ],
+    # Mirrored copies of external partner images; workers claim by next_check_at
+    "image_mirrors": [
+        {"keys": [("source_url", ASC)], "unique": True},
+        {"keys": [("next_check_at", ASC)]},
+        {"keys": [("status", ASC)]},
+    ],
+    "image_overrides": [
+        {"keys": [("partner_id", ASC)], "unique": True},
+    ],
+    "display_settings": [
+        {"keys": [("id", ASC)], "unique": True},
+    ],
+    # Reviews moderation queue; approved ones are read in id order for /api/reviews
+    "user_reviews": [
+        {"keys": [("review_id", ASC)], "unique": True},
+        {"keys": [("status", ASC), ("created_at", DESC)]},
+        {"keys": [("status", ASC), ("id", ASC)]},
+        # Allocated on approval from the "reviews" counter; pending ones have none
+        {"keys": [("id", ASC)], "unique": True, "partialFilterExpression": {"id": {"$type": "int"}}},
+    ],
+    # Client-submitted reviews, ids from the "reviews" counter (migration 0006
+    # renumbers the older max()+1 duplicates)
+    "reviews": [
+        {"keys": [("id", ASC)], "unique": True},
+    ],
+    # Admin inboxes
+    "contact_inquiries": [
+        {"keys": [("id", ASC)], "unique": True},
+        {"keys": [("created_at", DESC)]},
+    ],
+    "trip_planner_requests": [
+        {"keys": [("created_at", DESC)]},
+    ],
+    "booking_requests": [
+        {"keys": [("id", ASC)], "unique": True},
+        {"keys": [("created_at", DESC)]},
+    ],
+}
+
+
+def _key_pattern(keys) -> tuple:
+    # Text/2dsphere/hashed indexes use string directions; only numbers normalize
+    return tuple((field, direction if isinstance(direction, str) else int(direction)) for field, direction in keys)
+
+
+def _options(spec: dict) -> dict:
+    return {k: v for k, v in spec.items() if k != "keys"}
+
+
+async def ensure_indexes(db, required: Dict[str, List[dict]] = REQUIRED_INDEXES) -> Dict[str, List[str]]:
+    """Create every declared index; returns {"created": [...], "failed": [...]} by name.
+
+    A failure (e.g. existing duplicates blocking a unique index) is logged
+    and reported but does not stop the remaining indexes from being created.
+    """
+    created, failed = [], []
+    for collection, specs in required.items():
+        for spec in specs:
+            try:
+                name = await db[collection].create_index(spec["keys"], **_options(spec))
+                created.append(f"{collection}.{name}")
+            except PyMongoError as e:
+                failed.append(f"{collection}.{_key_pattern(spec['keys'])}")
+                logger.error(f"Index creation failed on {collection} {spec['keys']}: {e}")
+    logger.info(f"Indexes ensured: {len(created)} ok, {len(failed)} failed")
+    return {"created": created, "failed": failed}
+
+
+async def index_report(db, required: Dict[str, List[dict]] = REQUIRED_INDEXES) -> dict:
+    """Missing, undeclared and unused indexes per collection."""
+    report = {}
+    existing_collections = set(await db.list_collection_names())
+    for collection in sorted(set(required) | existing_collections):
+        declared = {_key_pattern(spec["keys"]): spec for spec in required.get(collection, [])}
+        present = {}
+        if collection in existing_collections:
+            async for info in db[collection].list_indexes():
+                present[_key_pattern(info["key"].items())] = info
+        usage = {}
+        if collection in existing_collections:
+            try:
+                async for stat in db[collection].aggregate([{"$indexStats": {}}]):
+                    usage[stat["name"]] = stat["accesses"]["ops"]
+            except OperationFailure:
+                # $indexStats needs clusterMonitor on some deployments
+                usage = {}
+
+        missing = [
+            {"keys": [list(k) for k in pattern], **_options(spec)}
+            for pattern, spec in declared.items()
+            if pattern not in present
+        ]
+        # Non-unique on the server while the code assumes uniqueness
+        not_unique = [
+            present[pattern]["name"]
+            for pattern, spec in declared.items()
+            if spec.get("unique") and pattern in present and not present[pattern].get("unique")
+        ]
+        undeclared = [
+            info["name"] for pattern, info in present.items()
+            if info["name"] != "_id_" and pattern not in declared
+        ]
+        unused = [
+            name for name, ops in usage.items()
+            if name != "_id_" and ops == 0
+        ]
+        report[collection] = {
+            "present": sorted(info["name"] for info in present.values()),
+            "missing": missing,
+            "not_unique": not_unique,
+            "undeclared": sorted(undeclared),
+            "unused": sorted(unused),
+            "usage": usage,
+        }
+    return report
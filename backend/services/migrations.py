@@ -0,0 +1,133 @@
+"""Versioned, run-once data migrations and seeds.
+
+Each `Migration` has a version string; once it has run, a document with
+that version as `_id` in the `_migrations` collection records it, and later
+boots skip it after a single `distinct` on that (small) collection, so a
+warm start does no catalog reads at all. Migrations run in list order and a
+failure stops the run, since later ones may depend on it. Changing seed data means adding a
+new migration with a new version, never editing an applied one.
+
+A migration is claimed by upserting its record with status "running" and a
+lease, so when several processes start together exactly one applies it; a
+claim left behind by a crashed process is taken over once its lease
+expires, and a failed migration is retried on the next boot.
+
+`seed_upserts` builds the usual seed step: one unordered `bulk_write` of
+`$setOnInsert` upserts keyed on `id`, which inserts missing documents and
+leaves existing (possibly admin-edited or deactivated) ones untouched.
+"""
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = 600
+
+
+class Migration(NamedTuple):
+    version: str
+    description: str
+    apply: Callable[[Any], Awaitable[Optional[dict]]]  # receives the database, returns a summary
+
+
+def seed_upserts(docs: Iterable[dict], *, exclude: Iterable[str] = (), defaults: Optional[dict] = None) -> List[UpdateOne]:
+    """Insert-if-missing operations for seed documents keyed on `id`.
+
+    `defaults` are added to every inserted document (is_active,
+    timestamps); ids in `exclude` are never inserted.
+    """
+    excluded = set(exclude)
+    return [
+        UpdateOne({"id": doc["id"]}, {"$setOnInsert": {**(defaults or {}), **doc}}, upsert=True)
+        for doc in docs
+        if doc["id"] not in excluded
+    ]
+
+
+def seed_updates(updates: Dict[str, dict], *, exclude: Iterable[str] = ()) -> List[UpdateOne]:
+    """`$set` operations for existing seed documents, keyed on `id`."""
+    excluded = set(exclude)
+    return [UpdateOne({"id": doc_id}, {"$set": fields}) for doc_id, fields in updates.items() if doc_id not in excluded]
+
+
+class MigrationRunner:
+    """Applies the migrations not yet recorded in `_migrations`, in list order."""
+
+    def __init__(self, database, migrations: Iterable[Migration]):
+        self._db = database
+        self.migrations = list(migrations)
+        self._owner = uuid.uuid4().hex
+
+    @property
+    def records(self):
+        return self._db["_migrations"]
+
+    async def run(self) -> Dict[str, int]:
+        applied = set(await self.records.distinct("_id", {"status": "applied"}))
+        counts = {"applied": 0, "skipped": len(applied & {m.version for m in self.migrations}), "failed": 0}
+        for migration in self.migrations:
+            if migration.version in applied:
+                continue
+            if not await self._claim(migration):
+                # Another process is applying it and will go on with the rest
+                counts["skipped"] += 1
+                break
+            try:
+                result = await migration.apply(self._db)
+            except Exception as e:
+                counts["failed"] += 1
+                logger.error(f"Migration {migration.version} failed: {e}")
+                await self.records.update_one(
+                    {"_id": migration.version},
+                    {"$set": {"status": "failed", "error": str(e), "lease_until": None}},
+                )
+                # Later migrations may depend on this one
+                break
+            counts["applied"] += 1
+            await self.records.update_one({"_id": migration.version}, {"$set": {
+                "status": "applied",
+                "applied_at": datetime.now(timezone.utc),
+                "result": result,
+                "error": None,
+                "lease_until": None,
+            }})
+            logger.info(f"Migration {migration.version} applied: {result}")
+        return counts
+
+    async def status(self) -> List[dict]:
+        """Every known migration with its record (status "pending" when it has never run)."""
+        records = {r["_id"]: r async for r in self.records.find({})}
+        return [
+            {"version": m.version, "description": m.description, **{
+                k: v for k, v in (records.get(m.version) or {"status": "pending"}).items() if k != "_id"
+            }}
+            for m in self.migrations
+        ]
+
+    async def _claim(self, migration: Migration) -> bool:
+        now = datetime.now(timezone.utc)
+        try:
+            # Matches a failed or abandoned claim; otherwise the upsert inserts, or
+            # collides with a live/applied record on _id
+            await self.records.update_one(
+                {"_id": migration.version, "$or": [
+                    {"status": "failed"},
+                    {"status": "running", "lease_until": {"$lt": now}},
+                ]},
+                {"$set": {
+                    "description": migration.description,
+                    "status": "running",
+                    "owner": self._owner,
+                    "started_at": now,
+                    "lease_until": now + timedelta(seconds=LEASE_SECONDS),
+                }},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            return False
+        return True
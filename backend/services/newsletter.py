@@ -0,0 +1,342 @@
+"""Background dispatch of bulk newsletter emails.
+
+A bulk send is persisted as a job in `newsletter_jobs` plus one document per
+recipient in `newsletter_deliveries` (status pending -> sent / failed). A
+small pool of workers sends the pending recipients through the provider's
+batch endpoint, paced by a token bucket shared by all jobs, since the
+provider's rate limit applies to the whole account. Every RESUME_SECONDS
+each process looks for queued or running jobs whose lease is free or expired
+(left by a crashed process, or by a run that failed) and takes them over;
+only their still-pending recipients are sent.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+# Resend: at most 100 emails per batch call, 2 API requests per second per team
+BATCH_SIZE = int(os.environ.get("NEWSLETTER_BATCH_SIZE", "100"))
+RATE_PER_SECOND = float(os.environ.get("NEWSLETTER_RATE_PER_SECOND", "2"))
+WORKERS = int(os.environ.get("NEWSLETTER_WORKERS", "2"))
+MAX_ATTEMPTS = 3
+# A job is owned by one process at a time; the lease is renewed around every provider call
+LEASE_SECONDS = 120
+RESUME_SECONDS = int(os.environ.get("NEWSLETTER_RESUME_SECONDS", "60"))
+INSERT_CHUNK = 1000
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class LeaseLost(Exception):
+    """Another process took the job over (our lease had expired)."""
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class NewsletterDispatcher:
+    """Creates, runs and resumes bulk newsletter jobs.
+
+    `send_batch(params, idempotency_key)` performs one provider batch call
+    (it runs in a thread) and returns the provider response; per-recipient
+    rejections are read from its "errors" list of {"index", "message"}.
+    """
+
+    def __init__(self, database, send_batch: Callable[[List[dict], str], Any], *,
+                 batch_size: int = BATCH_SIZE, rate: float = RATE_PER_SECOND, workers: int = WORKERS):
+        self._db = database
+        self._send_batch = send_batch
+        self.batch_size = batch_size
+        self.workers = workers
+        self._bucket = TokenBucket(rate)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._resume_task: Optional[asyncio.Task] = None
+        self._owner = uuid.uuid4().hex
+
+    @property
+    def jobs(self):
+        return self._db.newsletter_jobs
+
+    @property
+    def deliveries(self):
+        return self._db.newsletter_deliveries
+
+    async def create_job(self, *, subject: str, html: str, sender: str, created_by: Optional[str] = None) -> Optional[dict]:
+        """Snapshot the active subscribers into a new job and start it; None if there are none."""
+        job_id = str(uuid.uuid4())
+        seen = set()
+        chunk: List[dict] = []
+        total = 0
+        async for sub in self._db.newsletter_subscriptions.find({"is_active": True}, {"_id": 0, "email": 1}):
+            email = (sub.get("email") or "").strip()
+            if not email or email.lower() in seen:
+                continue
+            seen.add(email.lower())
+            chunk.append({"job_id": job_id, "seq": total, "email": email, "status": "pending", "attempts": 0})
+            total += 1
+            if len(chunk) >= INSERT_CHUNK:
+                await self.deliveries.insert_many(chunk, ordered=False)
+                chunk = []
+        if chunk:
+            await self.deliveries.insert_many(chunk, ordered=False)
+        if total == 0:
+            return None
+
+        job = {
+            "id": job_id,
+            "subject": subject,
+            "html": html,
+            "from": sender,
+            "status": "queued",
+            "total": total,
+            "sent": 0,
+            "failed": 0,
+            "created_by": created_by,
+            "created_at": _now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "lease_owner": None,
+            "lease_until": None,
+        }
+        await self.jobs.insert_one(job)
+        job.pop("_id", None)
+        self.start(job_id)
+        return job
+
+    def start(self, job_id: str) -> bool:
+        """Run a job in the background unless this process is already running it."""
+        task = self._tasks.get(job_id)
+        if task is not None and not task.done():
+            return False
+        self._tasks[job_id] = asyncio.create_task(self._run(job_id))
+        return True
+
+    def _claimable(self, now: datetime) -> dict:
+        return {"$or": [
+            {"lease_until": None},
+            {"lease_until": {"$lt": now.isoformat()}},
+            {"lease_owner": self._owner},
+        ]}
+
+    async def resume(self) -> int:
+        """Start every queued or running job whose lease is free or expired; returns how many were started."""
+        started = 0
+        cursor = self.jobs.find(
+            {"status": {"$in": list(ACTIVE_STATUSES)}, **self._claimable(_now())}, {"_id": 0, "id": 1}
+        )
+        async for job in cursor:
+            if self.start(job["id"]):
+                logger.info(f"Resuming newsletter job {job['id']}")
+                started += 1
+        return started
+
+    def start_resuming(self):
+        """Resume abandoned jobs now and every RESUME_SECONDS (idempotent)."""
+        if self._resume_task is None:
+            self._resume_task = asyncio.create_task(self._resume_loop())
+
+    async def _resume_loop(self):
+        while True:
+            try:
+                await self.resume()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Newsletter resume failed: {e}")
+            await asyncio.sleep(RESUME_SECONDS)
+
+    async def stop(self):
+        """Cancel running jobs and release their leases so the next process can resume them."""
+        if self._resume_task is not None:
+            self._resume_task.cancel()
+            await asyncio.gather(self._resume_task, return_exceptions=True)
+            self._resume_task = None
+        tasks = [t for t in self._tasks.values() if not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        await self.jobs.update_many(
+            {"lease_owner": self._owner},
+            {"$set": {"lease_owner": None, "lease_until": None}},
+        )
+
+    async def progress(self, job_id: str) -> Optional[dict]:
+        job = await self.jobs.find_one({"id": job_id}, {"_id": 0, "html": 0, "lease_owner": 0})
+        if job:
+            job["pending"] = job["total"] - job["sent"] - job["failed"]
+        return job
+
+    # ─── Worker pool ──────────────────────────────────────────────────────────
+
+    async def _claim(self, job_id: str) -> Optional[dict]:
+        now = _now()
+        job = await self.jobs.find_one_and_update(
+            {"id": job_id, "status": {"$in": list(ACTIVE_STATUSES)}, **self._claimable(now)},
+            {"$set": {
+                "status": "running",
+                "lease_owner": self._owner,
+                "lease_until": (now + timedelta(seconds=LEASE_SECONDS)).isoformat(),
+            }},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+        if job and not job.get("started_at"):
+            await self.jobs.update_one({"id": job_id}, {"$set": {"started_at": now.isoformat()}})
+        return job
+
+    async def _run(self, job_id: str):
+        job = await self._claim(job_id)
+        if job is None:
+            return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+
+        async def produce():
+            batch: List[dict] = []
+            cursor = self.deliveries.find(
+                {"job_id": job_id, "status": "pending"}, {"_id": 0, "seq": 1, "email": 1}
+            ).sort("seq", 1)
+            async for delivery in cursor:
+                batch.append(delivery)
+                if len(batch) >= self.batch_size:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+            for _ in range(self.workers):
+                await queue.put(None)
+
+        async def work():
+            while (batch := await queue.get()) is not None:
+                await self._send(job, batch)
+
+        try:
+            tasks = [asyncio.ensure_future(produce()), *(asyncio.ensure_future(work()) for _ in range(self.workers))]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # A failed worker must not leave the producer blocked on a full queue
+                for task in tasks:
+                    task.cancel()
+            await self.jobs.update_one(
+                {"id": job_id, "lease_owner": self._owner},
+                {"$set": {"status": "completed", "finished_at": _now().isoformat(),
+                          "lease_owner": None, "lease_until": None}},
+            )
+            logger.info(f"Newsletter job {job_id} completed")
+        except asyncio.CancelledError:
+            raise
+        except LeaseLost:
+            logger.warning(f"Newsletter job {job_id} was taken over by another process")
+        except Exception as e:
+            # Left running with the lease released: the next resume pass picks it up again
+            logger.error(f"Newsletter job {job_id} interrupted: {e}")
+            await self.jobs.update_one(
+                {"id": job_id, "lease_owner": self._owner},
+                {"$set": {"lease_owner": None, "lease_until": None}},
+            )
+
+    async def _send(self, job: dict, batch: List[dict]):
+        emails = [d["email"] for d in batch]
+        params = [
+            {"from": job["from"], "to": [email], "subject": job["subject"], "html": job["html"]}
+            for email in emails
+        ]
+        # Same recipients -> same key, so a batch re-sent after a crash is deduplicated by the provider
+        key = f"newsletter-{job['id']}-{hashlib.sha1(chr(10).join(emails).encode()).hexdigest()[:20]}"
+
+        errors: Dict[int, str] = {}
+        batch_error = None
+        attempts = 0
+        for attempts in range(1, MAX_ATTEMPTS + 1):
+            await self._bucket.acquire()
+            # Retries can outlast the lease: never send once another process owns the job
+            await self._renew(job["id"])
+            try:
+                response = await asyncio.to_thread(self._send_batch, params, key)
+                errors = {e["index"]: e.get("message", "rejected") for e in (response or {}).get("errors") or []}
+                batch_error = None
+                break
+            except Exception as e:
+                batch_error = str(e)
+                logger.warning(f"Newsletter batch failed (attempt {attempts}/{MAX_ATTEMPTS}): {e}")
+                if attempts < MAX_ATTEMPTS:
+                    await self._renew(job["id"])
+                    await asyncio.sleep(2 ** attempts)
+        await self._renew(job["id"])
+
+        now = _now()
+        if batch_error is not None:
+            failed = {d["seq"]: batch_error for d in batch}
+        else:
+            failed = {batch[i]["seq"]: message for i, message in errors.items() if 0 <= i < len(batch)}
+        sent_seqs = [d["seq"] for d in batch if d["seq"] not in failed]
+        # Only pending rows move, and only the rows that moved are counted, so a
+        # batch a taken-over job already recorded is never counted twice
+        pending = {"job_id": job["id"], "status": "pending"}
+        sent = failed_count = 0
+        if sent_seqs:
+            result = await self.deliveries.update_many(
+                {**pending, "seq": {"$in": sent_seqs}},
+                {"$set": {"status": "sent", "sent_at": now.isoformat()}, "$inc": {"attempts": attempts}},
+            )
+            sent = result.modified_count
+        if batch_error is not None:
+            result = await self.deliveries.update_many(
+                {**pending, "seq": {"$in": list(failed)}},
+                {"$set": {"status": "failed", "error": batch_error}, "$inc": {"attempts": attempts}},
+            )
+            failed_count = result.modified_count
+        else:
+            for seq, message in failed.items():
+                result = await self.deliveries.update_one(
+                    {**pending, "seq": seq},
+                    {"$set": {"status": "failed", "error": message}, "$inc": {"attempts": attempts}},
+                )
+                failed_count += result.modified_count
+        if sent or failed_count:
+            await self.jobs.update_one(
+                {"id": job["id"], "lease_owner": self._owner},
+                {"$inc": {"sent": sent, "failed": failed_count}},
+            )
+
+    async def _renew(self, job_id: str):
+        """Extend our lease on a job; raises LeaseLost if another process took it over."""
+        renewed = await self.jobs.update_one(
+            {"id": job_id, "lease_owner": self._owner},
+            {"$set": {"lease_until": (_now() + timedelta(seconds=LEASE_SECONDS)).isoformat()}},
+        )
+        if renewed.matched_count == 0:
+            raise LeaseLost(job_id)
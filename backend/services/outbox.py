@@ -0,0 +1,256 @@
+"""Durable outbox for transactional emails.
+
+Request handlers only insert a message into the `email_outbox` collection;
+a pool of async workers claims due messages (a leased `find_one_and_update`,
+so several processes can drain the same outbox), sends them through a
+dedicated thread pool and records the outcome. Failed sends are retried with
+exponential backoff and jitter; after MAX_ATTEMPTS a message is dead-lettered
+(status "dead") for an admin to inspect and requeue. Every message carries a
+dedup key: a unique index makes enqueueing the same logical email twice a
+no-op, and the key doubles as the provider's idempotency key so a send that
+is retried after a crash is not delivered twice.
+
+Mail queued before a restart is sent by the next process, and a slow provider
+only ties up the outbox's own threads, not the default executor used by
+storage and image calls.
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+WORKERS = int(os.environ.get("EMAIL_OUTBOX_WORKERS", "4"))
+MAX_ATTEMPTS = int(os.environ.get("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+# Retry delays: 30s, 1m, 2m, 4m, 8m ... capped at one hour
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+# A claimed message is re-claimable by any worker once its lease expires
+LEASE_SECONDS = 120
+# Workers are woken by enqueue(); polling picks up retries and other processes' mail
+POLL_SECONDS = 5
+LATENCY_SAMPLES = 1000
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds before retry number `attempts` (1-based), with +/-20% jitter."""
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _percentile(samples: List[float], pct: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 1)
+
+
+class EmailOutbox:
+    """Enqueues emails into `email_outbox` and drains it with a worker pool.
+
+    `send(params, idempotency_key)` performs one provider call; it runs in the
+    outbox's own thread pool and raises on failure.
+    """
+
+    def __init__(self, database, send: Callable[[dict, str], Any], *,
+                 workers: int = WORKERS, max_attempts: int = MAX_ATTEMPTS):
+        self._db = database
+        self._send = send
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._owner = uuid.uuid4().hex
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._lags: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._counters = {"enqueued": 0, "duplicates": 0, "sent": 0, "retried": 0, "dead": 0}
+
+    @property
+    def messages(self):
+        return self._db.email_outbox
+
+    async def enqueue(self, *, to: List[str], subject: str, html: str, sender: str,
+                      dedup_key: str, kind: Optional[str] = None) -> bool:
+        """Queue one email; False if a message with the same dedup key was already queued."""
+        now = _now()
+        doc = {
+            "id": str(uuid.uuid4()),
+            "dedup_key": dedup_key,
+            "kind": kind,
+            "params": {"from": sender, "to": to, "subject": subject, "html": html},
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+            "sent_at": None,
+            "last_error": None,
+            "lease_owner": None,
+            "lease_until": None,
+        }
+        try:
+            await self.messages.insert_one(doc)
+        except DuplicateKeyError:
+            self._counters["duplicates"] += 1
+            logger.info(f"Email {dedup_key} already queued; skipping")
+            return False
+        self._counters["enqueued"] += 1
+        self._wakeup.set()
+        return True
+
+    def start(self):
+        """Start the worker pool (idempotent)."""
+        if self._tasks:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="email-outbox")
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """Stop the workers and hand their in-flight messages back to the queue."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.messages.update_many(
+            {"status": "sending", "lease_owner": self._owner},
+            {"$set": {"status": "pending", "lease_owner": None, "lease_until": None}},
+        )
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def requeue(self, message_id: str) -> bool:
+        """Give a dead-lettered message a fresh set of attempts."""
+        result = await self.messages.update_one(
+            {"id": message_id, "status": "dead"},
+            {"$set": {"status": "pending", "attempts": 0, "next_attempt_at": _now(), "last_error": None}},
+        )
+        if result.modified_count:
+            self._wakeup.set()
+        return bool(result.modified_count)
+
+    async def dead_letters(self, limit: int = 50) -> List[dict]:
+        return await self.messages.find(
+            {"status": "dead"}, {"_id": 0, "params.html": 0, "lease_owner": 0, "lease_until": 0}
+        ).sort("created_at", -1).to_list(limit)
+
+    async def metrics(self) -> Dict[str, Any]:
+        """Queue depth by status plus this process's send counters and latencies (ms)."""
+        depth = {"pending": 0, "sending": 0, "sent": 0, "dead": 0}
+        async for row in self.messages.aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}]):
+            depth[row["_id"]] = row["count"]
+        oldest = await self.messages.find_one(
+            {"status": {"$in": ["pending", "sending"]}}, {"_id": 0, "created_at": 1}, sort=[("created_at", 1)]
+        )
+        oldest_age = None
+        if oldest:
+            created = oldest["created_at"]
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            oldest_age = round((_now() - created).total_seconds(), 1)
+        latencies, lags = list(self._latencies), list(self._lags)
+        return {
+            "depth": depth,
+            "oldest_pending_age_seconds": oldest_age,
+            "workers": len(self._tasks),
+            "counters": dict(self._counters),
+            # Provider call duration
+            "send_latency_ms": {"p50": _percentile(latencies, 0.5), "p95": _percentile(latencies, 0.95),
+                                "max": round(max(latencies), 1) if latencies else None},
+            # Enqueue to successful send, including retries
+            "delivery_lag_ms": {"p50": _percentile(lags, 0.5), "p95": _percentile(lags, 0.95)},
+        }
+
+    # ─── Worker pool ──────────────────────────────────────────────────────────
+
+    async def _claim(self) -> Optional[dict]:
+        now = _now()
+        return await self.messages.find_one_and_update(
+            {"$or": [
+                {"status": "pending", "next_attempt_at": {"$lte": now}},
+                # Lease expired: the worker that claimed it died mid-send
+                {"status": "sending", "lease_until": {"$lt": now}},
+            ]},
+            {"$set": {
+                "status": "sending",
+                "lease_owner": self._owner,
+                "lease_until": now + timedelta(seconds=LEASE_SECONDS),
+            }, "$inc": {"attempts": 1}},
+            sort=[("next_attempt_at", 1)],
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _work(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Cleared before claiming, so an enqueue racing with an empty claim still wakes us
+            self._wakeup.clear()
+            try:
+                message = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Email outbox claim failed: {e}")
+                message = None
+            if message is None:
+                # asyncio.wait rather than wait_for: wait_for can swallow a
+                # cancellation that races with the event being set (Python < 3.12)
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=POLL_SECONDS)
+                finally:
+                    waiter.cancel()
+                continue
+            await self._deliver(loop, message)
+
+    async def _deliver(self, loop, message: dict):
+        started = time.perf_counter()
+        try:
+            await loop.run_in_executor(self._executor, self._send, message["params"], message["dedup_key"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._failed(message, str(e))
+            return
+        now = _now()
+        self._latencies.append((time.perf_counter() - started) * 1000)
+        created = message["created_at"]
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        self._lags.append((now - created).total_seconds() * 1000)
+        self._counters["sent"] += 1
+        await self.messages.update_one(
+            {"id": message["id"]},
+            {"$set": {"status": "sent", "sent_at": now, "last_error": None,
+                      "lease_owner": None, "lease_until": None}},
+        )
+        logger.info(f"Email {message['dedup_key']} sent")
+
+    async def _failed(self, message: dict, error: str):
+        attempts = message["attempts"]
+        update = {"last_error": error, "lease_owner": None, "lease_until": None}
+        if attempts >= self.max_attempts:
+            update["status"] = "dead"
+            self._counters["dead"] += 1
+            logger.error(f"Email {message['dedup_key']} dead-lettered after {attempts} attempts: {error}")
+        else:
+            update["status"] = "pending"
+            update["next_attempt_at"] = _now() + timedelta(seconds=backoff_delay(attempts))
+            self._counters["retried"] += 1
+            logger.warning(f"Email {message['dedup_key']} failed (attempt {attempts}/{self.max_attempts}): {error}")
+        await self.messages.update_one({"id": message["id"]}, {"$set": update})
@@ -0,0 +1,76 @@
+"""Sparse fieldsets and keyset pagination for catalog listings.
+
+Listings are ordered by (display_order, id), the same compound key the
+collections are indexed on. A cursor is the opaque, URL-safe encoding of the
+last key on the previous page, so pages stay stable while documents are
+added or reordered elsewhere in the list.
+"""
+import base64
+import re
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+import orjson
+
+FIELD_RE = re.compile(r"^\w+$")
+MAX_FIELDS = 40
+
+
+def sort_key(doc: dict) -> Tuple[float, str]:
+    return (doc.get("display_order") or 0, str(doc.get("id") or ""))
+
+
+def encode_key(key: Sequence) -> str:
+    """Opaque, URL-safe cursor for a sort key."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(key))).decode("ascii").rstrip("=")
+
+
+def decode_key(cursor: str) -> list:
+    """Inverse of encode_key; raises ValueError on anything malformed."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, list):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+def encode_cursor(doc: dict) -> str:
+    return encode_key(sort_key(doc))
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Inverse of encode_cursor; raises ValueError on anything malformed."""
+    key = decode_key(cursor)
+    if len(key) != 2:
+        raise ValueError("Invalid cursor")
+    order, doc_id = key
+    if not isinstance(order, (int, float)) or isinstance(order, bool) or not isinstance(doc_id, str):
+        raise ValueError("Invalid cursor")
+    return order, doc_id
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse `fields=id,name,image` into a tuple (id is always included)."""
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    if len(names) > MAX_FIELDS or not all(FIELD_RE.match(n) for n in names):
+        raise ValueError("Invalid fields parameter")
+    return tuple(dict.fromkeys(["id", *names]))
+
+
+def project_fields(items: List[dict], fields: Optional[Tuple[str, ...]]) -> List[dict]:
+    if not fields:
+        return items
+    return [{f: item[f] for f in fields if f in item} for item in items]
+
+
+def paginate(items: List[dict], cursor: Optional[str], limit: int) -> Tuple[List[dict], Optional[str]]:
+    """Return the page after `cursor` and the cursor for the page after it."""
+    ordered = sorted(items, key=sort_key)
+    start = bisect_right(ordered, decode_cursor(cursor), key=sort_key) if cursor else 0
+    page = ordered[start:start + limit]
+    has_more = start + limit < len(ordered)
+    return page, (encode_cursor(page[-1]) if has_more and page else None)
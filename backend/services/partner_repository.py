@@ -0,0 +1,218 @@
+"""Create/update/soft-delete for the partner catalog collections.
+
+Golf courses, hotels, restaurants, beach clubs and cafés/bars share one
+document shape (`id`, `is_active`, `display_order`, timestamps), so one
+`PartnerRepository` per collection replaces the per-type handlers. Every
+write is a single round-trip:
+
+- create is an upsert with `$setOnInsert` on the unique `id` index, so an
+  existing id is detected by the write itself instead of a prior find_one;
+- update is `find_one_and_update(..., return_document=AFTER)`, which both
+  reports a missing document and returns the updated one;
+- delete sets is_active = False and reports a missing document from the
+  match count;
+- reorder/resequence read the current positions once and send only the
+  changed ones in one unordered bulk_write, optionally inside a
+  transaction so a drag-and-drop reorder is applied all or nothing.
+
+Successful writes publish a `CatalogChange` on `CatalogEvents`; the catalog
+cache (and anything else caching partner data) subscribes to it instead of
+each handler invalidating caches by hand.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogChange(NamedTuple):
+    collection: str
+    op: str  # "create", "update", "delete" or "reorder"
+    id: Optional[str]  # None for reorders, which touch many documents
+
+
+class CatalogEvents:
+    """Synchronous fan-out of catalog changes to subscribers."""
+
+    def __init__(self):
+        self._listeners: List[Callable[[CatalogChange], None]] = []
+
+    def subscribe(self, listener: Callable[[CatalogChange], None]):
+        self._listeners.append(listener)
+
+    def emit(self, change: CatalogChange):
+        for listener in self._listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                logger.error(f"Catalog change listener failed for {change}: {e}")
+
+
+class PartnerExists(Exception):
+    pass
+
+
+class PartnerNotFound(Exception):
+    pass
+
+
+class TransactionsUnsupported(Exception):
+    """A transaction was requested but the server is a standalone mongod."""
+
+
+# Never written from a request body
+PROTECTED_FIELDS = ("_id", "id", "created_at")
+
+
+class PartnerRepository:
+    """Writes for one catalog collection.
+
+    `partner_type` is stored as `type` on created documents (golf courses
+    have none). With `append` a document created without a display_order
+    is placed after the current last one; this costs one extra read.
+    """
+
+    def __init__(self, database, collection: str, label: str, events: CatalogEvents, *,
+                 partner_type: Optional[str] = None, append: bool = False):
+        self._db = database
+        self.collection_name = collection
+        self.label = label
+        self.partner_type = partner_type
+        self.append = append
+        self._events = events
+
+    @property
+    def collection(self):
+        return self._db[self.collection_name]
+
+    async def create(self, doc: dict) -> dict:
+        """Insert a new active document (raises PartnerExists if the id is taken)."""
+        doc = dict(doc)
+        doc.pop("_id", None)
+        now = datetime.now(timezone.utc)
+        if self.partner_type:
+            doc["type"] = self.partner_type
+        doc["is_active"] = True
+        if not doc.get("display_order"):
+            doc["display_order"] = await self._next_display_order() if self.append else doc.get("display_order", 0)
+        doc["created_at"] = now
+        doc["updated_at"] = now
+        try:
+            result = await self.collection.update_one({"id": doc.get("id")}, {"$setOnInsert": doc}, upsert=True)
+        except DuplicateKeyError:
+            # Lost a race with a concurrent create of the same id
+            raise PartnerExists(doc.get("id"))
+        if result.upserted_id is None:
+            raise PartnerExists(doc.get("id"))
+        self._events.emit(CatalogChange(self.collection_name, "create", doc.get("id")))
+        return doc
+
+    async def update(self, partner_id: str, changes: dict) -> dict:
+        """Apply `changes` with $set and return the updated document (raises PartnerNotFound)."""
+        changes = {k: v for k, v in changes.items() if k not in PROTECTED_FIELDS}
+        if not changes:
+            doc = await self.collection.find_one({"id": partner_id}, {"_id": 0})
+        else:
+            changes["updated_at"] = datetime.now(timezone.utc)
+            doc = await self.collection.find_one_and_update(
+                {"id": partner_id},
+                {"$set": changes},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER,
+            )
+        if doc is None:
+            raise PartnerNotFound(partner_id)
+        if changes:
+            self._events.emit(CatalogChange(self.collection_name, "update", partner_id))
+        return doc
+
+    async def delete(self, partner_id: str):
+        """Soft delete: mark the document inactive (raises PartnerNotFound)."""
+        result = await self.collection.update_one(
+            {"id": partner_id},
+            {"$set": {"is_active": False, "updated_at": datetime.now(timezone.utc)}},
+        )
+        if result.matched_count == 0:
+            raise PartnerNotFound(partner_id)
+        self._events.emit(CatalogChange(self.collection_name, "delete", partner_id))
+
+    async def reorder(self, ids: List[str], *, start: int = 1, transaction: bool = False) -> Dict[str, object]:
+        """Give `ids` the display_order start, start+1, ... in list order.
+
+        Documents not listed keep their position; unknown ids are skipped
+        and returned as "missing". Raises ValueError for duplicate ids.
+        """
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate ids in reorder request")
+        result = await self._in_session(transaction, self._reorder, ids, start)
+        self._reordered(result)
+        return {**result, "total": len(ids)}
+
+    async def resequence(self, *, transaction: bool = False) -> Dict[str, object]:
+        """Renumber every document 1..N, keeping the current order (unset/0 last, then by created_at)."""
+        result = await self._in_session(transaction, self._resequence)
+        self._reordered(result)
+        return result
+
+    def _reordered(self, result: dict):
+        # After the transaction committed, so a cache reload cannot see the old order
+        if result["updated"]:
+            self._events.emit(CatalogChange(self.collection_name, "reorder", None))
+
+    async def _reorder(self, ids: List[str], start: int, session) -> Dict[str, object]:
+        cursor = self.collection.find({"id": {"$in": ids}}, {"_id": 0, "id": 1, "display_order": 1}, session=session)
+        current = {doc["id"]: doc.get("display_order") async for doc in cursor}
+        positions = [(partner_id, position) for position, partner_id in enumerate(ids, start=start)
+                     if partner_id in current]
+        updated = await self._apply_positions(positions, current, session)
+        return {"updated": updated, "missing": [i for i in ids if i not in current]}
+
+    async def _resequence(self, session) -> Dict[str, object]:
+        docs = await self.collection.find(
+            {}, {"_id": 0, "id": 1, "display_order": 1, "created_at": 1}, session=session
+        ).to_list(None)
+
+        def sort_key(doc):
+            created = doc.get("created_at") or datetime.min.replace(tzinfo=timezone.utc)
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            return (doc.get("display_order") or float("inf"), created)
+
+        ordered = sorted(docs, key=sort_key)
+        current = {doc["id"]: doc.get("display_order") for doc in docs}
+        positions = [(doc["id"], position) for position, doc in enumerate(ordered, start=1)]
+        updated = await self._apply_positions(positions, current, session)
+        return {"updated": updated, "total": len(docs)}
+
+    async def _apply_positions(self, positions, current: Dict[str, Optional[int]], session) -> int:
+        now = datetime.now(timezone.utc)
+        requests = [
+            UpdateOne({"id": partner_id}, {"$set": {"display_order": position, "updated_at": now}})
+            for partner_id, position in positions
+            if current.get(partner_id) != position
+        ]
+        if not requests:
+            return 0
+        await self.collection.bulk_write(requests, ordered=False, session=session)
+        return len(requests)
+
+    async def _in_session(self, transaction: bool, operation, *args):
+        if not transaction:
+            return await operation(*args, None)
+        try:
+            async with await self._db.client.start_session() as session:
+                async with session.start_transaction():
+                    return await operation(*args, session)
+        except OperationFailure as e:
+            # Code 20 (IllegalOperation): transactions need a replica set or mongos
+            if e.code == 20:
+                raise TransactionsUnsupported(str(e)) from e
+            raise
+
+    async def _next_display_order(self) -> int:
+        last = await self.collection.find_one({}, {"_id": 0, "display_order": 1}, sort=[("display_order", -1)])
+        return ((last or {}).get("display_order") or 0) + 1
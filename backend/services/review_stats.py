@@ -0,0 +1,104 @@
+"""Running review statistics kept in one `review_stats` document.
+
+Instead of scanning every review per request, the totals are maintained
+incrementally: `count`, `sum` of ratings, a per-rating histogram and
+per-country / per-platform counters. A counted review is applied with a
+single `$inc` (+1 when a client review is created or a user review becomes
+approved, -1 when an approved review is rejected), so concurrent writers
+never overwrite each other, and the stats endpoint is one find_one by _id.
+
+`rebuild` recomputes the document from scratch (static dataset + client
+reviews + approved user reviews); migration 0005_seed_review_stats runs it
+once, and the admin endpoint can rerun it should the counters drift.
+"""
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+STATS_ID = "reviews"
+RATINGS = range(1, 6)
+
+
+def _field(key: str) -> str:
+    # Country/platform names become field names: '.' and a leading '$' are not allowed there
+    key = key.replace(".", "．")
+    return "＄" + key[1:] if key.startswith("$") else key
+
+
+def _unfield(field: str) -> str:
+    return field.replace("．", ".").replace("＄", "$")
+
+
+def _increments(review: dict, sign: int) -> dict:
+    inc = {"count": sign, "sum": sign * review["rating"], f"ratings.{review['rating']}": sign}
+    if review.get("country"):
+        inc[f"by_country.{_field(review['country'])}"] = sign
+    if review.get("platform"):
+        inc[f"by_platform.{_field(review['platform'])}"] = sign
+    return inc
+
+
+class ReviewStats:
+    """Atomic counters over every published review."""
+
+    def __init__(self, database):
+        self._db = database
+
+    @property
+    def stats(self):
+        return self._db.review_stats
+
+    async def add(self, review: dict):
+        """Count a review that became visible."""
+        await self._apply(review, 1)
+
+    async def remove(self, review: dict):
+        """Uncount a previously visible review."""
+        await self._apply(review, -1)
+
+    async def _apply(self, review: dict, sign: int):
+        await self.stats.update_one(
+            {"_id": STATS_ID},
+            {"$inc": _increments(review, sign), "$set": {"updated_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+
+    async def read(self) -> dict:
+        """The public stats payload: one indexed read, no scan."""
+        doc = await self.stats.find_one({"_id": STATS_ID}) or {}
+        count = doc.get("count", 0)
+        if not count:
+            return {"average_rating": 0, "total_reviews": 0, "rating_distribution": {}, "by_country": {}, "by_platform": {}}
+        ratings = doc.get("ratings") or {}
+        return {
+            "average_rating": round(doc.get("sum", 0) / count, 1),
+            "total_reviews": count,
+            "rating_distribution": {i: ratings.get(str(i), 0) for i in RATINGS},
+            "by_country": {_unfield(k): v for k, v in (doc.get("by_country") or {}).items() if v},
+            "by_platform": {_unfield(k): v for k, v in (doc.get("by_platform") or {}).items() if v},
+        }
+
+    async def rebuild(self, static_reviews: Iterable[dict]) -> dict:
+        """Recompute the counters from the static dataset and the live collections."""
+        reviews = list(static_reviews)
+        reviews += await self._db.reviews.find({}, {"_id": 0, "rating": 1, "country": 1, "platform": 1}).to_list(None)
+        reviews += await self._db.user_reviews.find(
+            {"status": "approved"}, {"_id": 0, "rating": 1, "country": 1, "platform": 1}
+        ).to_list(None)
+        totals: Counter = Counter()
+        for review in reviews:
+            totals.update(_increments(review, 1))
+        doc = {"count": 0, "sum": 0, "ratings": {}, "by_country": {}, "by_platform": {}}
+        for path, value in totals.items():
+            if "." in path:
+                group, key = path.split(".", 1)
+                doc[group][key] = value
+            else:
+                doc[path] = value
+        doc["updated_at"] = datetime.now(timezone.utc)
+        await self.stats.replace_one({"_id": STATS_ID}, doc, upsert=True)
+        logger.info(f"Review stats rebuilt from {len(reviews)} reviews")
+        return {"reviews": len(reviews)}
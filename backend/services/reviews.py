@@ -0,0 +1,108 @@
+"""Public review stream: static dataset plus approved user reviews, indexed in memory.
+
+`ReviewIndex` orders every public review by its integer `id` and keeps
+per-country, per-platform and per-(country, platform) buckets (keys
+lowercased), so a filtered request is a dict lookup instead of a scan, and
+keyset pagination is a bisect on `id` inside the bucket.
+
+`ReviewFeed` builds the index from the static dataset and approved user
+reviews (`user_reviews`), behind a `VersionedCache` that the approve and
+reject handlers bump. Client reviews (`reviews` collection) come from an
+anonymous, unmoderated form and are never published. Stored reviews of both
+kinds get their `id` from a `SequenceAllocator` whose floor is the highest
+static id, so they never collide with the dataset or each other.
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from functools import cached_property
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from services.cache_versions import VersionedCache
+from services.sequences import SequenceAllocator
+
+# Never exposed on the public stream
+PRIVATE_FIELDS = ("_id", "user_id", "user_email", "status", "reviewed_at")
+
+
+def _id(review: dict) -> int:
+    return review["id"]
+
+
+class ReviewIndex:
+    """Reviews in id order with country/platform buckets."""
+
+    def __init__(self, reviews: Iterable[dict] = ()):
+        ordered = sorted(reviews, key=_id)
+        buckets: Dict[Tuple[Optional[str], Optional[str]], List[dict]] = defaultdict(list)
+        for review in ordered:
+            country = (review.get("country") or "").lower()
+            platform = (review.get("platform") or "").lower()
+            buckets[(country, None)].append(review)
+            buckets[(None, platform)].append(review)
+            buckets[(country, platform)].append(review)
+        buckets[(None, None)] = ordered
+        self._buckets = dict(buckets)
+
+    def select(self, country: Optional[str] = None, platform: Optional[str] = None) -> List[dict]:
+        """Reviews matching the (case-insensitive) filters, in id order (shared list: do not mutate)."""
+        key = (country.lower() if country else None, platform.lower() if platform else None)
+        return self._buckets.get(key, [])
+
+    def page(self, country: Optional[str], platform: Optional[str], after: Optional[int],
+             limit: int) -> Tuple[List[dict], Optional[int]]:
+        """Up to `limit` reviews with id > `after`, and the id to continue after (None on the last page)."""
+        reviews = self.select(country, platform)
+        start = bisect_right(reviews, after, key=_id) if after is not None else 0
+        page = reviews[start:start + limit]
+        has_more = start + limit < len(reviews)
+        return page, (page[-1]["id"] if has_more and page else None)
+
+    def __len__(self) -> int:
+        return len(self._buckets[(None, None)])
+
+
+class ReviewFeed:
+    """The cached ReviewIndex and the id allocator for stored reviews."""
+
+    def __init__(self, database, static_reviews: Callable[[], List[dict]], *, check_seconds: float = 5.0):
+        self._db = database
+        # Called on first use, so the dataset is not imported at startup
+        self.static_reviews = static_reviews
+        self._cache = VersionedCache(database, "reviews", self._load, check_seconds=check_seconds)
+
+    @cached_property
+    def ids(self) -> SequenceAllocator:
+        return SequenceAllocator(self._db, "reviews", floor=max((r["id"] for r in self.static_reviews()), default=0))
+
+    async def index(self) -> ReviewIndex:
+        return await self._cache.get()
+
+    async def changed(self):
+        """A user review was approved or rejected."""
+        await self._cache.changed()
+
+    async def _load(self) -> ReviewIndex:
+        hidden = {field: 0 for field in PRIVATE_FIELDS}
+        approved = await self._db.user_reviews.find(
+            {"status": "approved", "id": {"$type": "int"}}, hidden
+        ).sort("id", 1).to_list(None)
+        return ReviewIndex([*self.static_reviews(), *approved])
+
+    async def assign_ids(self) -> dict:
+        """Give stored reviews that predate the allocator (max()+1 ids, so
+        duplicates) and approved user reviews without an id a fresh one."""
+        legacy = await self._db.reviews.find({"created_at": {"$exists": False}}, {"_id": 1}).sort("_id", 1).to_list(None)
+        users = await self._db.user_reviews.find(
+            {"status": "approved", "id": {"$exists": False}}, {"_id": 1}
+        ).sort("created_at", 1).to_list(None)
+        for collection, docs in ((self._db.reviews, legacy), (self._db.user_reviews, users)):
+            if docs:
+                await collection.bulk_write(
+                    [UpdateOne({"_id": doc["_id"]}, {"$set": {"id": await self.ids.next()}}) for doc in docs],
+                    ordered=False,
+                )
+        if legacy or users:
+            await self.changed()
+        return {"reviews": len(legacy), "user_reviews": len(users)}
@@ -0,0 +1,154 @@
+"""Inverted index behind /api/search.
+
+Each partner type gets its own segment built from the catalog cache snapshot:
+a trigram index over every searchable field (substring matches) and a word
+vocabulary over name/location (typo-tolerant matches). A segment is rebuilt
+only when the catalog cache hands out a new snapshot for its collection, so
+keystroke searches never touch MongoDB and never rescan every document.
+"""
+import re
+import os
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from services.fuzzy import compile_pattern
+
+WORD_RE = re.compile(r"\w+")
+
+# Query words shorter than this are never fuzzy matched; indexed words
+# shorter than MIN_FUZZY_TEXT_WORD are ignored as fuzzy candidates.
+MIN_FUZZY_QUERY_WORD = 4
+MIN_FUZZY_TEXT_WORD = 3
+# Fuzzy results remembered per segment; query words are arbitrary user input,
+# so the memo is an LRU rather than growing until the next rebuild
+FUZZY_MEMO_SIZE = int(os.environ.get("SEARCH_FUZZY_MEMO_SIZE", "1024"))
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def max_typos(word: str) -> int:
+    """Allowed edit distance: 1 for 4-6 chars, 2 for 7+ chars."""
+    return 1 if len(word) < 7 else 2
+
+
+def searchable_texts(item: dict) -> List[str]:
+    """Lowercased name, location, description (all languages), category and region."""
+    texts = [item.get("name") or "", item.get("location") or ""]
+    description = item.get("description") or {}
+    if isinstance(description, dict):
+        texts.extend(str(v) for v in description.values())
+    else:
+        texts.append(str(description))
+    texts.append(str(item.get("category") or ""))
+    texts.append(str(item.get("region") or ""))
+    return [t.lower() for t in texts if t]
+
+
+class _Segment:
+    """Index over the active documents of one collection snapshot."""
+
+    def __init__(self, source: List[dict]):
+        self.source = source
+        self.docs = [d for d in source if d.get("is_active") is True]
+        self.texts: List[List[str]] = []
+        self.grams: Dict[str, Set[int]] = defaultdict(set)
+        self.words: Dict[str, Set[int]] = defaultdict(set)
+        self.words_by_len: Dict[int, Set[str]] = defaultdict(set)
+        self.word_grams: Dict[str, Set[str]] = defaultdict(set)
+        self._fuzzy_memo: "OrderedDict[str, Set[int]]" = OrderedDict()
+
+        for idx, doc in enumerate(self.docs):
+            texts = searchable_texts(doc)
+            self.texts.append(texts)
+            for text in texts:
+                for gram in trigrams(text):
+                    self.grams[gram].add(idx)
+            name_location = f"{doc.get('name') or ''} {doc.get('location') or ''}".lower()
+            for word in WORD_RE.findall(name_location):
+                if len(word) < MIN_FUZZY_TEXT_WORD:
+                    continue
+                self.words[word].add(idx)
+        for word in self.words:
+            self.words_by_len[len(word)].add(word)
+            for gram in trigrams(word):
+                self.word_grams[gram].add(word)
+
+    def substring_matches(self, query: str) -> Set[int]:
+        if len(query) < 3:
+            candidates: Iterable[int] = range(len(self.docs))
+        else:
+            postings = sorted((self.grams.get(g, set()) for g in trigrams(query)), key=len)
+            if not postings or not postings[0]:
+                return set()
+            candidates = set.intersection(*postings)
+        return {idx for idx in candidates if any(query in text for text in self.texts[idx])}
+
+    def _fuzzy_candidates(self, word: str, max_dist: int) -> Set[str]:
+        # q-gram lemma: strings within k edits share at least |grams| - 3k trigrams
+        query_grams = trigrams(word)
+        threshold = len(query_grams) - 3 * max_dist
+        if threshold > 0:
+            counts: Dict[str, int] = defaultdict(int)
+            for gram in query_grams:
+                for candidate in self.word_grams.get(gram, ()):
+                    counts[candidate] += 1
+            return {w for w, n in counts.items() if n >= threshold and abs(len(w) - len(word)) <= max_dist}
+        candidates: Set[str] = set()
+        for length in range(len(word) - max_dist, len(word) + max_dist + 1):
+            candidates |= self.words_by_len.get(length, set())
+        return candidates
+
+    def fuzzy_matches(self, word: str) -> Set[int]:
+        matches = self._fuzzy_memo.get(word)
+        if matches is not None:
+            self._fuzzy_memo.move_to_end(word)
+        else:
+            max_dist = max_typos(word)
+            pattern = compile_pattern(word, max_dist)
+            matches = set()
+            for candidate in self._fuzzy_candidates(word, max_dist):
+                if pattern.matches(candidate):
+                    matches |= self.words[candidate]
+            self._fuzzy_memo[word] = matches
+            if len(self._fuzzy_memo) > FUZZY_MEMO_SIZE:
+                self._fuzzy_memo.popitem(last=False)
+        return matches
+
+    def search(self, query: str) -> List[dict]:
+        if not query:
+            return list(self.docs)
+        matched = self.substring_matches(query)
+        for word in WORD_RE.findall(query):
+            if len(word) >= MIN_FUZZY_QUERY_WORD:
+                matched |= self.fuzzy_matches(word)
+        return [self.docs[idx] for idx in sorted(matched)]
+
+
+class SearchIndex:
+    """Per partner type search segments kept in sync with the catalog cache."""
+
+    def __init__(self, catalog_cache, sources: Dict[str, str]):
+        # sources maps the partner type reported in results to its collection
+        self._cache = catalog_cache
+        self.sources = dict(sources)
+        self._segments: Dict[str, _Segment] = {}
+
+    async def _segment(self, partner_type: str) -> _Segment:
+        docs = await self._cache.get(self.sources[partner_type])
+        segment = self._segments.get(partner_type)
+        # The cache hands out a new list object whenever the collection changed
+        if segment is None or segment.source is not docs:
+            segment = _Segment(docs)
+            self._segments[partner_type] = segment
+        return segment
+
+    async def search(self, query: str, partner_types: Optional[Iterable[str]] = None) -> Dict[str, List[dict]]:
+        """Return matching active documents grouped by partner type, in display order."""
+        query = query.lower().strip()
+        results = {}
+        for partner_type in partner_types or self.sources:
+            segment = await self._segment(partner_type)
+            results[partner_type] = segment.search(query)
+        return results
@@ -0,0 +1,34 @@
+"""Monotonic integer ids from a counter document.
+
+`SequenceAllocator.next()` is one `find_one_and_update` with `$inc` on a
+document in the `counters` collection, so concurrent writers (in any
+process) never receive the same id, unlike computing max(id) + 1. `floor`
+keeps allocated ids above ids that exist outside the counter (e.g. a
+static dataset): the first allocation in a process raises the counter to
+it with `$max`, which is a no-op once the counter is past it.
+"""
+from pymongo import ReturnDocument
+
+
+class SequenceAllocator:
+    """Ids floor + 1, floor + 2, ... for the counter named `name`."""
+
+    def __init__(self, database, name: str, *, floor: int = 0):
+        self._db = database
+        self.name = name
+        self.floor = floor
+        self._floored = False
+
+    async def next(self) -> int:
+        if not self._floored:
+            await self.advance(self.floor)
+        doc = await self._db.counters.find_one_and_update(
+            {"_id": self.name}, {"$inc": {"seq": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return doc["seq"]
+
+    async def advance(self, value: int):
+        """Make sure later ids are greater than `value`."""
+        await self._db.counters.update_one({"_id": self.name}, {"$max": {"seq": value}}, upsert=True)
+        if value >= self.floor:
+            self._floored = True
@@ -0,0 +1,78 @@
+"""Short-lived in-process cache of resolved login sessions.
+
+Every authenticated request used to cost two MongoDB round-trips (session,
+then user) plus an ISO timestamp parse. Resolved sessions are kept in a small
+LRU keyed by session token, together with the parsed expiry, for at most
+`SESSION_CACHE_TTL` seconds. Logout and login drop the affected entries; the
+TTL bounds staleness when another worker process made the change.
+"""
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+from fastapi import Request
+
+SESSION_CACHE_TTL = int(os.environ.get("SESSION_CACHE_TTL", "60"))
+SESSION_CACHE_SIZE = int(os.environ.get("SESSION_CACHE_SIZE", "1024"))
+
+
+class SessionInvalid(Exception):
+    """The session token does not resolve to a live user; str(e) is user-facing."""
+
+
+def session_token_from_request(request: Request) -> Optional[str]:
+    """Session token from the cookie, or from an `Authorization: Bearer` header."""
+    session_token = request.cookies.get("session_token")
+    if not session_token:
+        auth_header = request.headers.get("Authorization")
+        if auth_header and auth_header.startswith("Bearer "):
+            session_token = auth_header[7:]
+    return session_token or None
+
+
+def parse_expiry(value) -> datetime:
+    """Stored expires_at (ISO string or datetime) as an aware UTC datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class SessionCache:
+    """LRU of session token -> (user_id, user, expires_at)."""
+
+    def __init__(self, ttl: int = SESSION_CACHE_TTL, maxsize: int = SESSION_CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, str, Any, datetime]]" = OrderedDict()
+
+    def get(self, session_token: str) -> Optional[Tuple[Any, datetime]]:
+        entry = self._entries.get(session_token)
+        if entry is None:
+            return None
+        cached_at, _, user, expires_at = entry
+        if time.monotonic() - cached_at >= self.ttl:
+            del self._entries[session_token]
+            return None
+        self._entries.move_to_end(session_token)
+        return user, expires_at
+
+    def put(self, session_token: str, user_id: str, user: Any, expires_at: datetime):
+        self._entries[session_token] = (time.monotonic(), user_id, user, expires_at)
+        self._entries.move_to_end(session_token)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_token: str):
+        self._entries.pop(session_token, None)
+
+    def invalidate_user(self, user_id: str):
+        """Drop every cached session of a user (login replaces them all)."""
+        for token in [t for t, entry in self._entries.items() if entry[1] == user_id]:
+            del self._entries[token]
+
+    def clear(self):
+        self._entries.clear()
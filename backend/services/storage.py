@@ -0,0 +1,171 @@
+"""Async client for the object storage API.
+
+One pooled `httpx.AsyncClient` is shared by every upload and image fetch, so
+TLS connections are kept alive and reused (multiplexed over HTTP/2 when the
+`h2` package is installed) instead of each call opening its own connection
+from a thread-pool worker. Bodies can be streamed in both directions, and
+range reads fetch part of an object. The base URL and key are constructor
+arguments (STORAGE_URL / EMERGENT_LLM_KEY in the environment), so the client
+can be pointed at a local stand-in server.
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterable, AsyncIterator, Optional, Tuple, Union
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+STORAGE_URL = os.environ.get("STORAGE_URL", "https://integrations.emergentagent.com/objstore/api/v1/storage")
+MAX_CONNECTIONS = int(os.environ.get("STORAGE_MAX_CONNECTIONS", "20"))
+KEEPALIVE_SECONDS = 30
+STREAM_CHUNK = 64 * 1024
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class StorageError(Exception):
+    """A storage request failed; `status` is the HTTP status (None for transport errors)."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class ObjectNotFound(StorageError):
+    pass
+
+
+def _raise_for_status(resp: httpx.Response, path: str):
+    if resp.status_code == 404:
+        raise ObjectNotFound(f"Object not found: {path}", 404)
+    if resp.status_code >= 400:
+        raise StorageError(f"Storage returned {resp.status_code} for {path}", resp.status_code)
+
+
+class StorageClient:
+    """put/get/range/stream over one pooled keep-alive connection pool."""
+
+    def __init__(self, base_url: str = STORAGE_URL, emergent_key: Optional[str] = None, *,
+                 http2: bool = True, max_connections: int = MAX_CONNECTIONS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.base_url = base_url.rstrip("/")
+        self._emergent_key = emergent_key if emergent_key is not None else os.environ.get("EMERGENT_LLM_KEY")
+        self._http2 = http2 and HTTP2_AVAILABLE
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=KEEPALIVE_SECONDS,
+        )
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._storage_key: Optional[str] = None
+        self._key_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                # Uploads can be large; connecting should not take long
+                timeout=httpx.Timeout(60.0, connect=10.0, write=120.0),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def init(self) -> str:
+        """Exchange the Emergent key for a storage key (once; concurrent callers share the request)."""
+        if self._storage_key:
+            return self._storage_key
+        async with self._key_lock:
+            if not self._storage_key:
+                try:
+                    resp = await self.client.post(f"{self.base_url}/init", json={"emergent_key": self._emergent_key}, timeout=30)
+                except httpx.HTTPError as e:
+                    raise StorageError(f"Storage init failed: {e}") from e
+                _raise_for_status(resp, "init")
+                self._storage_key = resp.json()["storage_key"]
+        return self._storage_key
+
+    async def _request(self, method: str, path: str, *, retry_auth: bool = True, **kwargs) -> httpx.Response:
+        extra_headers = kwargs.pop("headers", {})
+        headers = {"X-Storage-Key": await self.init(), **extra_headers}
+        try:
+            resp = await self.client.request(method, f"{self.base_url}/objects/{path}", headers=headers, **kwargs)
+        except httpx.HTTPError as e:
+            raise StorageError(f"Storage request failed for {path}: {e}") from e
+        if resp.status_code in (401, 403) and retry_auth:
+            # Storage key revoked or expired: fetch a new one and retry once
+            self._storage_key = None
+            return await self._request(method, path, retry_auth=False, headers=extra_headers, **kwargs)
+        _raise_for_status(resp, path)
+        return resp
+
+    async def put(self, path: str, data: Union[bytes, AsyncIterable[bytes]], content_type: str,
+                  length: Optional[int] = None) -> dict:
+        """Store an object. `data` may be an async iterator of chunks (streamed; pass `length` if known)."""
+        headers = {"Content-Type": content_type}
+        if length is not None:
+            headers["Content-Length"] = str(length)
+        # A streamed body cannot be replayed after an auth failure
+        retry_auth = isinstance(data, (bytes, bytearray))
+        resp = await self._request("PUT", path, headers=headers, content=data, retry_auth=retry_auth, timeout=120)
+        return resp.json()
+
+    async def get(self, path: str) -> Tuple[bytes, str]:
+        """Whole object as (bytes, content type)."""
+        resp = await self._request("GET", path)
+        return resp.content, resp.headers.get("Content-Type", "application/octet-stream")
+
+    async def get_range(self, path: str, start: int, end: Optional[int] = None) -> Tuple[bytes, str, Optional[str]]:
+        """Bytes start..end (inclusive) as (bytes, content type, Content-Range).
+
+        Content-Range is None when the server ignored the range and sent the
+        whole object.
+        """
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        resp = await self._request("GET", path, headers={"Range": byte_range})
+        content_range = resp.headers.get("Content-Range") if resp.status_code == 206 else None
+        return resp.content, resp.headers.get("Content-Type", "application/octet-stream"), content_range
+
+    @asynccontextmanager
+    async def stream(self, path: str, byte_range: Optional[str] = None) -> AsyncIterator[httpx.Response]:
+        """Open a streamed download; iterate `response.aiter_bytes()` inside the block.
+
+        `byte_range` is passed through as the Range header (e.g. "bytes=0-1023").
+        """
+        key = await self.init()
+        headers = {"X-Storage-Key": key}
+        if byte_range:
+            headers["Range"] = byte_range
+        request = self.client.build_request("GET", f"{self.base_url}/objects/{path}", headers=headers)
+        try:
+            resp = await self.client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise StorageError(f"Storage request failed for {path}: {e}") from e
+        try:
+            if resp.status_code in (401, 403):
+                self._storage_key = None
+            _raise_for_status(resp, path)
+            yield resp
+        finally:
+            await resp.aclose()
+
+
+async def iter_upload(upload, chunk_size: int = STREAM_CHUNK) -> AsyncIterator[bytes]:
+    """Chunks of a Starlette UploadFile, for streaming it to storage."""
+    await upload.seek(0)
+    while chunk := await upload.read(chunk_size):
+        yield chunk
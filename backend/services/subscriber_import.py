@@ -0,0 +1,230 @@
+"""Streaming CSV import of newsletter subscribers.
+
+The upload is spooled to a temporary file and imported in the background,
+decoded and parsed incrementally a chunk of rows at a time. Each chunk
+costs one `$in` query (to skip emails already subscribed) and one unordered
+`insert_many`; the unique email index catches anything that slips through
+concurrently. Progress and per-row errors are kept on a `newsletter_imports`
+document for the admin UI to poll.
+
+Emails are stored lower-cased (`normalize_email`) by every write path, so
+the unique index also rules out case variants; `dedupe_emails` folds the
+ones stored before that rule.
+"""
+import asyncio
+import csv
+import io
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ROWS = 1000
+# Only the first per-row errors are kept on the job document (all are counted)
+MAX_ERRORS = 100
+DUPLICATE_KEY = 11000
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+async def dedupe_emails(database) -> Dict[str, int]:
+    """Lower-case every subscriber email and drop case-variant duplicates.
+
+    Keeps the earliest active subscription per address (the earliest one if
+    none is active). Run before the unique email index can be built.
+    """
+    keep: Dict[str, dict] = {}
+    drop: List[DeleteOne] = []
+    cursor = database.newsletter_subscriptions.find(
+        {}, {"_id": 1, "email": 1, "is_active": 1}
+    ).sort([("subscribed_at", 1), ("_id", 1)])
+    async for doc in cursor:
+        email = normalize_email(doc.get("email") or "")
+        kept = keep.get(email)
+        if kept is None:
+            keep[email] = doc
+            continue
+        if doc.get("is_active") and not kept.get("is_active"):
+            keep[email], doc = doc, kept
+        drop.append(DeleteOne({"_id": doc["_id"]}))
+    # Deletes first: renaming a kept document could collide with a duplicate
+    if drop:
+        await database.newsletter_subscriptions.bulk_write(drop, ordered=False)
+    renames = [UpdateOne({"_id": doc["_id"]}, {"$set": {"email": email}})
+               for email, doc in keep.items() if doc.get("email") != email]
+    if renames:
+        await database.newsletter_subscriptions.bulk_write(renames, ordered=False)
+    return {"removed": len(drop), "normalized": len(renames)}
+
+
+def normalize_row(row: Dict[str, str]) -> Tuple[str, str, str]:
+    """(email, name, country) from a row, accepting the common column spellings."""
+    email = row.get('email') or row.get('Email') or row.get('EMAIL') or row.get('e-mail') or ''
+    name = row.get('name') or row.get('Name') or row.get('NAME') or ''
+    if not name:
+        name = f"{row.get('first_name') or ''} {row.get('last_name') or ''}"
+    country = row.get('country') or row.get('Country') or row.get('COUNTRY') or ''
+    return normalize_email(email), name.strip(), country.strip()
+
+
+def iter_row_chunks(fileobj: BinaryIO, size: int = CHUNK_ROWS) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+    """Chunks of (row number, row dict) decoded and parsed incrementally; the first record is the header.
+
+    Raises UnicodeDecodeError (when reached) if the file is not valid UTF-8.
+    """
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [h.strip() for h in header]
+    chunk = []
+    for values in reader:
+        if not any(v.strip() for v in values):
+            continue
+        chunk.append((reader.line_num, dict(zip(header, values))))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class SubscriberImporter:
+    """Runs CSV imports in the background and tracks them in `newsletter_imports`."""
+
+    def __init__(self, database):
+        self._db = database
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def imports(self):
+        return self._db.newsletter_imports
+
+    async def start(self, upload, created_by: Optional[str] = None) -> dict:
+        """Spool an UploadFile to disk and import it in the background."""
+        tmp = tempfile.NamedTemporaryFile(prefix="subscribers-", suffix=".csv", delete=False)
+        try:
+            await asyncio.to_thread(shutil.copyfileobj, upload.file, tmp)
+        finally:
+            tmp.close()
+        job = {
+            "id": str(uuid.uuid4()),
+            "filename": upload.filename,
+            "size": os.path.getsize(tmp.name),
+            "status": "running",
+            "bytes_read": 0,
+            "rows": 0,
+            "imported": 0,
+            "skipped": 0,
+            "invalid": 0,
+            "error_count": 0,
+            "errors": [],
+            "created_by": created_by,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "finished_at": None,
+        }
+        await self.imports.insert_one(job)
+        job.pop("_id", None)
+        self._tasks[job["id"]] = asyncio.create_task(self._run(job["id"], tmp.name))
+        return job
+
+    async def progress(self, job_id: str) -> Optional[dict]:
+        return await self.imports.find_one({"id": job_id}, {"_id": 0})
+
+    async def _run(self, job_id: str, path: str):
+        seen = set()
+        errors: List[str] = []
+        try:
+            with open(path, "rb") as fileobj:
+                chunks = iter_row_chunks(fileobj)
+                # Reading and parsing happen in a worker thread, chunk by chunk
+                while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                    counts = await self._import_chunk(chunk, seen, errors)
+                    await self.imports.update_one(
+                        {"id": job_id},
+                        {"$inc": counts, "$set": {"bytes_read": fileobj.tell(), "errors": errors}},
+                    )
+            status, error = "completed", None
+        except UnicodeDecodeError:
+            status, error = "failed", "File is not valid UTF-8"
+        except Exception as e:
+            logger.error(f"Subscriber import {job_id} failed: {e}")
+            status, error = "failed", str(e)
+        finally:
+            self._tasks.pop(job_id, None)
+            os.unlink(path)
+        await self.imports.update_one(
+            {"id": job_id},
+            {"$set": {"status": status, "error": error, "errors": errors,
+                      "finished_at": datetime.now(timezone.utc).isoformat()}},
+        )
+
+    async def _import_chunk(self, chunk, seen: set, errors: List[str]) -> Dict[str, int]:
+        counts = {"rows": len(chunk), "imported": 0, "skipped": 0, "invalid": 0, "error_count": 0}
+
+        def error(message: str):
+            counts["error_count"] += 1
+            if len(errors) < MAX_ERRORS:
+                errors.append(message)
+
+        candidates = {}
+        for row_number, row in chunk:
+            email, name, country = normalize_row(row)
+            if not email or '@' not in email:
+                counts["invalid"] += 1
+                counts["skipped"] += 1
+                error(f"Row {row_number}: invalid email '{email}'")
+                continue
+            if email in seen:
+                counts["skipped"] += 1
+                continue
+            seen.add(email)
+            candidates[email] = (row_number, name, country)
+
+        if candidates:
+            existing = self._db.newsletter_subscriptions.find(
+                {"email": {"$in": list(candidates)}}, {"_id": 0, "email": 1}
+            )
+            async for doc in existing:
+                if candidates.pop(doc["email"], None) is not None:
+                    counts["skipped"] += 1
+
+        if not candidates:
+            return counts
+        now = datetime.now(timezone.utc).isoformat()
+        docs = [
+            {
+                "id": str(uuid.uuid4()),
+                "email": email,
+                "name": name or "Subscriber",
+                "country": country or "Unknown",
+                "subscribed_at": now,
+                "is_active": True,
+            }
+            for email, (_, name, country) in candidates.items()
+        ]
+        row_numbers = [row_number for row_number, _, _ in candidates.values()]
+        try:
+            result = await self._db.newsletter_subscriptions.insert_many(docs, ordered=False)
+            counts["imported"] += len(result.inserted_ids)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            counts["imported"] += e.details.get("nInserted", 0)
+            for err in write_errors:
+                if err.get("code") == DUPLICATE_KEY:
+                    # Subscribed concurrently since the $in check
+                    counts["skipped"] += 1
+                else:
+                    error(f"Row {row_numbers[err['index']]}: {err.get('errmsg', 'write failed')}")
+        return counts
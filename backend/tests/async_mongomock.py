@@ -0,0 +1,111 @@
+"""
+Awaitable wrapper around mongomock for in-process service tests.
+
+The services take a Motor database; this exposes the same call shapes
+(awaited collection methods, cursors with to_list / async iteration) on
+top of an in-memory mongomock database. `session=` arguments are accepted
+and ignored.
+"""
+from itertools import islice
+from types import SimpleNamespace
+
+import mongomock
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReplaceOne, ReturnDocument, UpdateMany, UpdateOne
+
+
+class AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, count):
+        self._cursor = self._cursor.limit(count)
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._cursor) if length is None else list(islice(self._cursor, length))
+
+    async def __aiter__(self):
+        for doc in self._cursor:
+            yield doc
+
+
+class AsyncCollection:
+    def __init__(self, collection):
+        self.sync = collection
+
+    def find(self, *args, session=None, **kwargs):
+        return AsyncCursor(self.sync.find(*args, **kwargs))
+
+    def aggregate(self, pipeline, session=None, **kwargs):
+        return AsyncCursor(self.sync.aggregate(pipeline, **kwargs))
+
+    async def find_one_and_update(self, filter, update, projection=None, sort=None, upsert=False,
+                                  return_document=ReturnDocument.BEFORE, session=None, **kwargs):
+        # mongomock re-applies `filter` to pick the AFTER document, which misses
+        # documents the update moved out of the filter (e.g. lease claims)
+        current = self.sync.find_one(filter, {"_id": 1}, sort=sort)
+        if current is None:
+            return self.sync.find_one_and_update(filter, update, projection=projection, sort=sort, upsert=upsert,
+                                                 return_document=return_document, **kwargs)
+        before = self.sync.find_one({"_id": current["_id"]}, projection)
+        self.sync.update_one({"_id": current["_id"]}, update)
+        if return_document == ReturnDocument.AFTER:
+            return self.sync.find_one({"_id": current["_id"]}, projection)
+        return before
+
+    async def bulk_write(self, requests, ordered=True, session=None, **kwargs):
+        # mongomock's bulk_write passes arguments newer pymongo operations
+        # (e.g. `sort`) that it does not accept; apply them one by one instead
+        counts = {"inserted_count": 0, "matched_count": 0, "modified_count": 0, "deleted_count": 0,
+                  "upserted_count": 0}
+        for op in requests:
+            if isinstance(op, InsertOne):
+                self.sync.insert_one(op._doc)
+                counts["inserted_count"] += 1
+                continue
+            if isinstance(op, (DeleteOne, DeleteMany)):
+                delete = self.sync.delete_one if isinstance(op, DeleteOne) else self.sync.delete_many
+                counts["deleted_count"] += delete(op._filter).deleted_count
+                continue
+            if isinstance(op, ReplaceOne):
+                result = self.sync.replace_one(op._filter, op._doc, upsert=op._upsert)
+            elif isinstance(op, (UpdateOne, UpdateMany)):
+                update = self.sync.update_one if isinstance(op, UpdateOne) else self.sync.update_many
+                result = update(op._filter, op._doc, upsert=op._upsert)
+            else:
+                raise TypeError(f"Unsupported bulk operation {op!r}")
+            counts["matched_count"] += result.matched_count
+            counts["modified_count"] += result.modified_count
+            counts["upserted_count"] += result.upserted_id is not None
+        return SimpleNamespace(acknowledged=True, **counts)
+
+    def list_indexes(self):
+        return AsyncCursor(iter(self.sync.list_indexes()))
+
+    def __getattr__(self, name):
+        method = getattr(self.sync, name)
+
+        async def call(*args, session=None, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+
+class AsyncDatabase:
+    def __init__(self):
+        self.sync = mongomock.MongoClient().db
+
+    def __getitem__(self, name):
+        return AsyncCollection(self.sync[name])
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    async def list_collection_names(self):
+        return self.sync.list_collection_names()
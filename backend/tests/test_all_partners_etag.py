@@ -0,0 +1,96 @@
+"""
+Tests for conditional GET on /api/all-partners:
+- ETag and Cache-Control headers are present
+- If-None-Match with the current ETag returns 304 with no body
+- The ETag changes after an admin write
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestAllPartnersETag:
+    """Conditional requests against the pre-serialized catalog body"""
+
+    def test_etag_and_cache_control_present(self):
+        """Response carries a quoted ETag and Cache-Control"""
+        response = requests.get(f"{BASE_URL}/api/all-partners")
+        assert response.status_code == 200
+        etag = response.headers.get("ETag")
+        assert etag and etag.startswith('"') and etag.endswith('"')
+        assert "Cache-Control" in response.headers
+        assert response.json()["total_count"] > 0
+        print(f"PASS: ETag {etag}")
+
+    def test_etag_is_stable(self):
+        """Two reads without writes in between return the same ETag"""
+        first = requests.get(f"{BASE_URL}/api/all-partners").headers["ETag"]
+        second = requests.get(f"{BASE_URL}/api/all-partners").headers["ETag"]
+        assert first == second
+        print("PASS: ETag stable between reads")
+
+    def test_if_none_match_returns_304(self):
+        """Sending back the ETag yields 304 Not Modified with an empty body"""
+        etag = requests.get(f"{BASE_URL}/api/all-partners").headers["ETag"]
+        response = requests.get(f"{BASE_URL}/api/all-partners", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers.get("ETag") == etag
+        print("PASS: 304 on matching If-None-Match")
+
+    def test_weak_etag_also_matches(self):
+        """W/ prefixed validators (added by some proxies) still match"""
+        etag = requests.get(f"{BASE_URL}/api/all-partners").headers["ETag"]
+        response = requests.get(f"{BASE_URL}/api/all-partners", headers={"If-None-Match": f"W/{etag}"})
+        assert response.status_code == 304
+        print("PASS: 304 on weak validator")
+
+    def test_stale_etag_returns_200(self):
+        """A non-matching ETag returns the full body"""
+        response = requests.get(f"{BASE_URL}/api/all-partners", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert "hotels" in response.json()
+        print("PASS: 200 on stale ETag")
+
+    def test_etag_changes_after_write(self):
+        """Updating a hotel changes the ETag; restoring it restores the content"""
+        data = requests.get(f"{BASE_URL}/api/all-partners")
+        etag_before = data.headers["ETag"]
+        hotel = data.json()["hotels"][0]
+        original_location = hotel["location"]
+
+        requests.put(f"{BASE_URL}/api/hotels/{hotel['id']}", json={"location": f"{original_location} (etag test)"})
+        try:
+            etag_after = requests.get(f"{BASE_URL}/api/all-partners").headers["ETag"]
+            assert etag_after != etag_before
+        finally:
+            requests.put(f"{BASE_URL}/api/hotels/{hotel['id']}", json={"location": original_location})
+        print("PASS: ETag changes after admin write")
+
+
+class TestListingSnapshots:
+    """Per-type listings are served from the same pre-serialized snapshots"""
+
+    @pytest.mark.parametrize("path", ["/api/hotels", "/api/restaurants", "/api/beach-clubs", "/api/cafe-bars", "/api/golf-courses", "/api/partner-offers"])
+    def test_listing_supports_304(self, path):
+        """Each catalog listing returns JSON with an ETag and honours If-None-Match"""
+        response = requests.get(f"{BASE_URL}{path}")
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("application/json")
+        assert isinstance(response.json(), list)
+        etag = response.headers["ETag"]
+
+        response = requests.get(f"{BASE_URL}{path}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        print(f"PASS: {path} supports conditional GET")
+
+    def test_include_inactive_has_own_snapshot(self):
+        """include_inactive=true is a distinct body from the active-only listing"""
+        active = requests.get(f"{BASE_URL}/api/hotels")
+        everything = requests.get(f"{BASE_URL}/api/hotels", params={"include_inactive": True})
+        assert len(everything.json()) >= len(active.json())
+        if len(everything.json()) > len(active.json()):
+            assert active.headers["ETag"] != everything.headers["ETag"]
+        print("PASS: include_inactive snapshot separate")
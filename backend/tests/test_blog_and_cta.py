@@ -7,6 +7,9 @@ import requests
 import os
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+ADMIN_SESSION_TOKEN = os.environ.get('ADMIN_SESSION_TOKEN')
+ADMIN_COOKIES = {"session_token": ADMIN_SESSION_TOKEN} if ADMIN_SESSION_TOKEN else None
+requires_admin = pytest.mark.skipif(not ADMIN_SESSION_TOKEN, reason="ADMIN_SESSION_TOKEN not set")
 
 class TestBlogAPI:
     """Blog API endpoint tests"""
@@ -28,11 +31,13 @@ class TestBlogAPI:
         """Test each blog post has required fields"""
         response = requests.get(f"{BASE_URL}/api/blog")
         posts = response.json()
-        required_fields = ['id', 'slug', 'title', 'excerpt', 'content', 'image', 'author', 'created_at', 'category']
+        required_fields = ['id', 'slug', 'title', 'excerpt', 'image', 'author', 'created_at', 'category']
         
         for post in posts:
             for field in required_fields:
                 assert field in post, f"Post {post.get('slug', 'unknown')} missing {field}"
+            # The list is summary-only; the body is served by /api/blog/{slug}
+            assert 'content' not in post, f"Post {post['slug']} list entry should not include content"
         print("PASS: All posts have required fields")
     
     def test_blog_posts_have_cta(self):
@@ -96,6 +101,68 @@ class TestBlogAPI:
         print("PASS: Art & Culture CTA correct")
 
 
+class TestBlogIndexes:
+    """Category and tag filters served from the pre-sorted blog store"""
+
+    def test_category_filter_newest_first(self):
+        posts = requests.get(f"{BASE_URL}/api/blog", params={"category": "travel-tips"}).json()
+        assert posts and all(p['category'] == 'travel-tips' for p in posts)
+        dates = [p['created_at'] for p in posts]
+        assert dates == sorted(dates, reverse=True)
+        print(f"PASS: {len(posts)} travel-tips posts newest first")
+
+    def test_tag_filter(self):
+        posts = requests.get(f"{BASE_URL}/api/blog", params={"tag": "weather"}).json()
+        assert any(p['slug'] == 'best-time-golf-mallorca' for p in posts)
+        assert all('weather' in [t.lower() for t in p['tags']] for p in posts)
+        print("PASS: Tag filter")
+
+    def test_unknown_category_is_empty(self):
+        response = requests.get(f"{BASE_URL}/api/blog", params={"category": "does-not-exist"})
+        assert response.status_code == 200
+        assert response.json() == []
+        print("PASS: Unknown category returns []")
+
+    def test_unknown_tag_is_empty(self):
+        response = requests.get(f"{BASE_URL}/api/blog", params={"tag": "does-not-exist"})
+        assert response.status_code == 200
+        assert response.json() == []
+        print("PASS: Unknown tag returns []")
+
+    def test_tag_filter_is_case_insensitive(self):
+        lower = requests.get(f"{BASE_URL}/api/blog", params={"tag": "weather"})
+        upper = requests.get(f"{BASE_URL}/api/blog", params={"tag": "WEATHER"})
+        assert lower.json() == upper.json()
+        assert lower.headers.get("ETag") == upper.headers.get("ETag")
+        print("PASS: Tag case does not change the response")
+
+
+class TestBlogAdmin:
+    """Blog CMS endpoints require an admin session"""
+
+    def test_admin_blog_requires_auth(self):
+        assert requests.get(f"{BASE_URL}/api/admin/blog").status_code == 401
+        assert requests.get(f"{BASE_URL}/api/admin/blog/best-time-golf-mallorca").status_code == 401
+        assert requests.put(f"{BASE_URL}/api/admin/blog/best-time-golf-mallorca", json={"published": False}).status_code == 401
+        assert requests.delete(f"{BASE_URL}/api/admin/blog/best-time-golf-mallorca").status_code == 401
+        print("PASS: Admin blog endpoints return 401 without a session")
+
+    @requires_admin
+    def test_update_rejects_unknown_fields(self):
+        url = f"{BASE_URL}/api/admin/blog/best-time-golf-mallorca"
+        for body in ({"$set": {"published": False}}, {"title.en": "x"}, {"views": 1}, {"published": None}):
+            response = requests.put(url, json=body, cookies=ADMIN_COOKIES)
+            assert response.status_code == 400, body
+        assert requests.get(f"{BASE_URL}/api/blog/best-time-golf-mallorca").json()['published'] is True
+        print("PASS: Blog updates outside the allow-list return 400")
+
+    def test_published_post_served_from_store(self):
+        response = requests.get(f"{BASE_URL}/api/blog/best-time-golf-mallorca")
+        assert response.status_code == 200
+        assert response.json()['published'] is True
+        print("PASS: Published post served")
+
+
 class TestPartnersAPI:
     """Partner sections API tests"""
     
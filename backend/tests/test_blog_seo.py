@@ -45,7 +45,7 @@ class TestBlogListEndpoint:
         response = requests.get(f"{BASE_URL}/api/blog")
         posts = response.json()
         
-        required_fields = ['id', 'slug', 'title', 'excerpt', 'content', 'image', 
+        required_fields = ['id', 'slug', 'title', 'excerpt', 'image', 
                           'author', 'category', 'tags', 'created_at']
         
         for post in posts:
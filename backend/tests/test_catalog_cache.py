@@ -0,0 +1,215 @@
+"""
+Tests for the in-process partner catalog cache:
+- Listing endpoints reflect admin create/update/delete immediately
+- Reorder is visible on the next read
+- (in-process) overlapping cold loads of different collections are all cached,
+  a load overlapping an invalidation of its own collection is not
+"""
+import asyncio
+import pytest
+import requests
+import os
+import uuid
+
+from async_mongomock import AsyncCursor, AsyncDatabase
+from services.catalog_cache import CatalogCache
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+@pytest.fixture
+def temp_restaurant():
+    """Create a throwaway restaurant and soft-delete it afterwards"""
+    restaurant_id = f"test-cache-{uuid.uuid4().hex[:8]}"
+    payload = {
+        "id": restaurant_id,
+        "name": "TEST Cache Restaurant",
+        "description": {"en": "Cache test"},
+        "image": "https://example.com/cache.jpg",
+        "location": "Palma",
+        "deal": {"en": "Test deal"},
+        "contact_url": "https://example.com",
+    }
+    response = requests.post(f"{BASE_URL}/api/restaurants", json=payload)
+    assert response.status_code == 201
+    yield restaurant_id
+    requests.delete(f"{BASE_URL}/api/restaurants/{restaurant_id}")
+
+
+class TestCatalogCacheInvalidation:
+    """Admin writes must be visible on the very next listing call"""
+
+    def test_created_restaurant_is_listed(self, temp_restaurant):
+        """Warm the cache, create happened in the fixture, listing shows the new item"""
+        response = requests.get(f"{BASE_URL}/api/restaurants")
+        assert response.status_code == 200
+        ids = [r["id"] for r in response.json()]
+        assert temp_restaurant in ids
+        print("PASS: New restaurant visible after create")
+
+    def test_update_is_visible(self, temp_restaurant):
+        """Updating a restaurant refreshes the cached listing"""
+        requests.get(f"{BASE_URL}/api/restaurants")  # warm cache
+        response = requests.put(f"{BASE_URL}/api/restaurants/{temp_restaurant}", json={"name": "TEST Cache Renamed"})
+        assert response.status_code == 200
+
+        response = requests.get(f"{BASE_URL}/api/restaurants")
+        item = next(r for r in response.json() if r["id"] == temp_restaurant)
+        assert item["name"] == "TEST Cache Renamed"
+        print("PASS: Update visible in cached listing")
+
+    def test_soft_delete_hides_from_active_listing(self, temp_restaurant):
+        """Soft-deleted restaurant disappears from active listing but stays in include_inactive"""
+        requests.get(f"{BASE_URL}/api/restaurants")  # warm cache
+        response = requests.delete(f"{BASE_URL}/api/restaurants/{temp_restaurant}")
+        assert response.status_code == 204
+
+        active_ids = [r["id"] for r in requests.get(f"{BASE_URL}/api/restaurants").json()]
+        assert temp_restaurant not in active_ids
+
+        all_ids = [r["id"] for r in requests.get(f"{BASE_URL}/api/restaurants", params={"include_inactive": True}).json()]
+        assert temp_restaurant in all_ids
+        print("PASS: Soft delete reflected in cached listing")
+
+    def test_partner_offers_reflects_update(self, temp_restaurant):
+        """/api/partner-offers shares the same cache and sees the update"""
+        requests.get(f"{BASE_URL}/api/partner-offers", params={"type": "restaurant"})  # warm cache
+        requests.put(f"{BASE_URL}/api/restaurants/{temp_restaurant}", json={"location": "Sóller"})
+
+        response = requests.get(f"{BASE_URL}/api/partner-offers", params={"type": "restaurant"})
+        assert response.status_code == 200
+        item = next(r for r in response.json() if r["id"] == temp_restaurant)
+        assert item["location"] == "Sóller"
+        print("PASS: partner-offers reflects update")
+
+    def test_partner_offers_unknown_type_is_empty(self):
+        response = requests.get(f"{BASE_URL}/api/partner-offers", params={"type": f"TEST-{uuid.uuid4().hex[:8]}"})
+        assert response.status_code == 200
+        assert response.json() == []
+        print("PASS: unknown partner type returns []")
+
+
+class TestPartnerWrites:
+    """Create/update/delete contract shared by every catalog collection"""
+
+    def test_duplicate_create_is_rejected(self, temp_restaurant):
+        response = requests.post(f"{BASE_URL}/api/restaurants", json={"id": temp_restaurant, "name": "TEST Duplicate"})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Restaurant with this ID already exists"
+        print("PASS: Duplicate id rejected without overwriting")
+
+    def test_update_returns_updated_document(self, temp_restaurant):
+        response = requests.put(f"{BASE_URL}/api/restaurants/{temp_restaurant}",
+                                json={"location": "Deià", "id": "ignored", "created_at": "ignored"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == temp_restaurant
+        assert data["location"] == "Deià"
+        assert data["type"] == "restaurant"
+        assert "_id" not in data
+        print("PASS: Update returns the document after the write")
+
+    def test_missing_partner_returns_404(self):
+        for path in ("golf-courses", "hotels", "restaurants", "beach-clubs", "cafe-bars"):
+            assert requests.put(f"{BASE_URL}/api/{path}/does-not-exist", json={"name": "x"}).status_code == 404
+            assert requests.delete(f"{BASE_URL}/api/{path}/does-not-exist").status_code == 404
+        print("PASS: Update/delete of unknown ids return 404")
+
+
+class TestGolfCourseReorderCache:
+    """Reorder must invalidate the golf course listing"""
+
+    def test_reorder_is_visible(self):
+        """Reversing the order twice restores the original order"""
+        courses = requests.get(f"{BASE_URL}/api/golf-courses").json()
+        original_ids = [c["id"] for c in courses]
+        if len(original_ids) < 2:
+            pytest.skip("Need at least two golf courses")
+
+        reversed_ids = list(reversed(original_ids))
+        response = requests.post(f"{BASE_URL}/api/golf-courses/reorder", json=reversed_ids)
+        assert response.status_code == 200
+        listed = [c["id"] for c in requests.get(f"{BASE_URL}/api/golf-courses").json()]
+        assert listed == reversed_ids
+
+        requests.post(f"{BASE_URL}/api/golf-courses/reorder", json=original_ids)
+        listed = [c["id"] for c in requests.get(f"{BASE_URL}/api/golf-courses").json()]
+        assert listed == original_ids
+        print("PASS: Reorder visible through cache")
+
+    def test_unchanged_reorder_writes_nothing(self):
+        """Resubmitting the current order changes no positions"""
+        courses = requests.get(f"{BASE_URL}/api/golf-courses", params={"include_inactive": True}).json()
+        ids = [c["id"] for c in courses]
+        requests.post(f"{BASE_URL}/api/golf-courses/reorder", json=ids)
+        response = requests.post(f"{BASE_URL}/api/golf-courses/reorder", json=ids)
+        assert response.status_code == 200
+        assert response.json()["updated"] == 0
+        print("PASS: Reorder only writes changed positions")
+
+    def test_duplicate_ids_rejected(self):
+        response = requests.post(f"{BASE_URL}/api/golf-courses/reorder", json=["a", "a"])
+        assert response.status_code == 400
+        print("PASS: Duplicate ids rejected")
+
+
+class TestAdminReorder:
+    """Generic /api/admin/{collection}/reorder"""
+
+    def test_requires_auth(self):
+        for path in ("golf-courses", "hotels", "restaurants", "beach-clubs", "cafe-bars"):
+            response = requests.post(f"{BASE_URL}/api/admin/{path}/reorder", json={"ids": []})
+            assert response.status_code == 401
+        print("PASS: Admin reorder requires auth")
+
+
+# ─── In-process: CatalogCache generations ────────────────────────────────────
+
+class SlowCursor(AsyncCursor):
+    async def to_list(self, length=None):
+        await asyncio.sleep(0.01)
+        return await super().to_list(length)
+
+
+class SlowDatabase(AsyncDatabase):
+    """Loads take a moment, so concurrent get() calls overlap"""
+
+    def __getitem__(self, name):
+        collection = super().__getitem__(name)
+        find = collection.find
+        collection.find = lambda *args, **kwargs: SlowCursor(find(*args, **kwargs)._cursor)
+        return collection
+
+
+class TestCatalogCacheGenerations:
+    """Each collection's snapshot is only discarded by its own invalidation"""
+
+    def make_cache(self):
+        db = SlowDatabase()
+        for name in ("hotels", "restaurants", "golf_courses"):
+            db.sync[name].insert_one({"id": f"{name}-1", "display_order": 1, "is_active": True})
+        return CatalogCache(db)
+
+    def test_overlapping_cold_loads_are_all_cached(self):
+        async def scenario():
+            cache = self.make_cache()
+            await asyncio.gather(*(cache.get(n) for n in ("hotels", "restaurants", "golf_courses")))
+            return cache
+
+        cache = asyncio.run(scenario())
+        assert all(cache._fresh(n) is not None for n in ("hotels", "restaurants", "golf_courses"))
+        print("PASS: concurrent cold loads all published")
+
+    def test_invalidation_during_load_discards_only_that_collection(self):
+        async def scenario():
+            cache = self.make_cache()
+            loads = asyncio.gather(cache.get("hotels"), cache.get("restaurants"))
+            await asyncio.sleep(0)
+            cache.invalidate("hotels")
+            await loads
+            return cache
+
+        cache = asyncio.run(scenario())
+        assert cache._fresh("hotels") is None
+        assert cache._fresh("restaurants") is not None
+        print("PASS: only the invalidated collection's load is discarded")
@@ -0,0 +1,203 @@
+"""
+Tests for the transactional email outbox:
+- metrics, dead-letter list and requeue require an admin session
+- form submissions still succeed with email sending deferred to the outbox
+- (in-process) duplicate dedup keys are not queued twice
+- (in-process) failed sends are retried after a backoff, then dead-lettered
+  and requeued by an admin
+- (in-process) a message whose sender died mid-send is re-claimed after its lease
+- (in-process) the worker pool delivers queued mail with its dedup key
+"""
+import asyncio
+import requests
+import os
+from datetime import timedelta
+
+from async_mongomock import AsyncDatabase
+from services import outbox
+from services.outbox import EmailOutbox, backoff_delay
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestEmailOutboxAuth:
+    """Outbox admin endpoints are admin only"""
+
+    def test_metrics_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/admin/email-outbox")
+        assert response.status_code == 401
+        print("PASS: outbox metrics require auth")
+
+    def test_dead_letters_require_auth(self):
+        response = requests.get(f"{BASE_URL}/api/admin/email-outbox/dead")
+        assert response.status_code == 401
+        print("PASS: dead letters require auth")
+
+    def test_requeue_requires_auth(self):
+        response = requests.post(f"{BASE_URL}/api/admin/email-outbox/does-not-exist/requeue")
+        assert response.status_code == 401
+        print("PASS: requeue requires auth")
+
+
+class TestQueuedEmails:
+    """Handlers only enqueue, so they respond without waiting on the provider"""
+
+    def test_contact_inquiry_queues_notification(self):
+        payload = {
+            "name": "TEST_Outbox",
+            "email": "test_outbox@example.com",
+            "country": "Spain",
+            "message": "TEST outbox message",
+        }
+        response = requests.post(f"{BASE_URL}/api/contact", json=payload, timeout=5)
+        assert response.status_code == 200
+        assert response.json()["name"] == "TEST_Outbox"
+        print("PASS: contact inquiry accepted with queued email")
+
+
+# ─── In-process: EmailOutbox against mongomock ───────────────────────────────
+
+class FakeSender:
+    """Records (recipient, idempotency key) per call; raises while `failing`"""
+
+    def __init__(self, failing=False):
+        self.failing = failing
+        self.calls = []
+
+    def __call__(self, params, idempotency_key):
+        self.calls.append((params["to"][0], idempotency_key))
+        if self.failing:
+            raise RuntimeError("provider down")
+
+
+def make_outbox(sender, max_attempts=3):
+    db = AsyncDatabase()
+    db.sync.email_outbox.create_index("dedup_key", unique=True)
+    return EmailOutbox(db, sender, workers=1, max_attempts=max_attempts), db
+
+
+async def enqueue(box, key="TEST-1"):
+    return await box.enqueue(to=["test_outbox@example.com"], subject="TEST", html="<p>TEST</p>",
+                             sender="test@example.com", dedup_key=key, kind="test")
+
+
+async def attempt(box):
+    """Claim the next due message and deliver it, as one worker iteration does"""
+    message = await box._claim()
+    if message is not None:
+        await box._deliver(asyncio.get_running_loop(), message)
+    return message
+
+
+def make_due(db, key="TEST-1"):
+    db.sync.email_outbox.update_one({"dedup_key": key}, {"$set": {"next_attempt_at": outbox._now()}})
+
+
+class TestEmailOutbox:
+    """Retry, backoff, dead-lettering and lease recovery"""
+
+    def test_backoff_doubles_with_jitter_and_cap(self):
+        for attempts, base in ((1, 30), (2, 60), (5, 480), (20, outbox.BACKOFF_MAX_SECONDS)):
+            delays = [backoff_delay(attempts) for _ in range(50)]
+            assert all(base * 0.8 <= d <= base * 1.2 for d in delays)
+        print("PASS: backoff 30s doubling, +/-20% jitter, capped")
+
+    def test_duplicate_dedup_key_queued_once(self):
+        async def scenario():
+            box, db = make_outbox(FakeSender())
+            return [await enqueue(box), await enqueue(box)], db
+
+        results, db = asyncio.run(scenario())
+        assert results == [True, False]
+        assert db.sync.email_outbox.count_documents({}) == 1
+        print("PASS: second enqueue with the same dedup key skipped")
+
+    def test_failed_send_is_retried_after_backoff(self):
+        async def scenario():
+            sender = FakeSender(failing=True)
+            box, db = make_outbox(sender)
+            await enqueue(box)
+            await attempt(box)
+            doc = db.sync.email_outbox.find_one({})
+            # Not due again until the backoff has passed
+            early = await box._claim()
+            make_due(db)
+            sender.failing = False
+            await attempt(box)
+            return doc, early, db.sync.email_outbox.find_one({}), sender, box
+
+        failed, early, sent, sender, box = asyncio.run(scenario())
+        assert failed["status"] == "pending" and failed["attempts"] == 1
+        assert failed["last_error"] == "provider down" and failed["lease_owner"] is None
+        delay = (failed["next_attempt_at"] - failed["created_at"]).total_seconds()
+        assert 30 * 0.8 - 1 <= delay <= 30 * 1.2 + 1
+        assert early is None
+        assert sent["status"] == "sent" and sent["attempts"] == 2 and sent["last_error"] is None
+        assert sender.calls == [("test_outbox@example.com", "TEST-1")] * 2
+        assert box._counters["retried"] == 1 and box._counters["sent"] == 1
+        print("PASS: failed send retried after backoff, then sent")
+
+    def test_dead_lettered_after_max_attempts_and_requeued(self):
+        async def scenario():
+            box, db = make_outbox(FakeSender(failing=True), max_attempts=3)
+            await enqueue(box)
+            for _ in range(3):
+                make_due(db)
+                await attempt(box)
+            dead = await box.dead_letters()
+            # Dead letters are never claimed again on their own
+            make_due(db)
+            unclaimed = await box._claim()
+            requeued = await box.requeue(dead[0]["id"])
+            again = await box.requeue(dead[0]["id"])
+            return dead, unclaimed, requeued, again, db.sync.email_outbox.find_one({}), await box.metrics()
+
+        dead, unclaimed, requeued, again, doc, metrics = asyncio.run(scenario())
+        assert len(dead) == 1 and dead[0]["attempts"] == 3 and "html" not in dead[0]["params"]
+        assert unclaimed is None
+        assert requeued is True and again is False
+        assert doc["status"] == "pending" and doc["attempts"] == 0 and doc["last_error"] is None
+        assert metrics["counters"]["dead"] == 1 and metrics["depth"]["pending"] == 1
+        print("PASS: dead-lettered after 3 attempts, requeued once")
+
+    def test_expired_lease_is_reclaimed(self):
+        async def scenario():
+            sender = FakeSender()
+            box, db = make_outbox(sender)
+            await enqueue(box)
+            # Another process claimed it and died mid-send
+            db.sync.email_outbox.update_one({}, {"$set": {
+                "status": "sending", "attempts": 1, "lease_owner": "dead-process",
+                "lease_until": outbox._now() + timedelta(seconds=60),
+            }})
+            live = await box._claim()
+            db.sync.email_outbox.update_one({}, {"$set": {"lease_until": outbox._now() - timedelta(seconds=1)}})
+            await attempt(box)
+            return live, db.sync.email_outbox.find_one({}), sender
+
+        live, doc, sender = asyncio.run(scenario())
+        assert live is None
+        assert doc["status"] == "sent" and doc["attempts"] == 2
+        assert len(sender.calls) == 1
+        print("PASS: live lease respected, expired lease re-claimed")
+
+    def test_workers_deliver_queued_mail(self):
+        async def scenario():
+            sender = FakeSender()
+            box, db = make_outbox(sender)
+            box.start()
+            try:
+                await enqueue(box, "TEST-A")
+                await enqueue(box, "TEST-B")
+                for _ in range(100):
+                    if db.sync.email_outbox.count_documents({"status": "sent"}) == 2:
+                        break
+                    await asyncio.sleep(0.02)
+            finally:
+                await box.stop()
+            return sender, db
+
+        sender, db = asyncio.run(scenario())
+        assert sorted(key for _, key in sender.calls) == ["TEST-A", "TEST-B"]
+        assert db.sync.email_outbox.count_documents({"status": "sent", "lease_owner": None}) == 2
+        print("PASS: worker pool sent both queued emails")
@@ -0,0 +1,83 @@
+"""
+Tests for the /api/images memory + disk cache (in-process, fake storage):
+- a miss streams to disk and keeps small objects in memory
+- concurrent disk hits for one path are counted once in memory_bytes
+- invalidate drops both tiers
+
+Run from backend/: python -m pytest tests/test_image_cache.py
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+from services.image_cache import ImageCache
+
+BODY = b"x" * 1000
+
+
+class FakeResponse:
+    headers = {"Content-Type": "image/jpeg"}
+
+    async def aiter_bytes(self):
+        yield BODY[:400]
+        yield BODY[400:]
+
+
+class FakeStorage:
+    def __init__(self):
+        self.fetches = 0
+
+    @asynccontextmanager
+    async def stream(self, path):
+        self.fetches += 1
+        yield FakeResponse()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestImageCache:
+    """Sizes stay accurate across tiers"""
+
+    def test_miss_then_memory_hit(self, tmp_path):
+        async def scenario():
+            cache = ImageCache(FakeStorage(), tmp_path)
+            first = await cache.get("hotels/a.jpg")
+            second = await cache.get("hotels/a.jpg")
+            return cache, first, second
+
+        cache, first, second = run(scenario())
+        assert first.file.read_bytes() == BODY and second.body == BODY
+        stats = cache.stats()
+        assert stats["misses"] == 1 and stats["memory_hits"] == 1
+        assert stats["memory_bytes"] == stats["disk_bytes"] == len(BODY)
+        print("PASS: miss cached on disk and in memory")
+
+    def test_concurrent_disk_hits_counted_once(self, tmp_path):
+        async def scenario():
+            cache = ImageCache(FakeStorage(), tmp_path)
+            await cache.get("hotels/a.jpg")
+            # Drop the memory copy only, so both readers take the disk path
+            cache._memory.clear()
+            cache._memory_bytes = 0
+            await asyncio.gather(cache.get("hotels/a.jpg"), cache.get("hotels/a.jpg"))
+            return cache
+
+        stats = run(scenario()).stats()
+        assert stats["disk_hits"] == 2
+        assert stats["memory_entries"] == 1 and stats["memory_bytes"] == len(BODY)
+        print("PASS: memory_bytes counts a re-read path once")
+
+    def test_invalidate(self, tmp_path):
+        async def scenario():
+            storage = FakeStorage()
+            cache = ImageCache(storage, tmp_path)
+            entry = await cache.get("hotels/a.jpg")
+            cache.invalidate("hotels/a.jpg")
+            return cache, storage, entry
+
+        cache, storage, entry = run(scenario())
+        stats = cache.stats()
+        assert stats["memory_bytes"] == stats["disk_bytes"] == 0
+        assert not entry.file.exists() and storage.fetches == 1
+        print("PASS: invalidate clears both tiers")
@@ -0,0 +1,296 @@
+"""
+Tests for external partner image mirroring:
+- the broken-image report and the re-check trigger require an admin session
+- partner listings never point at a mirror path that cannot be served
+- (in-process) sources and redirect targets on non-public addresses are refused,
+  and requests connect to the address that was checked
+- (in-process) partners are rewritten to the mirror, and to the new copy when
+  the source changes; a 304 keeps the current copy
+- (in-process) a broken source keeps serving the last good copy, is retried
+  with backoff and is listed in the report with its partners
+
+In-process tests run from backend/: python -m pytest tests/test_image_mirrors.py
+"""
+import asyncio
+import requests
+import os
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from async_mongomock import AsyncDatabase
+from services import image_mirror
+from services.image_mirror import ImageMirror, SourceUnavailable, check_public_url, pin_address
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestImageMirrorAuth:
+    """Mirror admin endpoints are admin only"""
+
+    def test_report_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/admin/image-mirrors")
+        assert response.status_code == 401
+        print("PASS: mirror report requires auth")
+
+    def test_check_requires_auth(self):
+        response = requests.post(f"{BASE_URL}/api/admin/image-mirrors/check")
+        assert response.status_code == 401
+        print("PASS: mirror re-check requires auth")
+
+
+class TestMirroredImages:
+    """Partners rewritten to a mirror keep their source and serve the local copy"""
+
+    def test_mirrored_hotel_images_are_served(self):
+        response = requests.get(f"{BASE_URL}/api/hotels")
+        assert response.status_code == 200
+        mirrored = [h for h in response.json() if '/mirrors/' in (h.get('image') or '')]
+        for hotel in mirrored[:3]:
+            assert hotel['image'].startswith('/api/images/')
+            assert hotel.get('image_source', '').startswith('http')
+            image = requests.get(f"{BASE_URL}{hotel['image']}")
+            assert image.status_code == 200
+            assert image.headers.get('Content-Type', '').startswith('image/')
+        print(f"PASS: {len(mirrored)} hotels served from mirrored copies")
+
+
+# ─── In-process: ImageMirror with a mock transport and resolver ──────────────
+
+HOSTS = {
+    "images.example.com": ["93.184.216.34"],
+    "internal.example.com": ["10.0.0.5"],
+    "metadata.example.com": ["169.254.169.254"],
+    "mapped.example.com": ["::ffff:127.0.0.1"],
+}
+
+
+async def fake_resolve(host, port):
+    if host in HOSTS:
+        return HOSTS[host]
+    try:
+        import ipaddress
+        return [str(ipaddress.ip_address(host))]
+    except ValueError:
+        raise OSError("unknown host")
+
+
+class FakePipeline:
+    """Stands in for ImagePipeline.ingest: records the stored paths"""
+
+    def __init__(self):
+        self.ingested = []
+
+    async def ingest(self, data, content_type, path):
+        self.ingested.append(path)
+        return {"path": path, "width": 800, "height": 600, "variants": []}
+
+
+def make_mirror(handler, db=None, pipeline=None, **kwargs):
+    return ImageMirror(
+        db or AsyncDatabase(), pipeline or FakePipeline(), "TEST/mirrors",
+        transport=httpx.MockTransport(handler), resolve=fake_resolve, **kwargs,
+    )
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestSourceAddressCheck:
+    """Only public addresses are fetched, on every redirect hop"""
+
+    @pytest.mark.parametrize("url", [
+        "http://127.0.0.1/a.jpg",
+        "http://localhost.internal/a.jpg",
+        "http://internal.example.com/a.jpg",
+        "http://metadata.example.com/latest/meta-data/",
+        "http://mapped.example.com/a.jpg",
+        "http://[::1]/a.jpg",
+        "file:///etc/passwd",
+    ])
+    def test_non_public_sources_refused(self, url):
+        with pytest.raises(SourceUnavailable):
+            run(check_public_url(url, fake_resolve))
+        print(f"PASS: {url} refused")
+
+    def test_public_source_allowed(self):
+        run(check_public_url("https://images.example.com/a.jpg", fake_resolve))
+        print("PASS: public source allowed")
+
+    def test_redirect_to_internal_address_is_not_followed(self):
+        requested = []
+
+        def handler(request):
+            requested.append(request.headers["host"] + request.url.raw_path.decode())
+            if request.headers["host"] == "images.example.com":
+                return httpx.Response(302, headers={"Location": "http://169.254.169.254/latest/meta-data/"})
+            return httpx.Response(200, headers={"Content-Type": "image/jpeg"}, content=b"\xff" * 5000)
+
+        async def scenario():
+            mirror = make_mirror(handler)
+            source = "https://images.example.com/a.jpg"
+            await mirror.enqueue(source)
+            await mirror.check(await mirror._claim())
+            record = await mirror.mirrors.find_one({"source_url": source})
+            await mirror.stop()
+            return record
+
+        record = run(scenario())
+        assert requested == ["images.example.com/a.jpg"]
+        assert record["status"] == "broken"
+        assert "non-public" in record["error"]
+        print("PASS: redirect to the metadata address refused before connecting")
+
+    def test_pin_address_keeps_host_and_server_name(self):
+        assert pin_address("https://images.example.com/a.jpg?x=1", "93.184.216.34") == (
+            "https://93.184.216.34/a.jpg?x=1", {"Host": "images.example.com"},
+            {"sni_hostname": "images.example.com"},
+        )
+        assert pin_address("http://images.example.com:8080/a.jpg", "2606:2800:220:1::1") == (
+            "http://[2606:2800:220:1::1]:8080/a.jpg", {"Host": "images.example.com:8080"},
+            {"sni_hostname": "images.example.com"},
+        )
+        assert pin_address("http://93.184.216.34/a.jpg", "93.184.216.34")[2] == {}
+        print("PASS: pinned URLs keep the original Host and TLS server name")
+
+    def test_rebinding_host_connects_to_checked_address(self):
+        lookups, connected = [], []
+
+        async def rebinding_resolve(host, port):
+            # Public for the check, loopback for any later lookup
+            lookups.append(host)
+            return ["93.184.216.34"] if len(lookups) == 1 else ["127.0.0.1"]
+
+        def handler(request):
+            connected.append((request.url.host, request.headers["host"], request.extensions.get("sni_hostname")))
+            return httpx.Response(200, headers={"Content-Type": "image/jpeg"}, content=b"\xff" * 5000)
+
+        async def scenario():
+            mirror = ImageMirror(AsyncDatabase(), FakePipeline(), "TEST/mirrors",
+                                 transport=httpx.MockTransport(handler), resolve=rebinding_resolve)
+            await mirror.enqueue("https://rebind.example.com/a.jpg")
+            await mirror.check(await mirror._claim())
+            await mirror.stop()
+
+        run(scenario())
+        assert lookups == ["rebind.example.com"]
+        assert connected == [("93.184.216.34", "rebind.example.com", "rebind.example.com")]
+        print("PASS: request pinned to the checked address")
+
+
+SOURCE = "https://images.example.com/hotel.jpg"
+PHOTO = b"\xff" * 5000
+
+
+class Origin:
+    """Mock origin serving SOURCE; `status`, `body` and `etag` can change between checks"""
+
+    def __init__(self, body=PHOTO, etag='"v1"'):
+        self.status = 200
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.status != 200:
+            return httpx.Response(self.status)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"Content-Type": "image/jpeg", "ETag": self.etag}, content=self.body)
+
+
+def add_partners(db):
+    db.sync.hotels.insert_many([
+        {"id": "TEST-hotel-1", "name": "TEST Hotel 1", "image": SOURCE},
+        {"id": "TEST-hotel-2", "name": "TEST Hotel 2", "image": SOURCE},
+    ])
+    db.sync.restaurants.insert_one({"id": "TEST-restaurant", "name": "TEST Restaurant", "image": "/api/images/own.jpg"})
+
+
+async def check_due(mirror):
+    """Make every record due and check them, as the workers would"""
+    await mirror.mirrors.update_many({}, {"$set": {"next_check_at": image_mirror._now()}})
+    while (record := await mirror._claim()) is not None:
+        await mirror.check(record)
+
+
+class TestMirrorRewriting:
+    """Catalog sync, partner rewriting and the broken-image report"""
+
+    def test_partners_rewritten_to_mirror(self):
+        async def scenario():
+            db, changed = AsyncDatabase(), []
+            add_partners(db)
+            mirror = make_mirror(Origin(), db, on_change=changed.append)
+            counts = await mirror.sync_sources()
+            await check_due(mirror)
+            await mirror.stop()
+            return counts, db, changed, await mirror.mirrors.find_one({"source_url": SOURCE})
+
+        counts, db, changed, record = run(scenario())
+        assert counts == {"sources": 1, "added": 1, "removed": 0}
+        assert record["status"] == "ok" and record["url"].startswith("/api/images/TEST/mirrors/")
+        for hotel in db.sync.hotels.find():
+            assert hotel["image"] == record["url"] and hotel["image_source"] == SOURCE
+        assert db.sync.restaurants.find_one()["image"] == "/api/images/own.jpg"
+        assert changed == ["hotels"]
+        print(f"PASS: 2 hotels rewritten to {record['url']}")
+
+    def test_changed_source_gets_new_copy_and_304_keeps_it(self):
+        async def scenario():
+            db, origin, pipeline = AsyncDatabase(), Origin(), FakePipeline()
+            add_partners(db)
+            mirror = make_mirror(origin, db, pipeline)
+            await mirror.sync_sources()
+            await check_due(mirror)
+            first = await mirror.mirrors.find_one({"source_url": SOURCE})
+            # Unchanged: conditional request answered with 304
+            await check_due(mirror)
+            unchanged = await mirror.mirrors.find_one({"source_url": SOURCE})
+            origin.body, origin.etag = b"\xfe" * 5000, '"v2"'
+            # A rescan now sees the partners' image_source, not the external URL
+            await mirror.sync_sources()
+            await check_due(mirror)
+            second = await mirror.mirrors.find_one({"source_url": SOURCE})
+            await mirror.stop()
+            return db, origin, pipeline, first, unchanged, second
+
+        db, origin, pipeline, first, unchanged, second = run(scenario())
+        assert origin.requests[1].headers.get("If-None-Match") == '"v1"'
+        assert unchanged["url"] == first["url"] and len(pipeline.ingested) == 2
+        assert second["url"] != first["url"] and second["etag"] == '"v2"'
+        assert {h["image"] for h in db.sync.hotels.find()} == {second["url"]}
+        print("PASS: 304 kept the copy, changed source rewrote partners to the new one")
+
+    def test_broken_source_keeps_last_copy_and_is_reported(self):
+        async def scenario():
+            db, origin = AsyncDatabase(), Origin()
+            add_partners(db)
+            mirror = make_mirror(origin, db)
+            await mirror.sync_sources()
+            await check_due(mirror)
+            good = await mirror.mirrors.find_one({"source_url": SOURCE})
+            origin.status = 404
+            await check_due(mirror)
+            await check_due(mirror)
+            # A partner added since, still pointing at the origin
+            db.sync.restaurants.insert_one({"id": "TEST-restaurant-2", "name": "TEST Restaurant 2", "image": SOURCE})
+            report = await mirror.report()
+            await mirror.stop()
+            return db, good, await mirror.mirrors.find_one({"source_url": SOURCE}), report
+
+        db, good, broken, report = run(scenario())
+        assert broken["status"] == "broken" and broken["http_status"] == 404 and broken["failures"] == 2
+        retry = broken["next_check_at"] - broken["checked_at"]
+        assert retry == timedelta(seconds=2 * image_mirror.BROKEN_RETRY_BASE_SECONDS)
+        # Partners keep serving the last good copy
+        assert {h["image"] for h in db.sync.hotels.find()} == {good["url"]}
+        assert report["summary"]["broken"] == 1
+        [entry] = report["broken"]
+        assert entry["source_url"] == SOURCE and entry["error"] == "HTTP 404"
+        serving = {p["id"]: p["serving"] for p in entry["partners"]}
+        assert serving == {"TEST-hotel-1": "mirror", "TEST-hotel-2": "mirror", "TEST-restaurant-2": "origin"}
+        print("PASS: broken source reported with 2 mirrored and 1 origin partner")
@@ -1,6 +1,7 @@
 """
 Test suite for the Drag-and-Drop Image Upload feature in Admin Dashboard.
 Tests: POST /api/admin/upload-image, GET /api/images/{path}, PATCH /api/admin/partner/{partner_id}/image
+(in-process) process_image refuses oversized images and skips variants on request
 """
 import pytest
 import requests
@@ -8,6 +9,10 @@ import os
 import io
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+# Session cookie of an admin user; uploads and the partner image PATCH require it
+ADMIN_SESSION_TOKEN = os.environ.get('ADMIN_SESSION_TOKEN')
+ADMIN_COOKIES = {"session_token": ADMIN_SESSION_TOKEN} if ADMIN_SESSION_TOKEN else None
+requires_admin = pytest.mark.skipif(not ADMIN_SESSION_TOKEN, reason="ADMIN_SESSION_TOKEN not set")
 
 # Minimal valid JPEG bytes (1x1 pixel red image)
 MINIMAL_JPEG = bytes([
@@ -46,10 +51,18 @@ MINIMAL_JPEG = bytes([
 class TestImageUploadEndpoint:
     """Test POST /api/admin/upload-image endpoint"""
     
+    def test_upload_requires_auth(self):
+        """Anonymous uploads are refused before any image work"""
+        files = {'file': ('test_image.jpg', io.BytesIO(MINIMAL_JPEG), 'image/jpeg')}
+        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files)
+        assert response.status_code == 401
+        print("✓ Upload requires auth")
+
+    @requires_admin
     def test_upload_jpeg_image(self):
         """Upload a JPEG image and verify response contains url and path"""
         files = {'file': ('test_image.jpg', io.BytesIO(MINIMAL_JPEG), 'image/jpeg')}
-        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files)
+        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
         data = response.json()
@@ -65,6 +78,7 @@ class TestImageUploadEndpoint:
         print(f"✓ Upload successful: url={data['url']}, path={data['path']}")
         return data
     
+    @requires_admin
     def test_upload_png_image(self):
         """Upload a PNG image and verify it's accepted"""
         # Minimal PNG (1x1 pixel)
@@ -77,7 +91,7 @@ class TestImageUploadEndpoint:
             0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
         ])
         files = {'file': ('test_image.png', io.BytesIO(png_bytes), 'image/png')}
-        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files)
+        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
         data = response.json()
@@ -85,10 +99,11 @@ class TestImageUploadEndpoint:
         assert 'path' in data
         print(f"✓ PNG upload successful: {data['url']}")
     
+    @requires_admin
     def test_upload_rejects_invalid_file_type(self):
         """Verify that non-image files are rejected"""
         files = {'file': ('test.txt', io.BytesIO(b'Hello World'), 'text/plain')}
-        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files)
+        response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
         
         assert response.status_code == 400, f"Expected 400 for invalid file type, got {response.status_code}"
         print("✓ Invalid file type correctly rejected")
@@ -97,11 +112,12 @@ class TestImageUploadEndpoint:
 class TestImageServingEndpoint:
     """Test GET /api/images/{path} endpoint"""
     
+    @requires_admin
     def test_serve_uploaded_image(self):
         """Upload an image and verify it can be served back"""
         # First upload an image
         files = {'file': ('test_serve.jpg', io.BytesIO(MINIMAL_JPEG), 'image/jpeg')}
-        upload_response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files)
+        upload_response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
         assert upload_response.status_code == 200
         upload_data = upload_response.json()
         
@@ -114,7 +130,54 @@ class TestImageServingEndpoint:
         assert len(serve_response.content) > 0, "Image content should not be empty"
         
         print(f"✓ Image served successfully from {upload_data['url']}")
-    
+
+    @requires_admin
+    def test_serve_image_conditional_get(self):
+        """Served images carry ETag/Last-Modified and revalidate with a 304"""
+        files = {'file': ('test_etag.jpg', io.BytesIO(MINIMAL_JPEG), 'image/jpeg')}
+        upload_response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
+        assert upload_response.status_code == 200
+        serve_url = f"{BASE_URL}{upload_response.json()['url']}"
+
+        first = requests.get(serve_url)
+        assert first.status_code == 200
+        etag = first.headers.get('ETag')
+        last_modified = first.headers.get('Last-Modified')
+        assert etag and last_modified, "ETag and Last-Modified should be set"
+
+        by_etag = requests.get(serve_url, headers={'If-None-Match': etag})
+        assert by_etag.status_code == 304
+        assert by_etag.content == b""
+
+        by_date = requests.get(serve_url, headers={'If-Modified-Since': last_modified})
+        assert by_date.status_code == 304
+
+        # Cached copy is byte-identical to the first response
+        again = requests.get(serve_url)
+        assert again.content == first.content
+        print("✓ Image conditional GET returns 304")
+
+    @requires_admin
+    def test_serve_image_variant_by_accept(self):
+        """Uploads get a srcset, and ?w= serves a WebP variant to clients that accept it"""
+        files = {'file': ('test_variant.jpg', io.BytesIO(MINIMAL_JPEG), 'image/jpeg')}
+        upload_response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
+        assert upload_response.status_code == 200
+        upload_data = upload_response.json()
+        assert upload_data.get('width') == 1 and upload_data.get('height') == 1
+        assert upload_data.get('srcset', '').startswith(f"{upload_data['url']}?w=1 ")
+
+        serve_url = f"{BASE_URL}{upload_data['url']}"
+        webp = requests.get(f"{serve_url}?w=320", headers={'Accept': 'image/webp,image/*'})
+        assert webp.status_code == 200
+        assert webp.headers.get('Content-Type') == 'image/webp'
+        assert 'Accept' in webp.headers.get('Vary', '')
+
+        # Clients without WebP/AVIF support get the original
+        original = requests.get(f"{serve_url}?w=320", headers={'Accept': 'image/jpeg'})
+        assert original.headers.get('Content-Type') == 'image/jpeg'
+        print("✓ Image variants negotiated by Accept")
+
     def test_serve_nonexistent_image_returns_error(self):
         """Verify that requesting a non-existent image returns an error"""
         response = requests.get(f"{BASE_URL}/api/images/nonexistent/path/image.jpg")
@@ -127,13 +190,24 @@ class TestImageServingEndpoint:
 class TestPartnerImageUpdateEndpoint:
     """Test PATCH /api/admin/partner/{partner_id}/image endpoint"""
     
+    def test_update_partner_image_requires_auth(self):
+        """Without an admin session the image cannot be changed (it would be fetched by the mirror)"""
+        response = requests.patch(
+            f"{BASE_URL}/api/admin/partner/golf-son-gual/image",
+            json={"image": "http://169.254.169.254/latest/meta-data/"}
+        )
+        assert response.status_code == 401, f"Expected 401, got {response.status_code}"
+        print("✓ Anonymous image update rejected")
+    
+    @requires_admin
     def test_update_partner_image_golf_course(self):
         """Update a golf course partner's image"""
         test_image_url = "https://example.com/test-image.jpg"
         
         response = requests.patch(
             f"{BASE_URL}/api/admin/partner/golf-son-gual/image",
-            json={"image": test_image_url}
+            json={"image": test_image_url},
+            cookies=ADMIN_COOKIES
         )
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
@@ -144,6 +218,7 @@ class TestPartnerImageUpdateEndpoint:
         
         print(f"✓ Partner image updated: {data}")
     
+    @requires_admin
     def test_update_partner_image_hotel(self):
         """Update a hotel partner's image"""
         test_image_url = "https://example.com/hotel-test-image.jpg"
@@ -156,7 +231,8 @@ class TestPartnerImageUpdateEndpoint:
             
             response = requests.patch(
                 f"{BASE_URL}/api/admin/partner/{hotel_id}/image",
-                json={"image": test_image_url}
+                json={"image": test_image_url},
+                cookies=ADMIN_COOKIES
             )
             
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
@@ -166,23 +242,27 @@ class TestPartnerImageUpdateEndpoint:
         else:
             pytest.skip("No hotels found to test")
     
+    @requires_admin
     def test_update_partner_image_missing_url(self):
         """Verify that missing image URL returns 400"""
         response = requests.patch(
             f"{BASE_URL}/api/admin/partner/golf-son-gual/image",
-            json={}
+            json={},
+            cookies=ADMIN_COOKIES
         )
         
         assert response.status_code == 400, f"Expected 400, got {response.status_code}"
         print("✓ Missing image URL correctly returns 400")
     
+    @requires_admin
     def test_update_nonexistent_partner_creates_override(self):
         """Updating a non-existent partner should create an override entry"""
         test_image_url = "https://example.com/override-test.jpg"
         
         response = requests.patch(
             f"{BASE_URL}/api/admin/partner/nonexistent-partner-xyz/image",
-            json={"image": test_image_url}
+            json={"image": test_image_url},
+            cookies=ADMIN_COOKIES
         )
         
         # Should still return 200 as it creates an override
@@ -233,11 +313,12 @@ class TestAllPartnersEndpoint:
 class TestEndToEndImageUploadFlow:
     """Test the complete flow: upload → serve → update partner"""
     
+    @requires_admin
     def test_complete_image_upload_flow(self):
         """Test the complete flow of uploading an image and updating a partner"""
         # Step 1: Upload image
         files = {'file': ('e2e_test.jpg', io.BytesIO(MINIMAL_JPEG), 'image/jpeg')}
-        upload_response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files)
+        upload_response = requests.post(f"{BASE_URL}/api/admin/upload-image", files=files, cookies=ADMIN_COOKIES)
         assert upload_response.status_code == 200, f"Upload failed: {upload_response.text}"
         upload_data = upload_response.json()
         print(f"Step 1: Image uploaded - {upload_data['url']}")
@@ -253,7 +334,8 @@ class TestEndToEndImageUploadFlow:
         image_url = f"{BASE_URL}{upload_data['url']}"
         patch_response = requests.patch(
             f"{BASE_URL}/api/admin/partner/{partner_id}/image",
-            json={"image": image_url}
+            json={"image": image_url},
+            cookies=ADMIN_COOKIES
         )
         assert patch_response.status_code == 200, f"Patch failed: {patch_response.text}"
         print(f"Step 3: Partner {partner_id} updated with new image")
@@ -272,3 +354,31 @@ class TestEndToEndImageUploadFlow:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
+
+
+class TestImageLimits:
+    """(in-process) process_image size limit and variant opt-out"""
+
+    @staticmethod
+    def png(width, height):
+        from PIL import Image
+        buf = io.BytesIO()
+        Image.new("1", (width, height)).save(buf, "PNG")
+        return buf.getvalue()
+
+    def test_oversized_image_refused(self, monkeypatch):
+        from PIL import Image
+        from services import image_pipeline
+        monkeypatch.setattr(image_pipeline, "MAX_PIXELS", 100 * 100)
+        with pytest.raises(Image.DecompressionBombError):
+            image_pipeline.process_image(self.png(101, 100))
+        print("✓ Oversized image refused before decoding")
+
+    def test_variants_skipped_without_widths(self):
+        from services.image_pipeline import process_image
+        processed = process_image(self.png(400, 300), widths=(), avif=False)
+        assert (processed["width"], processed["height"]) == (400, 300)
+        assert processed["variants"] == []
+        with_variants = process_image(self.png(400, 300), avif=False)
+        assert [v["width"] for v in with_variants["variants"]] == [320, 400]
+        print("✓ Variants only generated when widths are given")
@@ -0,0 +1,80 @@
+"""
+Tests for the index management admin endpoints:
+- Declared indexes are created at startup and reported as present
+- Unique constraints the code relies on are in place
+- Both endpoints require an admin session
+- (in-process) text/2dsphere/hashed key directions are compared as strings
+
+Authenticated tests need ADMIN_SESSION_TOKEN (an admin's session cookie).
+"""
+import pytest
+import requests
+import os
+
+from services.indexes import _key_pattern
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+ADMIN_SESSION_TOKEN = os.environ.get('ADMIN_SESSION_TOKEN')
+ADMIN_COOKIES = {"session_token": ADMIN_SESSION_TOKEN} if ADMIN_SESSION_TOKEN else None
+requires_admin = pytest.mark.skipif(not ADMIN_SESSION_TOKEN, reason="ADMIN_SESSION_TOKEN not set")
+
+
+@pytest.fixture(scope="module")
+def report():
+    if not ADMIN_SESSION_TOKEN:
+        pytest.skip("ADMIN_SESSION_TOKEN not set")
+    requests.post(f"{BASE_URL}/api/admin/indexes/ensure", cookies=ADMIN_COOKIES)
+    response = requests.get(f"{BASE_URL}/api/admin/indexes", cookies=ADMIN_COOKIES)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestIndexAuth:
+    """Index endpoints are admin only"""
+
+    def test_report_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/admin/indexes")
+        assert response.status_code == 401
+        print("PASS: index report requires auth")
+
+    def test_ensure_requires_auth(self):
+        response = requests.post(f"{BASE_URL}/api/admin/indexes/ensure")
+        assert response.status_code == 401
+        print("PASS: index ensure requires auth")
+
+
+class TestIndexReport:
+    """GET /api/admin/indexes"""
+
+    def test_report_shape(self, report):
+        for name in ["users", "user_sessions", "payment_transactions", "golf_courses"]:
+            assert name in report
+            for key in ["present", "missing", "not_unique", "undeclared", "unused", "usage"]:
+                assert key in report[name]
+        print("PASS: Report lists the declared collections")
+
+    def test_session_token_index_present(self, report):
+        assert "session_token_1" in report["user_sessions"]["present"]
+        assert report["user_sessions"]["missing"] == []
+        print("PASS: user_sessions.session_token indexed")
+
+    def test_catalog_compound_index_present(self, report):
+        for name in ["golf_courses", "hotels", "restaurants", "beach_clubs", "cafe_bars"]:
+            assert "display_order_1_id_1" in report[name]["present"]
+        print("PASS: (display_order, id) present on every catalog collection")
+
+    @requires_admin
+    def test_ensure_is_idempotent(self):
+        first = requests.post(f"{BASE_URL}/api/admin/indexes/ensure", cookies=ADMIN_COOKIES).json()
+        second = requests.post(f"{BASE_URL}/api/admin/indexes/ensure", cookies=ADMIN_COOKIES).json()
+        assert sorted(first["created"]) == sorted(second["created"])
+        print("PASS: Ensuring twice yields the same indexes")
+
+
+class TestKeyPattern:
+    """Declared and server-reported keys compare equal"""
+
+    def test_numeric_and_string_directions(self):
+        assert _key_pattern([("display_order", 1.0), ("id", -1)]) == (("display_order", 1), ("id", -1))
+        assert _key_pattern({"title": "text", "location": "2dsphere"}.items()) == (("title", "text"), ("location", "2dsphere"))
+        print("PASS: numeric directions normalized, string directions kept")
@@ -0,0 +1,96 @@
+"""
+Tests for ?lang= language projection on catalog, blog and search endpoints:
+- Multilingual fields keep their dict shape with only the requested language
+- Unknown languages fall back to English
+- Projected payloads are smaller than the full multilingual ones
+"""
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+def _single_language(value, lang):
+    return isinstance(value, dict) and list(value.keys()) == [lang]
+
+
+class TestCatalogLanguageProjection:
+    """Partner and golf course endpoints with ?lang="""
+
+    def test_all_partners_german(self):
+        """description and deal only contain the German text"""
+        response = requests.get(f"{BASE_URL}/api/all-partners", params={"lang": "de"})
+        assert response.status_code == 200
+        data = response.json()
+        for hotel in data["hotels"]:
+            assert _single_language(hotel["description"], "de"), hotel["id"]
+            if "deal" in hotel and isinstance(hotel["deal"], dict):
+                assert _single_language(hotel["deal"], "de"), hotel["id"]
+        print("PASS: all-partners projected to German")
+
+    def test_projection_shrinks_payload(self):
+        """lang=en payload is smaller than the full multilingual payload"""
+        full = requests.get(f"{BASE_URL}/api/all-partners")
+        english = requests.get(f"{BASE_URL}/api/all-partners", params={"lang": "en"})
+        assert len(english.content) < len(full.content)
+        print(f"PASS: {len(full.content)} -> {len(english.content)} bytes")
+
+    def test_each_language_has_own_etag(self):
+        """Language projections are cached separately"""
+        de = requests.get(f"{BASE_URL}/api/hotels", params={"lang": "de"})
+        fr = requests.get(f"{BASE_URL}/api/hotels", params={"lang": "fr"})
+        assert de.headers["ETag"] != fr.headers["ETag"]
+        print("PASS: Separate ETags per language")
+
+    def test_unknown_language_falls_back_to_english(self):
+        """An unsupported lang returns the English texts"""
+        response = requests.get(f"{BASE_URL}/api/golf-courses", params={"lang": "xx"})
+        assert response.status_code == 200
+        for course in response.json():
+            assert _single_language(course["description"], "en")
+        print("PASS: Unknown language falls back to English")
+
+    def test_golf_course_detail_projection(self):
+        """Single golf course honours lang"""
+        response = requests.get(f"{BASE_URL}/api/golf-courses/golf-alcanada", params={"lang": "fr"})
+        assert response.status_code == 200
+        assert _single_language(response.json()["description"], "fr")
+        print("PASS: Golf course detail projected")
+
+    def test_no_lang_keeps_all_languages(self):
+        """Without lang every language is still returned (backward compatible)"""
+        response = requests.get(f"{BASE_URL}/api/golf-courses/golf-alcanada")
+        assert {"en", "de"} <= set(response.json()["description"].keys())
+        print("PASS: Full response without lang")
+
+
+class TestBlogAndSearchLanguageProjection:
+    """Blog and search endpoints with ?lang="""
+
+    def test_blog_list_projection(self):
+        """Blog list returns one language per post"""
+        response = requests.get(f"{BASE_URL}/api/blog", params={"lang": "de"})
+        assert response.status_code == 200
+        posts = response.json()
+        assert len(posts) > 0
+        for post in posts:
+            assert _single_language(post["title"], "de")
+            assert _single_language(post["excerpt"], "de")
+        print("PASS: Blog list projected")
+
+    def test_blog_detail_projection(self):
+        """Blog detail honours lang"""
+        slug = requests.get(f"{BASE_URL}/api/blog").json()[0]["slug"]
+        response = requests.get(f"{BASE_URL}/api/blog/{slug}", params={"lang": "se"})
+        assert response.status_code == 200
+        assert _single_language(response.json()["title"], "se")
+        print("PASS: Blog detail projected")
+
+    def test_search_projection(self):
+        """Search result descriptions are projected"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "palma", "lang": "fr"})
+        assert response.status_code == 200
+        for result in response.json()["results"]:
+            if isinstance(result.get("description"), dict):
+                assert _single_language(result["description"], "fr")
+        print("PASS: Search results projected")
@@ -0,0 +1,87 @@
+"""
+Tests for sparse fieldsets and cursor pagination on catalog listings:
+- fields= returns only the requested keys (plus id)
+- limit/cursor pages cover the whole listing without duplicates
+- Invalid cursors and fields are rejected with 400
+"""
+import pytest
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+LISTINGS = ["/api/hotels", "/api/restaurants", "/api/beach-clubs", "/api/cafe-bars", "/api/golf-courses"]
+
+
+class TestSparseFieldsets:
+    """fields= projection"""
+
+    @pytest.mark.parametrize("path", LISTINGS)
+    def test_fields_projection(self, path):
+        """Only id, name and image are returned"""
+        response = requests.get(f"{BASE_URL}{path}", params={"fields": "name,image"})
+        assert response.status_code == 200
+        items = response.json()
+        assert len(items) > 0
+        for item in items:
+            assert set(item.keys()) <= {"id", "name", "image"}
+            assert "id" in item
+        print(f"PASS: {path} sparse fieldset")
+
+    def test_invalid_fields_rejected(self):
+        """Field names must be plain identifiers"""
+        response = requests.get(f"{BASE_URL}/api/hotels", params={"fields": "name,$where"})
+        assert response.status_code == 400
+        print("PASS: Invalid fields rejected")
+
+
+class TestCursorPagination:
+    """limit/cursor keyset pagination"""
+
+    @pytest.mark.parametrize("path", LISTINGS)
+    def test_pages_cover_full_listing(self, path):
+        """Walking every page yields each active item exactly once"""
+        full_ids = [item["id"] for item in requests.get(f"{BASE_URL}{path}").json()]
+
+        seen = []
+        cursor = None
+        for _ in range(100):
+            params = {"limit": 6, "fields": "name"}
+            if cursor:
+                params["cursor"] = cursor
+            response = requests.get(f"{BASE_URL}{path}", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["items"]) <= 6
+            seen += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(seen) == len(set(seen)), "Duplicate items across pages"
+        assert sorted(seen) == sorted(full_ids)
+        print(f"PASS: {path} paginated over {len(seen)} items")
+
+    def test_first_page_shape(self):
+        """First page returns items and a next_cursor when more remain"""
+        response = requests.get(f"{BASE_URL}/api/hotels", params={"limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data.keys()) == {"items", "next_cursor"}
+        assert len(data["items"]) == 2
+        assert isinstance(data["next_cursor"], str)
+        print("PASS: Page shape correct")
+
+    def test_invalid_cursor_rejected(self):
+        """Garbage cursors return 400"""
+        response = requests.get(f"{BASE_URL}/api/hotels", params={"limit": 6, "cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        print("PASS: Invalid cursor rejected")
+
+    def test_limit_bounds(self):
+        """limit outside 1..100 is a validation error"""
+        response = requests.get(f"{BASE_URL}/api/hotels", params={"limit": 0})
+        assert response.status_code == 422
+        response = requests.get(f"{BASE_URL}/api/hotels", params={"limit": 1000})
+        assert response.status_code == 422
+        print("PASS: limit bounds enforced")
@@ -0,0 +1,164 @@
+"""
+Tests for the startup data migrations:
+- the migration status endpoint requires an admin session
+- seeded catalogs are present with sequential hotel display_order
+- (in-process) applied migrations are skipped on later runs, a failure stops
+  the run and is retried next time, and a live claim by another process is
+  left alone while an expired one is taken over
+- (in-process) seed upserts insert missing documents only
+"""
+import asyncio
+import requests
+import os
+from datetime import datetime, timedelta, timezone
+
+from async_mongomock import AsyncDatabase
+from services.migrations import Migration, MigrationRunner, seed_upserts
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestMigrationStatus:
+    """Migration status is admin only"""
+
+    def test_status_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/admin/migrations")
+        assert response.status_code == 401
+        print("PASS: migration status requires auth")
+
+
+class TestSeededCatalog:
+    """Seeds and the display_order normalization have been applied"""
+
+    def test_new_golf_courses_seeded(self):
+        response = requests.get(f"{BASE_URL}/api/golf-courses", params={"include_inactive": True})
+        assert response.status_code == 200
+        ids = {c["id"] for c in response.json()}
+        assert "golf-de-andratx" in ids
+        print("PASS: new golf courses seeded")
+
+    def test_hotel_display_order_unique(self):
+        response = requests.get(f"{BASE_URL}/api/hotels", params={"include_inactive": True})
+        assert response.status_code == 200
+        orders = [h.get("display_order") for h in response.json()]
+        assert all(orders), "No hotel should have a zero or missing display_order"
+        assert len(set(orders)) == len(orders), "display_order values should be unique"
+        print(f"PASS: {len(orders)} hotels with unique display_order")
+
+
+# ─── In-process: MigrationRunner against mongomock ───────────────────────────
+
+class Recorder:
+    """Migrations that log their calls; `fail` makes one raise"""
+
+    def __init__(self, *versions, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+        self.migrations = [Migration(v, f"TEST {v}", self._apply(v)) for v in versions]
+
+    def _apply(self, version):
+        async def apply(db):
+            self.calls.append(version)
+            # Let a concurrent runner interleave here
+            await asyncio.sleep(0)
+            if version in self.fail:
+                raise RuntimeError(f"{version} broke")
+            return {"version": version}
+        return apply
+
+
+def claimed_by_other(db, version, lease_until):
+    db.sync["_migrations"].insert_one({
+        "_id": version, "status": "running", "owner": "other-process",
+        "lease_until": lease_until,
+    })
+
+
+class TestMigrationRunner:
+    """Run-once, ordered, lease-claimed migrations"""
+
+    def test_applied_migrations_are_skipped(self):
+        async def scenario():
+            db, recorder = AsyncDatabase(), Recorder("0001", "0002")
+            first = await MigrationRunner(db, recorder.migrations).run()
+            second = await MigrationRunner(db, recorder.migrations).run()
+            return recorder, first, second, await MigrationRunner(db, recorder.migrations).status()
+
+        recorder, first, second, status = asyncio.run(scenario())
+        assert recorder.calls == ["0001", "0002"]
+        assert first == {"applied": 2, "skipped": 0, "failed": 0}
+        assert second == {"applied": 0, "skipped": 2, "failed": 0}
+        assert [(s["version"], s["status"], s["result"]) for s in status] == [
+            ("0001", "applied", {"version": "0001"}), ("0002", "applied", {"version": "0002"}),
+        ]
+        print("PASS: second run applied nothing")
+
+    def test_failure_stops_the_run_and_is_retried(self):
+        async def scenario():
+            db, recorder = AsyncDatabase(), Recorder("0001", "0002", "0003", fail={"0002"})
+            first = await MigrationRunner(db, recorder.migrations).run()
+            status = await MigrationRunner(db, recorder.migrations).status()
+            recorder.fail.clear()
+            second = await MigrationRunner(db, recorder.migrations).run()
+            return recorder, first, status, second
+
+        recorder, first, status, second = asyncio.run(scenario())
+        assert first == {"applied": 1, "skipped": 0, "failed": 1}
+        assert [s["status"] for s in status] == ["applied", "failed", "pending"]
+        assert status[1]["error"] == "0002 broke"
+        assert second == {"applied": 2, "skipped": 1, "failed": 0}
+        assert recorder.calls == ["0001", "0002", "0002", "0003"]
+        print("PASS: 0003 waited for 0002, which was retried on the next run")
+
+    def test_live_claim_is_left_to_its_owner(self):
+        async def scenario():
+            db, recorder = AsyncDatabase(), Recorder("0001", "0002")
+            claimed_by_other(db, "0001", datetime.now(timezone.utc) + timedelta(minutes=5))
+            return recorder, await MigrationRunner(db, recorder.migrations).run()
+
+        recorder, counts = asyncio.run(scenario())
+        assert recorder.calls == []
+        assert counts == {"applied": 0, "skipped": 1, "failed": 0}
+        print("PASS: live claim respected, later migrations left to its owner")
+
+    def test_expired_claim_is_taken_over(self):
+        async def scenario():
+            db, recorder = AsyncDatabase(), Recorder("0001")
+            claimed_by_other(db, "0001", datetime.now(timezone.utc) - timedelta(seconds=1))
+            runner = MigrationRunner(db, recorder.migrations)
+            return recorder, await runner.run(), db.sync["_migrations"].find_one({"_id": "0001"}), runner
+
+        recorder, counts, record, runner = asyncio.run(scenario())
+        assert recorder.calls == ["0001"] and counts["applied"] == 1
+        assert record["status"] == "applied" and record["owner"] == runner._owner
+        print("PASS: abandoned claim taken over")
+
+    def test_concurrent_runners_apply_each_migration_once(self):
+        async def scenario():
+            db, recorder = AsyncDatabase(), Recorder("0001", "0002", "0003")
+            runners = [MigrationRunner(db, recorder.migrations) for _ in range(3)]
+            await asyncio.gather(*(r.run() for r in runners))
+            # Whichever runner stepped aside leaves the rest to the next boot at worst
+            await MigrationRunner(db, recorder.migrations).run()
+            return recorder
+
+        recorder = asyncio.run(scenario())
+        assert sorted(recorder.calls) == ["0001", "0002", "0003"]
+        print("PASS: 3 runners, each migration applied once")
+
+    def test_seed_upserts_insert_missing_only(self):
+        async def scenario():
+            db = AsyncDatabase()
+            db.sync.hotels.insert_one({"id": "TEST-1", "name": "Edited by admin", "is_active": False})
+            ops = seed_upserts(
+                [{"id": "TEST-1", "name": "Seed 1"}, {"id": "TEST-2", "name": "Seed 2"}, {"id": "TEST-3", "name": "Seed 3"}],
+                exclude=["TEST-3"], defaults={"is_active": True},
+            )
+            await db.hotels.bulk_write(ops, ordered=False)
+            return {d["id"]: d for d in db.sync.hotels.find({}, {"_id": 0})}
+
+        hotels = asyncio.run(scenario())
+        assert set(hotels) == {"TEST-1", "TEST-2"}
+        assert hotels["TEST-1"] == {"id": "TEST-1", "name": "Edited by admin", "is_active": False}
+        assert hotels["TEST-2"] == {"id": "TEST-2", "name": "Seed 2", "is_active": True}
+        print("PASS: seed inserted TEST-2 only")
@@ -0,0 +1,248 @@
+"""
+Tests for background newsletter jobs (bulk send and CSV import):
+- send-bulk, import-csv and their progress endpoints require an admin session
+- (in-process) a job sends every recipient once and records provider rejections
+- (in-process) a job abandoned by a crashed process is resumed once its lease
+  expires, sending only the still-pending recipients
+- (in-process) a process whose lease was taken over stops sending, also
+  between retries of a failing batch, and never counts a batch twice
+- subscribing is case-insensitive on the email
+- (in-process) the dedupe migration folds case-variant subscriptions
+"""
+import asyncio
+import requests
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from async_mongomock import AsyncDatabase
+from services.newsletter import NewsletterDispatcher
+from services.subscriber_import import dedupe_emails
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestNewsletterJobsAuth:
+    """Every bulk email endpoint is admin only"""
+
+    def test_send_bulk_requires_auth(self):
+        response = requests.post(f"{BASE_URL}/api/newsletter/send-bulk", params={"subject": "TEST", "message": "TEST"})
+        assert response.status_code == 401
+        print("PASS: send-bulk requires auth")
+
+    def test_jobs_list_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/newsletter/jobs")
+        assert response.status_code == 401
+        print("PASS: jobs list requires auth")
+
+    def test_job_progress_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/newsletter/jobs/does-not-exist")
+        assert response.status_code == 401
+        print("PASS: job progress requires auth")
+
+    def test_job_resume_requires_auth(self):
+        response = requests.post(f"{BASE_URL}/api/newsletter/jobs/does-not-exist/resume")
+        assert response.status_code == 401
+        print("PASS: job resume requires auth")
+
+
+    def test_import_csv_requires_auth(self):
+        files = {"file": ("subscribers.csv", b"email,name\ntest@example.com,TEST\n", "text/csv")}
+        response = requests.post(f"{BASE_URL}/api/newsletter/import-csv", files=files)
+        assert response.status_code == 401
+        print("PASS: import-csv requires auth")
+
+    def test_import_progress_requires_auth(self):
+        response = requests.get(f"{BASE_URL}/api/newsletter/import-csv/does-not-exist")
+        assert response.status_code == 401
+        print("PASS: import progress requires auth")
+
+
+class TestSubscriberEmails:
+    """One subscription per address, whatever its case"""
+
+    def test_subscribe_is_case_insensitive(self):
+        address = f"TEST_Case_{uuid.uuid4().hex[:8]}@Example.com"
+        payload = {"email": address, "name": "TEST Case", "country": "Spain"}
+        first = requests.post(f"{BASE_URL}/api/newsletter", json=payload)
+        assert first.status_code == 200
+        assert first.json()["email"] == address.lower()
+        second = requests.post(f"{BASE_URL}/api/newsletter", json={**payload, "email": address.lower()})
+        assert second.status_code == 400
+        print("PASS: mixed-case address stored lower-cased, lower-case repeat rejected")
+
+    def test_dedupe_keeps_one_active_subscription(self):
+        async def scenario():
+            db = AsyncDatabase()
+            db.sync.newsletter_subscriptions.insert_many([
+                {"id": "a", "email": "Foo@Example.com", "is_active": False, "subscribed_at": "2026-01-01"},
+                {"id": "b", "email": "foo@example.com ", "is_active": True, "subscribed_at": "2026-02-01"},
+                {"id": "c", "email": "FOO@example.com", "is_active": True, "subscribed_at": "2026-03-01"},
+                {"id": "d", "email": "Bar@Example.com", "is_active": True, "subscribed_at": "2026-01-01"},
+            ])
+            result = await dedupe_emails(db)
+            return result, list(db.sync.newsletter_subscriptions.find({}, {"_id": 0, "id": 1, "email": 1}))
+
+        result, subscriptions = asyncio.run(scenario())
+        assert result == {"removed": 2, "normalized": 2}
+        assert sorted((s["id"], s["email"]) for s in subscriptions) == [
+            ("b", "foo@example.com"), ("d", "bar@example.com"),
+        ]
+        print("PASS: 4 subscriptions folded into 2 lower-cased ones")
+
+
+# ─── In-process: NewsletterDispatcher against mongomock ──────────────────────
+
+class FakeProvider:
+    """Records batch calls; rejects the addresses in `reject`"""
+
+    def __init__(self, reject=()):
+        self.reject = set(reject)
+        self.sent = []
+        self.on_call = None
+
+    def __call__(self, params, idempotency_key):
+        if self.on_call:
+            self.on_call()
+        self.sent += [p["to"][0] for p in params]
+        errors = [{"index": i, "message": "rejected"} for i, p in enumerate(params) if p["to"][0] in self.reject]
+        return {"data": [], "errors": errors}
+
+
+def make_dispatcher(provider, db=None):
+    return NewsletterDispatcher(db or AsyncDatabase(), provider, batch_size=3, rate=1000, workers=2)
+
+
+async def wait_for_jobs(dispatcher):
+    await asyncio.gather(*dispatcher._tasks.values())
+
+
+def add_subscribers(db, count):
+    db.sync.newsletter_subscriptions.insert_many(
+        [{"email": f"test{i}@example.com", "is_active": True} for i in range(count)]
+    )
+
+
+def abandoned_job(db, job_id, *, lease_until, sent_seqs=(), total=5):
+    """A running job left by a process that died after sending `sent_seqs`"""
+    db.sync.newsletter_jobs.insert_one({
+        "id": job_id, "subject": "TEST", "html": "<p>TEST</p>", "from": "test@example.com",
+        "status": "running", "total": total, "sent": len(sent_seqs), "failed": 0,
+        "started_at": "2026-01-01T00:00:00+00:00", "finished_at": None,
+        "lease_owner": "dead-process", "lease_until": lease_until.isoformat(),
+    })
+    db.sync.newsletter_deliveries.insert_many([
+        {"job_id": job_id, "seq": i, "email": f"test{i}@example.com",
+         "status": "sent" if i in sent_seqs else "pending", "attempts": 0}
+        for i in range(total)
+    ])
+
+
+class TestNewsletterDispatcher:
+    """Job progress, crash recovery and lease ownership"""
+
+    def test_job_sends_everyone_and_records_rejections(self):
+        async def scenario():
+            db = AsyncDatabase()
+            add_subscribers(db, 7)
+            provider = FakeProvider(reject={"test4@example.com"})
+            dispatcher = make_dispatcher(provider, db)
+            job = await dispatcher.create_job(subject="TEST", html="<p>TEST</p>", sender="test@example.com")
+            await wait_for_jobs(dispatcher)
+            return provider, await dispatcher.progress(job["id"])
+
+        provider, progress = asyncio.run(scenario())
+        assert sorted(provider.sent) == sorted(f"test{i}@example.com" for i in range(7))
+        assert progress["status"] == "completed"
+        assert (progress["sent"], progress["failed"], progress["pending"]) == (6, 1, 0)
+        print("PASS: job completed with 6 sent, 1 rejected")
+
+    def test_expired_lease_is_resumed_with_pending_recipients_only(self):
+        async def scenario():
+            db = AsyncDatabase()
+            abandoned_job(db, "TEST-job", lease_until=datetime.now(timezone.utc) - timedelta(seconds=1),
+                          sent_seqs={0, 1})
+            provider = FakeProvider()
+            dispatcher = make_dispatcher(provider, db)
+            started = await dispatcher.resume()
+            await wait_for_jobs(dispatcher)
+            return started, provider, await dispatcher.progress("TEST-job")
+
+        started, provider, progress = asyncio.run(scenario())
+        assert started == 1
+        assert sorted(provider.sent) == ["test2@example.com", "test3@example.com", "test4@example.com"]
+        assert progress["status"] == "completed" and progress["sent"] == 5
+        print("PASS: abandoned job resumed, only pending recipients sent")
+
+    def test_live_lease_is_left_alone(self):
+        async def scenario():
+            db = AsyncDatabase()
+            abandoned_job(db, "TEST-job", lease_until=datetime.now(timezone.utc) + timedelta(seconds=60))
+            provider = FakeProvider()
+            dispatcher = make_dispatcher(provider, db)
+            return await dispatcher.resume(), provider
+
+        started, provider = asyncio.run(scenario())
+        assert started == 0 and provider.sent == []
+        print("PASS: job with a live lease is not taken over")
+
+    def test_taken_over_job_stops_sending(self):
+        async def scenario():
+            db = AsyncDatabase()
+            add_subscribers(db, 9)
+            provider = FakeProvider()
+
+            def take_over():
+                db.sync.newsletter_jobs.update_many({}, {"$set": {"lease_owner": "other-process"}})
+
+            provider.on_call = take_over
+            dispatcher = NewsletterDispatcher(db, provider, batch_size=3, rate=1000, workers=1)
+            job = await dispatcher.create_job(subject="TEST", html="<p>TEST</p>", sender="test@example.com")
+            await wait_for_jobs(dispatcher)
+            return provider, db.sync.newsletter_jobs.find_one({"id": job["id"]})
+
+        provider, job = asyncio.run(scenario())
+        assert len(provider.sent) == 3
+        assert job["status"] == "running" and job["lease_owner"] == "other-process"
+        print("PASS: the process that lost its lease stopped after one batch")
+
+    def test_lease_lost_during_retries_stops_before_resending(self):
+        async def scenario():
+            db = AsyncDatabase()
+            add_subscribers(db, 3)
+            calls = []
+
+            def failing_provider(params, idempotency_key):
+                calls.append([p["to"][0] for p in params])
+                # While we back off, another process takes over and sends the batch
+                db.sync.newsletter_jobs.update_many({}, {"$set": {"lease_owner": "other-process"}, "$inc": {"sent": 3}})
+                db.sync.newsletter_deliveries.update_many({}, {"$set": {"status": "sent"}})
+                raise RuntimeError("provider timeout")
+
+            dispatcher = NewsletterDispatcher(db, failing_provider, batch_size=3, rate=1000, workers=1)
+            job = await dispatcher.create_job(subject="TEST", html="<p>TEST</p>", sender="test@example.com")
+            await wait_for_jobs(dispatcher)
+            return calls, await dispatcher.progress(job["id"])
+
+        calls, progress = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert (progress["sent"], progress["failed"], progress["pending"]) == (3, 0, 0)
+        print("PASS: no retry after the lease was lost, counters not doubled")
+
+    def test_rows_recorded_elsewhere_are_not_counted_again(self):
+        async def scenario():
+            db = AsyncDatabase()
+            add_subscribers(db, 3)
+            provider = FakeProvider(reject={"test2@example.com"})
+            # A stale run already recorded these rows; we still own the lease
+            provider.on_call = lambda: db.sync.newsletter_deliveries.update_many(
+                {"seq": {"$in": [0, 2]}}, {"$set": {"status": "sent"}}
+            )
+            dispatcher = make_dispatcher(provider, db)
+            job = await dispatcher.create_job(subject="TEST", html="<p>TEST</p>", sender="test@example.com")
+            await wait_for_jobs(dispatcher)
+            return db.sync.newsletter_jobs.find_one({"id": job["id"]})
+
+        job = asyncio.run(scenario())
+        assert (job["sent"], job["failed"]) == (1, 0)
+        print("PASS: only deliveries that left pending were counted")
@@ -0,0 +1,44 @@
+"""
+Tests for the incrementally maintained review statistics:
+- /api/reviews/stats is consistent (histogram and country counts add up)
+- a submitted review is counted immediately
+- the rebuild endpoint requires an admin session
+"""
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestReviewStats:
+    """Stats document read"""
+
+    def test_stats_are_consistent(self):
+        response = requests.get(f"{BASE_URL}/api/reviews/stats")
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total_reviews"] > 0
+        assert sum(stats["rating_distribution"].values()) == stats["total_reviews"]
+        assert sorted(stats["rating_distribution"]) == ["1", "2", "3", "4", "5"]
+        assert 1 <= stats["average_rating"] <= 5
+        print(f"PASS: {stats['total_reviews']} reviews, average {stats['average_rating']}")
+
+    def test_created_review_is_counted(self):
+        before = requests.get(f"{BASE_URL}/api/reviews/stats").json()
+        response = requests.post(f"{BASE_URL}/api/reviews", json={
+            "user_name": "TEST_Stats",
+            "country": "TEST_Country",
+            "rating": 4,
+            "review_text": "Counted without a rescan",
+        })
+        assert response.status_code == 200
+        after = requests.get(f"{BASE_URL}/api/reviews/stats").json()
+        assert after["total_reviews"] == before["total_reviews"] + 1
+        assert after["rating_distribution"]["4"] == before["rating_distribution"]["4"] + 1
+        assert after["by_country"]["TEST_Country"] == before["by_country"].get("TEST_Country", 0) + 1
+        print("PASS: new review counted")
+
+    def test_rebuild_requires_auth(self):
+        response = requests.post(f"{BASE_URL}/api/admin/reviews/stats/rebuild")
+        assert response.status_code == 401
+        print("PASS: rebuild requires auth")
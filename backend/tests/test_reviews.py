@@ -0,0 +1,73 @@
+"""
+Tests for /api/reviews:
+- plain listing is a list in id order, filters are case-insensitive
+- limit alone truncates the plain list (as before pagination existed)
+- limit is bounded to 1..MAX_PAGE_SIZE
+- limit/cursor pages walk the filtered stream without gaps or repeats
+- submitted (unmoderated) reviews get unique ids and stay out of the stream
+"""
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestReviewListing:
+    """Merged, indexed review stream"""
+
+    def test_list_in_id_order(self):
+        response = requests.get(f"{BASE_URL}/api/reviews")
+        assert response.status_code == 200
+        reviews = response.json()
+        ids = [r["id"] for r in reviews]
+        assert ids == sorted(ids) and len(set(ids)) == len(ids)
+        assert not any("user_email" in r for r in reviews)
+        print(f"PASS: {len(reviews)} reviews in id order")
+
+    def test_filters_case_insensitive(self):
+        upper = requests.get(f"{BASE_URL}/api/reviews", params={"country": "UK", "platform": "Trustpilot"}).json()
+        lower = requests.get(f"{BASE_URL}/api/reviews", params={"country": "uk", "platform": "trustpilot"}).json()
+        assert upper and upper == lower
+        assert all(r["country"] == "UK" and r["platform"] == "Trustpilot" for r in upper)
+        print(f"PASS: {len(upper)} UK/Trustpilot reviews")
+
+    def test_keyset_pages(self):
+        expected = requests.get(f"{BASE_URL}/api/reviews", params={"country": "Germany"}).json()
+        seen, cursor = [], ""
+        while True:
+            # An empty cursor requests the first page
+            params = {"country": "Germany", "limit": 5, "cursor": cursor}
+            page = requests.get(f"{BASE_URL}/api/reviews", params=params).json()
+            seen += page["items"]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert [r["id"] for r in seen] == [r["id"] for r in expected]
+        print(f"PASS: {len(seen)} German reviews over pages of 5")
+
+    def test_limit_alone_returns_a_list(self):
+        full = requests.get(f"{BASE_URL}/api/reviews").json()
+        response = requests.get(f"{BASE_URL}/api/reviews", params={"limit": 3})
+        assert response.status_code == 200
+        assert response.json() == full[:3]
+        print("PASS: limit alone returns the first 3 reviews as a list")
+
+    def test_limit_out_of_range(self):
+        for limit in (0, 101):
+            response = requests.get(f"{BASE_URL}/api/reviews", params={"limit": limit})
+            assert response.status_code == 422
+        print("PASS: limit outside 1..100 rejected")
+
+    def test_invalid_cursor(self):
+        response = requests.get(f"{BASE_URL}/api/reviews", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+        print("PASS: invalid cursor rejected")
+
+    def test_submitted_reviews_get_unique_ids_and_stay_private(self):
+        payload = {"user_name": "TEST_Ids", "country": "TEST_Ids", "rating": 5, "review_text": "Unique id"}
+        first = requests.post(f"{BASE_URL}/api/reviews", json=payload).json()["id"]
+        second = requests.post(f"{BASE_URL}/api/reviews", json=payload).json()["id"]
+        assert second > first
+        listed = requests.get(f"{BASE_URL}/api/reviews", params={"country": "TEST_Ids"}).json()
+        assert not {first, second} & {r["id"] for r in listed}
+        print(f"PASS: ids {first} < {second}, neither published")
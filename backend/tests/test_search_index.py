@@ -0,0 +1,75 @@
+"""
+Tests for the indexed /api/search engine:
+- Substring matches across name, location and multilingual descriptions
+- Typo-tolerant matches on name/location words
+- Category filter restricts results to one partner type
+- (in-process) the fuzzy memo is bounded
+"""
+import requests
+import os
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestSearchIndex:
+    """Search results served from the in-memory index"""
+
+    def test_exact_name_match(self):
+        """Searching 'alcanada' returns Golf Alcanada"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "alcanada"})
+        assert response.status_code == 200
+        ids = [r["id"] for r in response.json()["results"]]
+        assert "golf-alcanada" in ids
+        print("PASS: Exact match found")
+
+    def test_typo_match(self):
+        """A one-letter typo ('alcanda') still finds Golf Alcanada"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "alcanda"})
+        assert response.status_code == 200
+        ids = [r["id"] for r in response.json()["results"]]
+        assert "golf-alcanada" in ids
+        print("PASS: Fuzzy match found")
+
+    def test_german_description_match(self):
+        """Words only present in the German description are searchable"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "leuchtturm", "category": "golf"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] >= 1
+        print(f"PASS: German description search returned {data['count']} results")
+
+    def test_category_filter(self):
+        """category=hotel returns only hotels (plus matching landing pages)"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "palma", "category": "hotel"})
+        assert response.status_code == 200
+        types = {r["type"] for r in response.json()["results"]}
+        assert types <= {"hotel", "page"}
+        print("PASS: Category filter applied")
+
+    def test_no_match_returns_empty(self):
+        """Nonsense query returns no partner results"""
+        response = requests.get(f"{BASE_URL}/api/search", params={"q": "zzqqxxyy"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 0
+        assert data["results"] == []
+        print("PASS: No results for nonsense query")
+
+
+class TestFuzzyMemo:
+    """(in-process) the per-segment fuzzy memo is a bounded LRU"""
+
+    def test_memo_is_bounded(self, monkeypatch):
+        from services import search_index
+        monkeypatch.setattr(search_index, "FUZZY_MEMO_SIZE", 3)
+        segment = search_index._Segment([
+            {"id": "golf-alcanada", "name": "Golf Alcanada", "location": "Alcudia", "is_active": True},
+        ])
+        for word in ("alcanda", "alcuda", "aaaa", "bbbb"):
+            segment.fuzzy_matches(word)
+        assert list(segment._fuzzy_memo) == ["alcuda", "aaaa", "bbbb"]
+        # A hit is refreshed, so the next insert evicts the oldest other word
+        assert segment.fuzzy_matches("alcuda") == {0}
+        segment.fuzzy_matches("cccc")
+        assert list(segment._fuzzy_memo) == ["bbbb", "alcuda", "cccc"]
+        print("PASS: fuzzy memo keeps the 3 most recent words")
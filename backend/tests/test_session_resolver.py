@@ -0,0 +1,61 @@
+"""
+Tests for the shared session resolver behind get_current_user and /reviews/submit:
+- Unknown tokens are rejected the same way via cookie and Bearer header
+- Review submission keeps its specific 401 messages
+- Logout succeeds with or without a session
+"""
+import pytest
+import requests
+import os
+import uuid
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+@pytest.fixture
+def bogus_token():
+    return f"session_test_{uuid.uuid4().hex}"
+
+
+class TestSessionResolver:
+    """Token lookup through resolve_session"""
+
+    def test_me_without_token(self):
+        response = requests.get(f"{BASE_URL}/api/auth/me")
+        assert response.status_code == 401
+        print("PASS: /auth/me requires a session")
+
+    def test_me_with_unknown_bearer_token(self, bogus_token):
+        response = requests.get(f"{BASE_URL}/api/auth/me", headers={"Authorization": f"Bearer {bogus_token}"})
+        assert response.status_code == 401
+        print("PASS: Unknown Bearer token rejected")
+
+    def test_me_with_unknown_cookie(self, bogus_token):
+        response = requests.get(f"{BASE_URL}/api/auth/me", cookies={"session_token": bogus_token})
+        assert response.status_code == 401
+        print("PASS: Unknown session cookie rejected")
+
+    def test_review_submit_without_token(self):
+        payload = {"rating": 5, "review_text": "TEST review", "platform": "website"}
+        response = requests.post(f"{BASE_URL}/api/reviews/submit", json=payload)
+        assert response.status_code == 401
+        assert "Authentication required" in response.json()["detail"]
+        print("PASS: Review submit requires a session")
+
+    def test_review_submit_unknown_session(self, bogus_token):
+        payload = {"rating": 5, "review_text": "TEST review", "platform": "website"}
+        response = requests.post(
+            f"{BASE_URL}/api/reviews/submit",
+            json=payload,
+            headers={"Authorization": f"Bearer {bogus_token}"},
+        )
+        assert response.status_code == 401
+        assert "Session not found" in response.json()["detail"]
+        print("PASS: Unknown session keeps its specific message")
+
+    def test_logout_then_me(self, bogus_token):
+        response = requests.post(f"{BASE_URL}/api/auth/logout", cookies={"session_token": bogus_token})
+        assert response.status_code == 200
+        response = requests.get(f"{BASE_URL}/api/auth/me", cookies={"session_token": bogus_token})
+        assert response.status_code == 401
+        print("PASS: Logged-out token is not accepted")
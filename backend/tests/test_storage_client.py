@@ -0,0 +1,201 @@
+"""
+Tests for the async object-storage client against a local stand-in server:
+- put/get round trip, streamed upload, range reads and streamed download
+- missing objects raise ObjectNotFound
+- an expired storage key is refreshed and the request retried once
+- requests reuse pooled keep-alive connections
+
+Run from backend/: python -m pytest tests/test_storage_client.py
+"""
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from services.storage import ObjectNotFound, StorageClient
+
+
+class StandInStorage(BaseHTTPRequestHandler):
+    """Minimal in-memory imitation of the storage API (/init, /objects/<path>)"""
+    protocol_version = "HTTP/1.1"
+    objects = {}
+    keys = {"current": "key-1"}
+    init_calls = []
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        StandInStorage.connections.add(self.client_address)
+        if self.headers.get("X-Storage-Key") != StandInStorage.keys["current"]:
+            self._send(403, b'{"detail": "bad key"}', {"Content-Type": "application/json"})
+            return False
+        return True
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while (size := int(self.rfile.readline().strip(), 16)):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+            return body
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):
+        self._read_body()
+        StandInStorage.init_calls.append(self.path)
+        body = b'{"storage_key": "%s"}' % StandInStorage.keys["current"].encode()
+        self._send(200, body, {"Content-Type": "application/json"})
+
+    def do_PUT(self):
+        body = self._read_body()
+        if not self._authorized():
+            return
+        path = self.path.split("/objects/", 1)[1]
+        StandInStorage.objects[path] = (body, self.headers.get("Content-Type"))
+        self._send(200, b'{"path": "%s", "size": %d}' % (path.encode(), len(body)), {"Content-Type": "application/json"})
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        path = self.path.split("/objects/", 1)[1]
+        if path not in StandInStorage.objects:
+            self._send(404, b'{"detail": "not found"}', {"Content-Type": "application/json"})
+            return
+        data, content_type = StandInStorage.objects[path]
+        requested = self.headers.get("Range")
+        if requested:
+            start, _, end = requested.split("=", 1)[1].partition("-")
+            start, end = int(start), int(end) if end else len(data) - 1
+            self._send(206, data[start:end + 1], {
+                "Content-Type": content_type,
+                "Content-Range": f"bytes {start}-{end}/{len(data)}",
+            })
+            return
+        self._send(200, data, {"Content-Type": content_type})
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInStorage)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/v1/storage"
+    server.shutdown()
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestStorageClient:
+    """StorageClient against the stand-in server"""
+
+    def test_put_get_round_trip(self, stand_in):
+        async def scenario():
+            storage = StorageClient(stand_in, "TEST_key")
+            try:
+                result = await storage.put("app/a.jpg", b"\xff\xd8jpeg-bytes", "image/jpeg")
+                data, content_type = await storage.get("app/a.jpg")
+                return result, data, content_type
+            finally:
+                await storage.aclose()
+
+        result, data, content_type = run(scenario())
+        assert result["path"] == "app/a.jpg"
+        assert data == b"\xff\xd8jpeg-bytes"
+        assert content_type == "image/jpeg"
+        print("PASS: put/get round trip")
+
+    def test_streamed_upload(self, stand_in):
+        async def chunks():
+            for i in range(5):
+                yield bytes([i]) * 1000
+
+        async def scenario():
+            storage = StorageClient(stand_in, "TEST_key")
+            try:
+                await storage.put("app/streamed.png", chunks(), "image/png", length=5000)
+                return await storage.get("app/streamed.png")
+            finally:
+                await storage.aclose()
+
+        data, content_type = run(scenario())
+        assert len(data) == 5000 and data[:1000] == b"\x00" * 1000 and data[-1000:] == b"\x04" * 1000
+        assert content_type == "image/png"
+        print("PASS: streamed upload")
+
+    def test_range_read_and_streamed_download(self, stand_in):
+        async def scenario():
+            storage = StorageClient(stand_in, "TEST_key")
+            try:
+                await storage.put("app/range.bin", bytes(range(256)), "application/octet-stream")
+                part, _, content_range = await storage.get_range("app/range.bin", 10, 19)
+                received = b""
+                async with storage.stream("app/range.bin") as response:
+                    async for chunk in response.aiter_bytes():
+                        received += chunk
+                return part, content_range, received
+            finally:
+                await storage.aclose()
+
+        part, content_range, received = run(scenario())
+        assert part == bytes(range(10, 20))
+        assert content_range == "bytes 10-19/256"
+        assert received == bytes(range(256))
+        print("PASS: range read and streamed download")
+
+    def test_missing_object(self, stand_in):
+        async def scenario():
+            storage = StorageClient(stand_in, "TEST_key")
+            try:
+                await storage.get("app/missing.jpg")
+            finally:
+                await storage.aclose()
+
+        with pytest.raises(ObjectNotFound):
+            run(scenario())
+        print("PASS: missing object raises ObjectNotFound")
+
+    def test_expired_key_is_refreshed(self, stand_in):
+        async def scenario():
+            storage = StorageClient(stand_in, "TEST_key")
+            try:
+                await storage.put("app/key.jpg", b"jpeg", "image/jpeg")
+                StandInStorage.keys["current"] = "key-2"
+                data, _ = await storage.get("app/key.jpg")
+                return data
+            finally:
+                StandInStorage.keys["current"] = "key-1"
+                await storage.aclose()
+
+        StandInStorage.init_calls.clear()
+        assert run(scenario()) == b"jpeg"
+        assert len(StandInStorage.init_calls) == 2
+        print("PASS: expired storage key refreshed")
+
+    def test_connections_are_reused(self, stand_in):
+        async def scenario():
+            storage = StorageClient(stand_in, "TEST_key", max_connections=2)
+            try:
+                await storage.put("app/pool.jpg", b"jpeg", "image/jpeg")
+                for _ in range(20):
+                    await storage.get("app/pool.jpg")
+            finally:
+                await storage.aclose()
+
+        StandInStorage.connections.clear()
+        run(scenario())
+        assert len(StandInStorage.connections) == 1
+        print("PASS: sequential requests share one keep-alive connection")
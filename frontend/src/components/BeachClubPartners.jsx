@@ -34,9 +34,11 @@ const BeachClubCard = ({ club, language, t, onQuickView }) => {
         <div className="h-56 overflow-hidden rounded-t-2xl relative m-3 mb-0">
           <img loading="lazy"
             src={club.image}
+            srcSet={club.image_srcset || undefined}
+            sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
             alt={club.name}
             className="w-full h-full object-cover object-center transition-transform duration-500 rounded-xl"
-            onError={(e) => { e.target.onerror = null; e.target.src = 'https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=800&h=600&fit=crop'; }}
+            onError={(e) => { e.target.onerror = null; e.target.srcset = ''; e.target.src = 'https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=800&h=600&fit=crop'; }}
           />
           {/* Beach Club Icon Overlay */}
           <div className="absolute bottom-3 left-3 bg-white/90 backdrop-blur-sm px-2 py-1 rounded-full flex items-center gap-1.5">
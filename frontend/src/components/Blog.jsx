@@ -14,7 +14,7 @@ export const Blog = () => {
   useEffect(() => {
     const fetchPosts = async () => {
       try {
-        const response = await axios.get(BACKEND_URL + '/api/blog');
+        const response = await axios.get(BACKEND_URL + '/api/blog', { params: { lang: language } });
         setPosts(response.data);
       } catch (error) {
         console.error('Error fetching blog posts:', error);
@@ -23,7 +23,7 @@ export const Blog = () => {
       }
     };
     fetchPosts();
-  }, []);
+  }, [language]);
 
   const formatDate = (dateStr) => {
     const date = new Date(dateStr);
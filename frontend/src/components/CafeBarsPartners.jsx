@@ -34,9 +34,11 @@ const CafeBarCard = ({ place, language, t, onQuickView, onBooking }) => {
         <div className="h-56 overflow-hidden rounded-t-2xl relative m-3 mb-0">
           <img loading="lazy"
             src={place.image}
+            srcSet={place.image_srcset || undefined}
+            sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
             alt={place.name}
             className="w-full h-full object-cover object-center transition-transform duration-500 rounded-xl"
-            onError={(e) => { e.target.onerror = null; e.target.src = 'https://images.unsplash.com/photo-1554118811-1e0d58224f24?w=800&h=600&fit=crop'; }}
+            onError={(e) => { e.target.onerror = null; e.target.srcset = ''; e.target.src = 'https://images.unsplash.com/photo-1554118811-1e0d58224f24?w=800&h=600&fit=crop'; }}
           />
           {/* Category Icon Overlay */}
           <div className="absolute bottom-3 left-3 bg-white/90 backdrop-blur-sm px-2 py-1 rounded-full flex items-center gap-1.5">
@@ -85,7 +85,8 @@ const ImageUploadField = ({ value, onChange }) => {
       formData.append('file', file);
       
       const response = await axios.post(`${BACKEND_URL}/api/admin/upload-image`, formData, {
-        headers: { 'Content-Type': 'multipart/form-data' }
+        headers: { 'Content-Type': 'multipart/form-data' },
+        withCredentials: true,
       });
       
       // Prepend BACKEND_URL if the returned URL is relative
@@ -95,7 +95,7 @@ export const FloatingSearch = forwardRef(({ showButton = true }, ref) => {
     setLoading(true);
     try {
       const response = await axios.get(`${BACKEND_URL}/api/search`, {
-        params: { q: query, category: category }
+        params: { q: query, category: category, lang: language }
       });
       setResults(response.data.results || []);
       setHasSearched(true);
@@ -21,11 +21,13 @@ export const CourseCard = ({ course, language, t, onQuickView }) => (
         <div className="aspect-[4/3] overflow-hidden rounded-t-2xl relative m-3 mb-0">
           <img
             src={course.image}
+            srcSet={course.image_srcset || undefined}
+            sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
             alt={course.name}
             loading="lazy"
             decoding="async"
             className="w-full h-full object-cover object-center transition-transform duration-500 rounded-xl"
-            onError={(e) => { e.target.onerror = null; e.target.src = 'https://images.unsplash.com/photo-1535131749006-b7f58c99034b?w=800&h=600&fit=crop'; }}
+            onError={(e) => { e.target.onerror = null; e.target.srcset = ''; e.target.src = 'https://images.unsplash.com/photo-1535131749006-b7f58c99034b?w=800&h=600&fit=crop'; }}
           />
           {/* Price Badge */}
           {course.price_from && (
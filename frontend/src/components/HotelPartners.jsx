@@ -44,9 +44,11 @@ const HotelCard = ({ hotel, language, t, onQuickView, onBooking }) => {
           <div className="h-56 overflow-hidden rounded-t-2xl relative m-3 mb-0">
             <img loading="lazy" decoding="async"
               src={hotel.image}
+              srcSet={hotel.image_srcset || undefined}
+              sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
               alt={hotel.name}
               className="w-full h-full object-cover object-center transition-transform duration-500 rounded-xl"
-              onError={(e) => { e.target.onerror = null; e.target.src = 'https://images.unsplash.com/photo-1566073771259-6a8506099945?w=800&h=600&fit=crop'; }}
+              onError={(e) => { e.target.onerror = null; e.target.srcset = ''; e.target.src = 'https://images.unsplash.com/photo-1566073771259-6a8506099945?w=800&h=600&fit=crop'; }}
             />
             {/* Quick View Button - only when active */}
             {!inactive && (
@@ -34,9 +34,11 @@ const RestaurantCard = ({ restaurant, language, t, onQuickView, onBooking }) =>
         <div className="h-56 overflow-hidden rounded-t-2xl relative m-3 mb-0">
           <img loading="lazy"
             src={restaurant.image}
+            srcSet={restaurant.image_srcset || undefined}
+            sizes="(min-width: 1024px) 33vw, (min-width: 640px) 50vw, 100vw"
             alt={restaurant.name}
             className="w-full h-full object-cover object-center transition-transform duration-500 rounded-xl"
-            onError={(e) => { e.target.onerror = null; e.target.src = 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?w=800&h=600&fit=crop'; }}
+            onError={(e) => { e.target.onerror = null; e.target.srcset = ''; e.target.src = 'https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?w=800&h=600&fit=crop'; }}
           />
           {/* Quick View Button */}
           {!inactive && (
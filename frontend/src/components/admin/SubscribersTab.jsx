@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { Mail, Search, Download, Trash2, Plus, Upload, Send, X } from 'lucide-react';
 import axios from 'axios';
 
@@ -14,6 +14,10 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
   const [bulkEmail, setBulkEmail] = useState({ subject: '', message: '' });
   const [sendingBulk, setSendingBulk] = useState(false);
   const [bulkResult, setBulkResult] = useState(null);
+  const bulkJobRef = useRef(null);
+
+  // Stop polling bulk email progress when the tab unmounts
+  useEffect(() => () => { bulkJobRef.current = null; }, []);
 
   const filteredSubscribers = subscribers.filter(sub => {
     const term = searchTerm.toLowerCase();
@@ -48,11 +52,17 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
     const formData = new FormData();
     formData.append('file', file);
     try {
-      const res = await axios.post(`${BACKEND_URL}/api/newsletter/import-csv`, formData, {
+      let res = await axios.post(`${BACKEND_URL}/api/newsletter/import-csv`, formData, {
         withCredentials: true,
         headers: { 'Content-Type': 'multipart/form-data' }
       });
-      setImportResult(res.data);
+      // The import runs in the background; poll until it finishes
+      while (res.data.status === 'running') {
+        setImportResult(res.data);
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        res = await axios.get(`${BACKEND_URL}/api/newsletter/import-csv/${res.data.id}`, { withCredentials: true });
+      }
+      setImportResult(res.data.status === 'failed' ? { success: false, error: res.data.error || 'Import failed' } : res.data);
       const subscribersRes = await axios.get(`${BACKEND_URL}/api/newsletter`, { withCredentials: true });
       setSubscribers(subscribersRes.data);
     } catch (error) {
@@ -62,6 +72,16 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
     }
   };
 
+  const pollBulkJob = async (jobId) => {
+    while (bulkJobRef.current === jobId) {
+      await new Promise(resolve => setTimeout(resolve, 2000));
+      if (bulkJobRef.current !== jobId) return;
+      const res = await axios.get(`${BACKEND_URL}/api/newsletter/jobs/${jobId}`, { withCredentials: true });
+      setBulkResult({ success: true, ...res.data });
+      if (res.data.status === 'completed') return;
+    }
+  };
+
   const handleSendBulkEmail = async (e) => {
     e.preventDefault();
     setSendingBulk(true);
@@ -72,7 +92,10 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
         {},
         { withCredentials: true }
       );
-      setBulkResult(res.data);
+      // The send runs in the background; follow its progress
+      bulkJobRef.current = res.data.job_id;
+      setBulkResult({ success: true, status: res.data.status, total: res.data.total_subscribers, sent: 0, failed: 0 });
+      await pollBulkJob(res.data.job_id);
     } catch (error) {
       setBulkResult({ success: false, error: error.response?.data?.detail || 'Failed to send emails' });
     } finally {
@@ -80,6 +103,12 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
     }
   };
 
+  const closeBulkEmailModal = () => {
+    bulkJobRef.current = null;
+    setShowBulkEmailModal(false);
+    setBulkResult(null);
+  };
+
   return (
     <div>
       <div className="flex flex-col sm:flex-row justify-between items-start sm:items-center gap-4 mb-6">
@@ -205,14 +234,23 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
                 {importing && (
                   <div className="mt-4 flex items-center justify-center gap-2 text-stone-500">
                     <div className="w-4 h-4 border-2 border-stone-400 border-t-transparent rounded-full animate-spin"></div>
-                    Importing...
+                    Importing...{importResult?.rows ? ` ${importResult.rows} rows` : ''}
                   </div>
                 )}
               </div>
-              {importResult && (
+              {importResult && !importing && (
                 <div className={`p-4 rounded-lg ${importResult.success ? 'bg-green-50 text-green-800' : 'bg-red-50 text-red-800'}`}>
                   {importResult.success ? (
-                    <><p className="font-medium">Import Complete!</p><p className="text-sm mt-1">{importResult.imported} imported, {importResult.skipped} skipped</p></>
+                    <>
+                      <p className="font-medium">Import Complete!</p>
+                      <p className="text-sm mt-1">{importResult.imported} imported, {importResult.skipped} skipped</p>
+                      {importResult.errors?.length > 0 && (
+                        <ul className="text-xs mt-2 max-h-24 overflow-y-auto list-disc pl-4">
+                          {importResult.errors.slice(0, 10).map((err) => <li key={err}>{err}</li>)}
+                          {importResult.error_count > 10 && <li>...and {importResult.error_count - 10} more</li>}
+                        </ul>
+                      )}
+                    </>
                   ) : (
                     <p>{importResult.error}</p>
                   )}
@@ -232,7 +270,7 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
           <div className="bg-white rounded-xl shadow-xl max-w-lg w-full p-6">
             <div className="flex items-center justify-between mb-4">
               <h3 className="text-lg font-bold text-stone-900">Send Bulk Email</h3>
-              <button onClick={() => { setShowBulkEmailModal(false); setBulkResult(null); }} className="text-stone-400 hover:text-stone-600"><X className="w-5 h-5" /></button>
+              <button onClick={closeBulkEmailModal} className="text-stone-400 hover:text-stone-600"><X className="w-5 h-5" /></button>
             </div>
             <div className="bg-amber-50 border border-amber-200 rounded-lg p-3 mb-4 text-sm text-amber-800">
               <strong>Note:</strong> This will send an email to all {subscribers.length} active subscribers.
@@ -249,14 +287,18 @@ export const SubscribersTab = ({ subscribers, setSubscribers, searchTerm, setSea
               {bulkResult && (
                 <div className={`p-4 rounded-lg ${bulkResult.success ? 'bg-green-50 text-green-800' : 'bg-red-50 text-red-800'}`}>
                   {bulkResult.success ? (
-                    <><p className="font-medium">Emails Sent!</p><p className="text-sm mt-1">{bulkResult.sent} sent successfully, {bulkResult.failed} failed</p></>
+                    bulkResult.status === 'completed' ? (
+                      <><p className="font-medium">Emails Sent!</p><p className="text-sm mt-1">{bulkResult.sent} sent successfully, {bulkResult.failed} failed</p></>
+                    ) : (
+                      <><p className="font-medium">Sending in the background...</p><p className="text-sm mt-1">{bulkResult.sent + bulkResult.failed} of {bulkResult.total} processed ({bulkResult.failed} failed)</p></>
+                    )
                   ) : (
                     <p>{bulkResult.error}</p>
                   )}
                 </div>
               )}
               <div className="flex gap-3 justify-end pt-4">
-                <button type="button" onClick={() => { setShowBulkEmailModal(false); setBulkResult(null); }} className="px-4 py-2 text-stone-700 hover:bg-stone-100 rounded-lg transition-colors font-medium">Cancel</button>
+                <button type="button" onClick={closeBulkEmailModal} className="px-4 py-2 text-stone-700 hover:bg-stone-100 rounded-lg transition-colors font-medium">Cancel</button>
                 <button type="submit" disabled={sendingBulk} className="px-4 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 transition-colors font-medium flex items-center gap-2 disabled:opacity-50">
                   {sendingBulk ? (
                     <><div className="w-4 h-4 border-2 border-white border-t-transparent rounded-full animate-spin"></div>Sending...</>
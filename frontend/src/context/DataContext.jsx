@@ -1,11 +1,13 @@
 import React, { createContext, useContext, useState, useEffect, useMemo, useCallback } from 'react';
 import axios from 'axios';
+import { useLanguage } from './LanguageContext';
 
 const API = process.env.REACT_APP_BACKEND_URL;
 
 const DataContext = createContext(null);
 
 export const DataProvider = ({ children }) => {
+  const { language } = useLanguage();
   const [data, setData] = useState({
     golfCourses: [],
     hotels: [],
@@ -27,7 +29,7 @@ export const DataProvider = ({ children }) => {
     const fetchAllData = async () => {
       try {
         const [partnersRes, settingsRes] = await Promise.all([
-          axios.get(`${API}/api/all-partners`),
+          axios.get(`${API}/api/all-partners`, { params: { lang: language } }),
           axios.get(`${API}/api/display-settings`).catch(() => ({ data: {} }))
         ]);
 
@@ -50,7 +52,7 @@ export const DataProvider = ({ children }) => {
     };
 
     fetchAllData();
-  }, []); // eslint-disable-line react-hooks/exhaustive-deps
+  }, [language]);
 
   const getDisplayedItems = useCallback((items, limitKey) => {
     const setting = data.displaySettings[limitKey];